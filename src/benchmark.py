@@ -0,0 +1,263 @@
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import timeit
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Sequence
+from src.engine.board import QuoridorBoard, Move
+from src.engine.bitboard import BitboardQuoridorBoard
+from src.ia.evaluations import bfs_shortest_path_len
+from src.ia.minimax import QuoridorIA
+from src.ia.moves_optimization import get_optimized_moves
+
+# Positions de référence : nombre de murs posés
+POSITIONS = {"opening": 0, "midgame": 8, "late": 18}
+# Représentations du plateau mesurées
+BOARDS = {"board": QuoridorBoard, "bitboard": BitboardQuoridorBoard}
+# Graine fixe : les positions sont identiques d'une exécution à l'autre
+SEED = 2024
+# Hausse relative du temps au-delà de laquelle une mesure est signalée comme régression
+DEFAULT_THRESHOLD = 0.15
+
+
+def position_moves(n_walls: int, seed: int = SEED) -> List[Move]:
+    """
+    Suite de coups reproductible menant à une position avec `n_walls` murs posés
+    (murs et déplacements aléatoires, sans jamais atteindre la ligne d'arrivée).
+
+    Args:
+        n_walls (int): Nombre de murs à poser (20 au plus).
+        seed (int): Graine du tirage.
+
+    Returns:
+        List[Move]: Les coups, à rejouer depuis la position initiale.
+    """
+    rng = random.Random(seed)
+    board = QuoridorBoard()
+    moves: List[Move] = []
+    while len(board.walls) < n_walls:
+        player = board.turn
+        move = ("WALL", (rng.randrange(8), rng.randrange(8), rng.choice('HV')))
+        if rng.random() < 0.4 or board.apply_move(move) is None:
+            goal = 8 if player == 1 else 0
+            pawn_moves = [pos for pos in board.get_legal_pawn_moves(player) if pos[1] != goal]
+            move = ("MOVE", rng.choice(pawn_moves))
+            board.apply_move(move)
+        moves.append(move)
+    return moves
+
+
+def make_position(name: str, board_cls: type = QuoridorBoard) -> QuoridorBoard:
+    """
+    Construit une position de référence.
+
+    Args:
+        name (str): Clé de POSITIONS ("opening", "midgame" ou "late").
+        board_cls (type): La représentation du plateau.
+
+    Returns:
+        QuoridorBoard: Le plateau.
+    """
+    board = board_cls()
+    for move in position_moves(POSITIONS[name]):
+        board.apply_move(move)
+    return board
+
+
+def time_call(func: Callable, repeat: int = 5) -> float:
+    """
+    Temps d'un appel en microsecondes : meilleur de `repeat` séries, chaque série étant
+    assez longue (timeit.autorange) pour que l'horloge soit précise.
+
+    Args:
+        func (Callable): Fonction sans argument.
+        repeat (int): Nombre de séries.
+
+    Returns:
+        float: Microsecondes par appel.
+    """
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat, number)) / number * 1e6
+
+
+def time_search(board: QuoridorBoard, depth: int, repeat: int = 3) -> float:
+    """
+    Temps de QuoridorIA.get_best_move en microsecondes (meilleur de `repeat` recherches,
+    chacune avec une IA neuve : table de transposition vide).
+
+    Args:
+        board (QuoridorBoard): La position (c'est au joueur qui a le trait de jouer).
+        depth (int): Profondeur de recherche.
+        repeat (int): Nombre de recherches.
+
+    Returns:
+        float: Microsecondes par recherche.
+    """
+    best = float("inf")
+    player = board.turn
+    for _ in range(repeat):
+        ia = QuoridorIA(player, depth, "advanced")
+        start = time.perf_counter()
+        ia.get_best_move(board)
+        best = min(best, time.perf_counter() - start)
+    return best * 1e6
+
+
+def benchmark_position(board: QuoridorBoard, depths: Sequence[int], repeat: int = 5) -> Dict[str, float]:
+    """
+    Mesure les opérations critiques du moteur et de la recherche sur une position.
+
+    Args:
+        board (QuoridorBoard): La position (rendue intacte).
+        depths (Sequence[int]): Profondeurs de recherche mesurées.
+        repeat (int): Nombre de séries par mesure.
+
+    Returns:
+        Dict[str, float]: Microsecondes par appel, par opération.
+    """
+    player = board.turn
+    walls = board.legal_wall_anchors()
+
+    def place_walls() -> None:
+        # Pose puis retire chaque mur physiquement posable (refus compris)
+        for wall in walls:
+            token = board.apply_move(("WALL", wall), player)
+            if token is not None:
+                board.undo_move(token)
+
+    results = {
+        "get_legal_pawn_moves": time_call(lambda: board.get_legal_pawn_moves(player), repeat),
+        "place_wall": time_call(place_walls, repeat) / max(len(walls), 1),
+        "is_path_available": time_call(lambda: board.is_path_available(player), repeat),
+        "bfs_shortest_path_len": time_call(lambda: bfs_shortest_path_len(board, player), repeat),
+        "get_optimized_moves": time_call(lambda: get_optimized_moves(board, player), repeat),
+        "copy": time_call(board.copy, repeat),
+    }
+    for depth in depths:
+        results[f"get_best_move_d{depth}"] = time_search(board, depth)
+    return results
+
+
+def run_benchmarks(depths: Sequence[int] = (1, 2, 3), boards: Sequence[str] = tuple(BOARDS),
+                   repeat: int = 5, verbose: bool = False) -> Dict:
+    """
+    Lance la suite complète : chaque représentation, chaque position de référence.
+
+    Args:
+        depths (Sequence[int]): Profondeurs de recherche mesurées.
+        boards (Sequence[str]): Représentations mesurées (clés de BOARDS).
+        repeat (int): Nombre de séries par mesure.
+        verbose (bool): Affiche chaque mesure.
+
+    Returns:
+        Dict: {"meta": ..., "positions": hash par position, "results": µs par "plateau/position/opération"}.
+    """
+    report = {
+        "meta": {
+            "date": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "repeat": repeat,
+        },
+        "positions": {},
+        "results": {},
+    }
+    for board_name in boards:
+        for position in POSITIONS:
+            board = make_position(position, BOARDS[board_name])
+            # Le hash identifie la position : deux rapports ne sont comparables que s'il est identique
+            report["positions"][position] = board.zobrist
+            for operation, micros in benchmark_position(board, depths, repeat).items():
+                key = f"{board_name}/{position}/{operation}"
+                report["results"][key] = round(micros, 3)
+                if verbose:
+                    print(f"   {key:<45} {micros:>14.2f} µs")
+    return report
+
+
+def save_results(report: Dict, path: str) -> None:
+    """Écrit un rapport de run_benchmarks au format JSON."""
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+
+
+def load_results(path: str) -> Dict:
+    """Lit un rapport écrit par save_results."""
+    with open(path) as f:
+        return json.load(f)
+
+
+def compare_results(baseline: Dict, current: Dict, threshold: float = DEFAULT_THRESHOLD) -> List[Dict]:
+    """
+    Compare deux rapports mesure par mesure (seules les mesures communes sont comparées).
+
+    Args:
+        baseline (Dict): Rapport de référence.
+        current (Dict): Nouveau rapport.
+        threshold (float): Hausse relative tolérée (0.15 = 15 % plus lent).
+
+    Returns:
+        List[Dict]: Une ligne par mesure : name, baseline, current, ratio (current / baseline)
+                    et regression (True si le ratio dépasse 1 + threshold).
+
+    Raises:
+        ValueError: Si les positions de référence diffèrent (rapports non comparables).
+    """
+    for position, key in current["positions"].items():
+        if baseline["positions"].get(position, key) != key:
+            raise ValueError(f"Position '{position}' différente entre les deux rapports")
+    rows = []
+    for name, micros in current["results"].items():
+        old = baseline["results"].get(name)
+        if old is None:
+            continue
+        ratio = micros / old if old else 1.0
+        rows.append({"name": name, "baseline": old, "current": micros, "ratio": round(ratio, 3),
+                     "regression": ratio > 1 + threshold})
+    return rows
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Point d'entrée : python -m src.benchmark [-o rapport.json] [--compare reference.json]
+
+    Returns:
+        int: 1 si une régression a été détectée, 0 sinon.
+    """
+    parser = argparse.ArgumentParser(description="Benchmarks du moteur et de la recherche.")
+    parser.add_argument("-o", "--output", help="Fichier JSON où écrire les mesures.")
+    parser.add_argument("--compare", help="Rapport JSON de référence : signale les régressions.")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Hausse relative tolérée avant de signaler une régression.")
+    parser.add_argument("--depths", type=int, nargs="*", default=[1, 2, 3],
+                        help="Profondeurs de get_best_move mesurées.")
+    parser.add_argument("--boards", nargs="*", default=list(BOARDS), choices=list(BOARDS),
+                        help="Représentations du plateau mesurées.")
+    parser.add_argument("--repeat", type=int, default=5, help="Nombre de séries par mesure.")
+    args = parser.parse_args(argv)
+
+    print("⏱️ Benchmarks du moteur")
+    report = run_benchmarks(args.depths, args.boards, args.repeat, verbose=True)
+    if args.output:
+        save_results(report, args.output)
+        print(f"📁 Mesures sauvegardées dans {args.output}")
+
+    if not args.compare:
+        return 0
+    rows = compare_results(load_results(args.compare), report, args.threshold)
+    print(f"\n📊 Comparaison avec {args.compare} (seuil +{args.threshold:.0%})")
+    for row in rows:
+        flag = "⚠️ RÉGRESSION" if row["regression"] else ""
+        print(f"   {row['name']:<45} {row['baseline']:>12.2f} -> {row['current']:>12.2f} µs"
+              f"  x{row['ratio']:<6} {flag}")
+    regressions = sum(row["regression"] for row in rows)
+    print(f"{regressions} régression(s) sur {len(rows)} mesures")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
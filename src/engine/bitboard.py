@@ -0,0 +1,554 @@
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from collections.abc import MutableMapping, MutableSet
+from src.engine import zobrist
+from src.engine.board import QuoridorBoard, STATE_FORMAT, decode_state
+
+# --- GÉOMÉTRIE DU PLATEAU ---
+# Une case (x, y) correspond au bit y * 9 + x (81 bits).
+# Un point d'ancrage de mur (x, y) correspond au bit y * 8 + x (64 bits).
+SIZE = 9
+WALL_SPAN = SIZE - 1
+
+ALL_CELLS = (1 << (SIZE * SIZE)) - 1
+ROW_0 = (1 << SIZE) - 1
+ROW_8 = ROW_0 << (SIZE * (SIZE - 1))
+COL_0 = sum(1 << (y * SIZE) for y in range(SIZE))
+COL_8 = COL_0 << (SIZE - 1)
+
+ANCHOR_COL_0 = sum(1 << (y * WALL_SPAN) for y in range(WALL_SPAN))
+ANCHOR_COL_7 = ANCHOR_COL_0 << (WALL_SPAN - 1)
+ALL_ANCHORS = (1 << (WALL_SPAN * WALL_SPAN)) - 1
+
+CELL_COORDS: List[Tuple[int, int]] = [(c % SIZE, c // SIZE) for c in range(SIZE * SIZE)]
+ANCHOR_COORDS: List[Tuple[int, int]] = [(a % WALL_SPAN, a // WALL_SPAN) for a in range(WALL_SPAN * WALL_SPAN)]
+GOAL_ROWS: Dict[int, int] = {1: ROW_8, 2: ROW_0}
+
+# Ordre des directions identique à QuoridorBoard : bas, haut, gauche, droite
+DIRECTIONS: List[Tuple[int, int]] = [(0, 1), (0, -1), (-1, 0), (1, 0)]
+DIRECTION_DELTAS: List[int] = [SIZE, -SIZE, -1, 1]
+# Directions latérales testées lors d'un saut diagonal (indices dans DIRECTIONS)
+SIDE_DIRECTIONS: List[Tuple[int, int]] = [(2, 3), (2, 3), (1, 0), (1, 0)]
+
+
+def _anchor_bit(x: int, y: int) -> int:
+    """Retourne le bit d'un point d'ancrage, ou 0 s'il est hors de la grille 8x8."""
+    if 0 <= x < WALL_SPAN and 0 <= y < WALL_SPAN:
+        return 1 << (y * WALL_SPAN + x)
+    return 0
+
+
+# Coins de la grille (10x10, bit j * 10 + i) : un mur relie trois coins alignés.
+POST_SPAN = SIZE + 1
+BORDER_POSTS = sum(1 << (j * POST_SPAN + i) for j in range(POST_SPAN) for i in range(POST_SPAN)
+                   if i in (0, SIZE) or j in (0, SIZE))
+
+
+def _wall_posts(x: int, y: int, orientation: str) -> int:
+    """Masque des trois coins touchés par un mur (extrémités et milieu)."""
+    if orientation == 'H':
+        return 0b111 << ((y + 1) * POST_SPAN + x)
+    return sum(1 << ((y + k) * POST_SPAN + x + 1) for k in range(3))
+
+
+WALL_POSTS: Dict[str, List[int]] = {
+    o: [_wall_posts(x, y, o) for x, y in ((a % WALL_SPAN, a // WALL_SPAN) for a in range(WALL_SPAN * WALL_SPAN))]
+    for o in 'HV'
+}
+
+# Masques précalculés, par case, des ancrages capables de bloquer une arête :
+# H_BLOCK[c] : murs 'H' séparant (x, y) de (x, y + 1)
+# V_BLOCK[c] : murs 'V' séparant (x, y) de (x + 1, y)
+H_BLOCK: List[int] = [_anchor_bit(x, y) | _anchor_bit(x - 1, y) for x, y in CELL_COORDS]
+V_BLOCK: List[int] = [_anchor_bit(x, y) | _anchor_bit(x, y - 1) for x, y in CELL_COORDS]
+
+
+class _PawnPositions(MutableMapping):
+    """
+    Vue dictionnaire {player_id: (x, y)} sur les bits des pions du plateau.
+    Toute écriture est répercutée directement dans les masques.
+    """
+
+    def __init__(self, board: 'BitboardQuoridorBoard') -> None:
+        self._board = board
+
+    def __getitem__(self, player_id: int) -> Tuple[int, int]:
+        return CELL_COORDS[self._board._pawns[player_id].bit_length() - 1]
+
+    def __setitem__(self, player_id: int, pos: Tuple[int, int]) -> None:
+        if player_id not in (1, 2):
+            raise KeyError(player_id)
+        x, y = pos
+        self._board._pawns[player_id] = 1 << (y * SIZE + x)
+
+    def __delitem__(self, player_id: int) -> None:
+        raise TypeError("Impossible de retirer un pion du plateau.")
+
+    def __iter__(self) -> Iterator[int]:
+        return iter((1, 2))
+
+    def __len__(self) -> int:
+        return 2
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+class _WallSet(MutableSet):
+    """
+    Vue ensembliste {(x, y, orientation)} sur les masques de murs du plateau.
+    """
+
+    def __init__(self, board: 'BitboardQuoridorBoard') -> None:
+        self._board = board
+
+    def __contains__(self, wall: object) -> bool:
+        try:
+            x, y, orientation = wall
+        except (TypeError, ValueError):
+            return False
+        bit = _anchor_bit(x, y)
+        if orientation == 'H':
+            return bool(self._board._h_walls & bit)
+        if orientation == 'V':
+            return bool(self._board._v_walls & bit)
+        return False
+
+    def __iter__(self) -> Iterator[Tuple[int, int, str]]:
+        for orientation, mask in (('H', self._board._h_walls), ('V', self._board._v_walls)):
+            while mask:
+                low = mask & -mask
+                a = low.bit_length() - 1
+                yield (a % WALL_SPAN, a // WALL_SPAN, orientation)
+                mask ^= low
+
+    def __len__(self) -> int:
+        return self._board._h_walls.bit_count() + self._board._v_walls.bit_count()
+
+    def add(self, wall: Tuple[int, int, str]) -> None:
+        x, y, orientation = wall
+        bit = _anchor_bit(x, y)
+        if not bit or orientation not in ('H', 'V'):
+            raise ValueError(f"Mur hors plateau : {wall}")
+        self._board._toggle_wall(bit, orientation, True)
+
+    def discard(self, wall: Tuple[int, int, str]) -> None:
+        if wall in self:
+            x, y, orientation = wall
+            self._board._toggle_wall(_anchor_bit(x, y), orientation, False)
+
+    def update(self, *others: Iterable[Tuple[int, int, str]]) -> None:
+        for walls in others:
+            for wall in walls:
+                self.add(wall)
+
+    def __repr__(self) -> str:
+        return repr(set(self))
+
+
+class BitboardQuoridorBoard(QuoridorBoard):
+    """
+    Variante compacte de QuoridorBoard : murs et pions stockés sous forme de masques
+    d'entiers. Les attributs `positions` et `walls` restent disponibles sous forme de
+    vues modifiables, l'API publique est donc identique.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialise un plateau 9x9 avec les positions de départ et les stocks de murs.
+        """
+        self.size: int = SIZE
+        self._pawns: Dict[int, int] = {1: 1 << 4, 2: 1 << (8 * SIZE + 4)}
+        self._h_walls: int = 0
+        self._v_walls: int = 0
+        self.walls_count: Dict[int, int] = {1: 10, 2: 10}
+        self.winner: Optional[int] = None
+        self.turn: int = 1
+        self.bfs_calls: int = 0
+        self.positions = _PawnPositions(self)
+        self.walls = _WallSet(self)
+        self._refresh_edges()
+        self.zobrist: int = self.compute_hash()
+
+    def copy(self) -> 'BitboardQuoridorBoard':
+        """
+        Crée une copie indépendante du plateau (les masques sont des entiers immuables).
+
+        Returns:
+            BitboardQuoridorBoard: Une nouvelle instance identique mais indépendante.
+        """
+        new = self.__class__.__new__(self.__class__)
+        new.__dict__.update(self.__dict__)
+        new._pawns = dict(self._pawns)
+        new.walls_count = dict(self.walls_count)
+        new.positions = _PawnPositions(new)
+        new.walls = _WallSet(new)
+        return new
+
+    @property
+    def walls(self) -> _WallSet:
+        """
+        Murs posés {(x, y, orientation)}, vue modifiable sur les masques du plateau.
+        """
+        return self._walls_view
+
+    @walls.setter
+    def walls(self, walls: Iterable[Tuple[int, int, str]]) -> None:
+        if isinstance(walls, _WallSet) and walls._board is self:
+            self._walls_view = walls
+            return
+        masks = {'H': 0, 'V': 0}
+        for x, y, orientation in walls:
+            bit = _anchor_bit(x, y)
+            if not bit or orientation not in masks:
+                raise ValueError(f"Mur hors plateau : {(x, y, orientation)}")
+            masks[orientation] |= bit
+        self._h_walls, self._v_walls = masks['H'], masks['V']
+        self._refresh_edges()
+
+    def to_bytes(self) -> bytes:
+        """
+        Encode l'état complet du plateau (même encodage que QuoridorBoard.to_bytes, les
+        masques de murs sont écrits tels quels).
+
+        Returns:
+            bytes: La position encodée.
+        """
+        return STATE_FORMAT.pack(self._h_walls, self._v_walls, self._pawns[1].bit_length() - 1,
+                                 self._pawns[2].bit_length() - 1, self.walls_count[1], self.walls_count[2],
+                                 self.winner or 0, self.turn)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'BitboardQuoridorBoard':
+        """
+        Reconstruit un plateau à partir de to_bytes (masques repris tels quels).
+
+        Args:
+            data (bytes): La position encodée.
+
+        Returns:
+            BitboardQuoridorBoard: Un nouveau plateau.
+
+        Raises:
+            ValueError: Si les données ne décrivent pas une position.
+        """
+        h, v, cell1, cell2, count1, count2, winner, turn = decode_state(data)
+        board = cls()
+        board._h_walls = h
+        board._v_walls = v
+        board._pawns = {1: 1 << cell1, 2: 1 << cell2}
+        board.walls_count = {1: count1, 2: count2}
+        board.winner = winner
+        board.turn = turn
+        board.rebuild_caches()
+        return board
+
+    def _toggle_wall(self, bit: int, orientation: str, present: bool) -> None:
+        """
+        Ajoute ou retire un mur des masques puis recalcule les arêtes ouvertes.
+        """
+        if orientation == 'H':
+            self._h_walls = self._h_walls | bit if present else self._h_walls & ~bit
+        else:
+            self._v_walls = self._v_walls | bit if present else self._v_walls & ~bit
+        self._refresh_edges()
+
+    def _compute_adjacency(self) -> None:
+        """
+        Pas de listes de voisins ici : les arêtes ouvertes sont les masques de _refresh_edges.
+        """
+
+    def _cell_neighbors(self, c: int) -> List[int]:
+        """
+        Voisins accessibles d'une case donnée par son index y * 9 + x.
+        """
+        return [ny * SIZE + nx for nx, ny in self.get_accessible_neighbors(c % SIZE, c // SIZE)]
+
+    def _compute_distances(self) -> None:
+        """
+        Pas de cartes de distance ici : la propagation par masques (_flood_distance)
+        est déjà plus rapide que leur mise à jour incrémentale.
+        """
+
+    def _compute_wall_blocks(self) -> None:
+        """
+        Les ancrages bloqués sont des masques recalculés par _refresh_edges à chaque mur.
+        """
+        self._refresh_edges()
+
+    def _add_wall(self, wall: Tuple[int, int, str], check_paths: bool = False) -> bool:
+        """
+        Ajoute un mur (masques uniquement). Avec check_paths, le mur est refusé s'il
+        enferme un joueur.
+
+        Returns:
+            bool: False si le mur a été refusé (plateau inchangé).
+        """
+        x, y, orientation = wall
+        bit = _anchor_bit(x, y)
+        self._toggle_wall(bit, orientation, True)
+        if check_paths and not (self.is_path_available(1) and self.is_path_available(2)):
+            self._toggle_wall(bit, orientation, False)
+            return False
+        return True
+
+    def _remove_wall(self, wall: Tuple[int, int, str]) -> None:
+        """Retire un mur (masques uniquement)."""
+        x, y, orientation = wall
+        self._toggle_wall(_anchor_bit(x, y), orientation, False)
+
+    def _refresh_edges(self) -> None:
+        """
+        Reconstruit les masques de cases pouvant se déplacer dans chaque direction.
+        """
+        south = 0
+        east = 0
+        posts = BORDER_POSTS
+        for y in range(WALL_SPAN):
+            h = (self._h_walls >> (y * WALL_SPAN)) & 0xFF
+            if h:
+                south |= (h | (h << 1)) << (y * SIZE)
+                posts |= (h | (h << 1) | (h << 2)) << ((y + 1) * POST_SPAN)
+            v = (self._v_walls >> (y * WALL_SPAN)) & 0xFF
+            if v:
+                east |= (v << (y * SIZE)) | (v << ((y + 1) * SIZE))
+                column = v << 1
+                posts |= (column << (y * POST_SPAN)) | (column << ((y + 1) * POST_SPAN)) \
+                    | (column << ((y + 2) * POST_SPAN))
+        # Coins déjà reliés à un obstacle (bord du plateau ou mur posé)
+        self._posts = posts
+        # Ancrages bloqués (même ancrage, croisement ou chevauchement), par orientation
+        h, v = self._h_walls, self._v_walls
+        self._blocked: Dict[str, int] = {
+            'H': h | v | ((h << 1) & ~ANCHOR_COL_0) | ((h >> 1) & ~ANCHOR_COL_7),
+            'V': h | v | ((v << WALL_SPAN) & ALL_ANCHORS) | (v >> WALL_SPAN),
+        }
+        # Même ordre que DIRECTIONS : bas, haut, gauche, droite
+        self._open: List[int] = [
+            ALL_CELLS & ~ROW_8 & ~south,
+            ALL_CELLS & ~ROW_0 & ~(south << SIZE),
+            ALL_CELLS & ~COL_0 & ~(east << 1),
+            ALL_CELLS & ~COL_8 & ~east,
+        ]
+
+    def _is_wall_placement_valid(self, new_wall: Tuple[int, int, str]) -> bool:
+        """
+        Vérifie si un mur peut être posé sans chevauchement ni intersection illégale.
+
+        Args:
+            new_wall (Tuple[int, int, str]): Le mur à tester (x, y, orientation).
+
+        Returns:
+            bool: True si le placement est valide physiquement, False sinon.
+        """
+        x, y, orientation = new_wall
+        bit = _anchor_bit(x, y)
+        return bool(bit) and not self._blocked[orientation] & bit
+
+    def legal_wall_anchors(self) -> List[Tuple[int, int, str]]:
+        """
+        Retourne tous les murs physiquement posables (sans chevauchement ni croisement).
+        Le maintien d'un chemin vers l'arrivée n'est pas vérifié ici (voir place_wall).
+
+        Returns:
+            List[Tuple[int, int, str]]: Les murs (x, y, orientation) libres.
+        """
+        walls = []
+        for orientation in 'HV':
+            free = ALL_ANCHORS & ~self._blocked[orientation]
+            while free:
+                low = free & -free
+                walls.append(ANCHOR_COORDS[low.bit_length() - 1] + (orientation,))
+                free ^= low
+        return walls
+
+    def place_wall(self, player_id: int, x: int, y: int, orientation: str) -> bool:
+        """
+        Tente de poser un mur sur le plateau.
+
+        Args:
+            player_id (int): L'identifiant du joueur posant le mur.
+            x (int): Coordonnée X du point d'ancrage (0-7).
+            y (int): Coordonnée Y du point d'ancrage (0-7).
+            orientation (str): 'H' pour horizontal, 'V' pour vertical.
+
+        Returns:
+            bool: True si le mur a été posé, False si le coup est invalide.
+        """
+        if self.winner is not None or self.walls_count[player_id] <= 0:
+            return False
+        if orientation not in ('H', 'V') or not self._is_wall_placement_valid((x, y, orientation)):
+            return False
+
+        bit = _anchor_bit(x, y)
+        # Un mur qui ne touche les obstacles existants qu'en un coin au plus ne ferme aucune
+        # zone : il ne peut isoler personne, les deux propagations sont alors inutiles.
+        touching = WALL_POSTS[orientation][y * WALL_SPAN + x] & self._posts
+        self._toggle_wall(bit, orientation, True)
+        if touching & (touching - 1) and not (self.is_path_available(1) and self.is_path_available(2)):
+            self._toggle_wall(bit, orientation, False)
+            return False
+
+        count = self.walls_count[player_id]
+        self.zobrist ^= (zobrist.WALL_KEYS[(x, y, orientation)] ^ zobrist.WALLS_COUNT_KEYS[player_id][count]
+                         ^ zobrist.WALLS_COUNT_KEYS[player_id][count - 1])
+        self.walls_count[player_id] = count - 1
+        self._end_turn(player_id)
+        return True
+
+    def get_legal_pawn_moves(self, player_id: int) -> List[Tuple[int, int]]:
+        """
+        Calcule les déplacements possibles, incluant les sauts.
+
+        Args:
+            player_id (int): ID du joueur.
+
+        Returns:
+            List[Tuple[int, int]]: Liste des positions (x, y) légales.
+        """
+        bit = self._pawns[player_id]
+        opp_bit = self._pawns[3 - player_id]
+        open_masks = self._open
+        moves: List[int] = []
+
+        for d, delta in enumerate(DIRECTION_DELTAS):
+            if not bit & open_masks[d]:
+                continue
+            nbit = bit << delta if delta > 0 else bit >> -delta
+            if nbit != opp_bit:
+                moves.append(nbit)
+            elif nbit & open_masks[d]:
+                # Saut direct
+                moves.append(nbit << delta if delta > 0 else nbit >> -delta)
+            else:
+                # Sauts diagonaux
+                for side in SIDE_DIRECTIONS[d]:
+                    if nbit & open_masks[side]:
+                        side_delta = DIRECTION_DELTAS[side]
+                        moves.append(nbit << side_delta if side_delta > 0 else nbit >> -side_delta)
+        return [CELL_COORDS[m.bit_length() - 1] for m in moves]
+
+    def _flood_distance(self, player_id: int) -> int:
+        """
+        Propage simultanément toutes les cases atteignables (BFS par masques).
+
+        Args:
+            player_id (int): ID du joueur.
+
+        Returns:
+            int: Distance jusqu'à la ligne d'arrivée, -1 si elle est inaccessible.
+        """
+        self.bfs_calls += 1
+        south, north, west, east = self._open
+        goal = GOAL_ROWS[player_id]
+        frontier = reached = self._pawns[player_id]
+        dist = 0
+        while frontier:
+            if frontier & goal:
+                return dist
+            nxt = (((frontier & south) << SIZE) | ((frontier & north) >> SIZE)
+                   | ((frontier & west) >> 1) | ((frontier & east) << 1)) & ~reached
+            reached |= nxt
+            frontier = nxt
+            dist += 1
+        return -1
+
+    def is_path_available(self, player_id: int) -> bool:
+        """
+        Vérifie si un chemin existe vers la ligne d'arrivée.
+
+        Args:
+            player_id (int): ID du joueur.
+
+        Returns:
+            bool: True si un chemin est trouvé.
+        """
+        return self._flood_distance(player_id) >= 0
+
+    def shortest_path_len(self, player_id: int) -> int:
+        """
+        Calcule la longueur du plus court chemin vers la ligne d'arrivée.
+
+        Args:
+            player_id (int): ID du joueur.
+
+        Returns:
+            int: Nombre de déplacements, ou 100 si aucun chemin n'existe.
+        """
+        dist = self._flood_distance(player_id)
+        return dist if dist >= 0 else 100
+
+    def shortest_path(self, player_id: int) -> List[Tuple[int, int]]:
+        """
+        Un plus court chemin vers la ligne d'arrivée : propagation par masques depuis le pion,
+        puis remontée couche par couche depuis la première case d'arrivée atteinte.
+
+        Args:
+            player_id (int): ID du joueur.
+
+        Returns:
+            List[Tuple[int, int]]: Les cases du chemin, position du pion comprise
+                                   (vide si l'arrivée est inaccessible).
+        """
+        self.bfs_calls += 1
+        open_masks = self._open
+        south, north, west, east = open_masks
+        goal = GOAL_ROWS[player_id]
+        frontier = reached = self._pawns[player_id]
+        layers = []
+        while frontier and not frontier & goal:
+            layers.append(frontier)
+            nxt = (((frontier & south) << SIZE) | ((frontier & north) >> SIZE)
+                   | ((frontier & west) >> 1) | ((frontier & east) << 1)) & ~reached
+            reached |= nxt
+            frontier = nxt
+        if not frontier:
+            return []
+
+        hits = frontier & goal
+        bit = hits & -hits
+        path = [bit]
+        for layer in reversed(layers):
+            # Case voisine de la couche précédente depuis laquelle `bit` est accessible
+            for d, delta in enumerate(DIRECTION_DELTAS):
+                prev = bit >> delta if delta > 0 else bit << -delta
+                if prev & layer and prev & open_masks[d]:
+                    bit = prev
+                    break
+            path.append(bit)
+        return [CELL_COORDS[b.bit_length() - 1] for b in reversed(path)]
+
+    def get_accessible_neighbors(self, x: int, y: int) -> List[Tuple[int, int]]:
+        """
+        Retourne les cases adjacentes non bloquées par un mur.
+
+        Args:
+            x, y (int): Coordonnées de départ.
+
+        Returns:
+            List[Tuple[int, int]]: Liste des voisins.
+        """
+        c = y * SIZE + x
+        bit = 1 << c
+        return [CELL_COORDS[c + delta] for d, delta in enumerate(DIRECTION_DELTAS)
+                if bit & self._open[d]]
+
+    def is_wall_blocking(self, x1: int, y1: int, x2: int, y2: int) -> bool:
+        """
+        Vérifie si un mur sépare deux cases adjacentes.
+
+        Args:
+            x1, y1, x2, y2 (int): Coordonnées des deux cases.
+
+        Returns:
+            bool: True si bloqué.
+        """
+        if x1 == x2:
+            my = min(y1, y2)
+            if 0 <= x1 < SIZE and 0 <= my < SIZE:
+                return bool(self._h_walls & H_BLOCK[my * SIZE + x1])
+            return False
+        if y1 == y2:
+            mx = min(x1, x2)
+            if 0 <= mx < SIZE and 0 <= y1 < SIZE:
+                return bool(self._v_walls & V_BLOCK[y1 * SIZE + mx])
+        return False
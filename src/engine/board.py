@@ -1,6 +1,127 @@
-from typing import List, Tuple, Set, Dict, Optional
-from collections import deque
-import copy
+from typing import Iterable, Iterator, List, Tuple, Set, Dict, Optional, Union
+from collections.abc import MutableSet
+import struct
+from src.engine import zobrist
+from src.engine import distances
+
+# Un coup : ("MOVE", (x, y)) ou ("WALL", (x, y, orientation))
+Move = Tuple[str, Union[Tuple[int, int], Tuple[int, int, str]]]
+# Jeton d'annulation : (type, joueur, données, position précédente, vainqueur précédent,
+#                      trait précédent, hash précédent)
+MoveToken = Tuple[str, int, tuple, Tuple[int, int], Optional[int], int, int]
+
+
+def _blocked_anchors(x: int, y: int, orientation: str) -> List[Tuple[int, int, str]]:
+    """
+    Ancrages qu'un mur rend impossibles : même ancrage (quelle que soit l'orientation,
+    ce qui interdit aussi le croisement) et ancrages voisins dans son axe (chevauchement).
+    """
+    if orientation == 'H':
+        candidates = [(x, y, 'H'), (x, y, 'V'), (x - 1, y, 'H'), (x + 1, y, 'H')]
+    else:
+        candidates = [(x, y, 'V'), (x, y, 'H'), (x, y - 1, 'V'), (x, y + 1, 'V')]
+    return [(ax, ay, o) for ax, ay, o in candidates if 0 <= ax < 8 and 0 <= ay < 8]
+
+
+# Pour chaque mur, les ancrages qu'il bloque
+BLOCKED_ANCHORS: Dict[Tuple[int, int, str], List[Tuple[int, int, str]]] = {
+    (x, y, o): _blocked_anchors(x, y, o) for x in range(8) for y in range(8) for o in 'HV'
+}
+
+# Encodage binaire de taille fixe d'une position (voir to_bytes) : murs 'H' puis 'V' (un bit
+# par ancrage y * 8 + x), cases des deux pions (y * 9 + x), murs restants de chaque joueur,
+# vainqueur (0 = aucun) et joueur ayant le trait.
+STATE_FORMAT = struct.Struct("<QQ6B")
+STATE_SIZE = STATE_FORMAT.size
+
+
+def encode_state(positions: Dict[int, Tuple[int, int]], walls: Iterable[Tuple[int, int, str]],
+                 walls_count: Dict[int, int], winner: Optional[int], turn: int) -> bytes:
+    """
+    Encode une position sur STATE_SIZE octets.
+
+    Returns:
+        bytes: La position encodée.
+    """
+    masks = {'H': 0, 'V': 0}
+    for x, y, orientation in walls:
+        masks[orientation] |= 1 << (y * 8 + x)
+    (x1, y1), (x2, y2) = positions[1], positions[2]
+    return STATE_FORMAT.pack(masks['H'], masks['V'], y1 * 9 + x1, y2 * 9 + x2, walls_count[1], walls_count[2],
+                             winner or 0, turn)
+
+
+def decode_state(data: bytes) -> Tuple[int, int, int, int, int, int, Optional[int], int]:
+    """
+    Décode et vérifie une position encodée par encode_state.
+
+    Args:
+        data (bytes): La position encodée.
+
+    Returns:
+        Tuple: Masques des murs 'H' et 'V', cases des deux pions, murs restants des deux
+               joueurs, vainqueur et trait.
+
+    Raises:
+        ValueError: Si les données ne décrivent pas une position.
+    """
+    if len(data) != STATE_SIZE:
+        raise ValueError(f"Position encodée invalide : {len(data)} octets au lieu de {STATE_SIZE}")
+    h, v, cell1, cell2, count1, count2, winner, turn = STATE_FORMAT.unpack(data)
+    if cell1 >= 81 or cell2 >= 81 or cell1 == cell2 or count1 > 10 or count2 > 10 or winner > 2 \
+            or turn not in (1, 2) or h & v:
+        raise ValueError("Position encodée invalide")
+    return h, v, cell1, cell2, count1, count2, winner or None, turn
+
+
+def mask_walls(mask: int, orientation: str) -> List[Tuple[int, int, str]]:
+    """Murs d'une orientation à partir de leur masque d'ancrages (bit y * 8 + x)."""
+    walls = []
+    while mask:
+        low = mask & -mask
+        a = low.bit_length() - 1
+        walls.append((a % 8, a // 8, orientation))
+        mask ^= low
+    return walls
+
+
+class _WallSet(MutableSet):
+    """
+    Vue ensembliste sur les murs du plateau : un ajout ou un retrait direct passe par
+    _add_wall / _remove_wall et garde à jour voisins, distances et ancrages bloqués.
+    """
+
+    def __init__(self, board: 'QuoridorBoard') -> None:
+        self._board = board
+
+    def __contains__(self, wall: object) -> bool:
+        return wall in self._board._wall_set
+
+    def __iter__(self) -> Iterator[Tuple[int, int, str]]:
+        return iter(self._board._wall_set)
+
+    def __len__(self) -> int:
+        return len(self._board._wall_set)
+
+    def add(self, wall: Tuple[int, int, str]) -> None:
+        wall = tuple(wall)
+        if wall not in BLOCKED_ANCHORS:
+            raise ValueError(f"Mur hors plateau : {wall}")
+        if wall not in self._board._wall_set:
+            self._board._add_wall(wall)
+
+    def discard(self, wall: Tuple[int, int, str]) -> None:
+        if wall in self._board._wall_set:
+            self._board._remove_wall(wall)
+
+    def update(self, *others: Iterable[Tuple[int, int, str]]) -> None:
+        for walls in others:
+            for wall in walls:
+                self.add(wall)
+
+    def __repr__(self) -> str:
+        return repr(self._board._wall_set)
+
 
 class QuoridorBoard:
     """
@@ -14,44 +135,258 @@ class QuoridorBoard:
         self.size: int = 9
         # Joueur 1 (y=0) et Joueur 2 (y=8)
         self.positions: Dict[int, Tuple[int, int]] = {1: (4, 0), 2: (4, 8)}
-        self.walls: Set[Tuple[int, int, str]] = set()
+        # Murs posés ; `walls` en est une vue modifiable qui garde les caches à jour
+        self._wall_set: Set[Tuple[int, int, str]] = set()
+        self._walls_view = _WallSet(self)
         self.walls_count: Dict[int, int] = {1: 10, 2: 10}
         self.winner: Optional[int] = None
+        # Joueur ayant le trait (mis à jour après chaque coup réussi)
+        self.turn: int = 1
+        # Hash Zobrist de la position, tenu à jour par les méthodes de jeu
+        self.zobrist: int = self.compute_hash()
+        # Voisins accessibles de chaque case : les murs retirent et rendent leurs arêtes
+        self._adj: List[List[int]] = []
+        self._compute_adjacency()
+        # Cartes de distance à la ligne d'arrivée (par joueur), mises à jour à chaque mur
+        self._dist: Dict[int, List[int]] = {}
+        # Nombre de parcours en largeur effectués (complets ou incrémentaux), pour les statistiques
+        self.bfs_calls: int = 0
+        self._compute_distances()
+        # Nombre de murs posés bloquant chaque ancrage (0 = ancrage libre)
+        self._wall_blocks: Dict[Tuple[int, int, str], int] = {}
+        self._compute_wall_blocks()
+
+    @property
+    def walls(self) -> _WallSet:
+        """
+        Murs posés {(x, y, orientation)}. Ajouts et retraits directs tiennent à jour les
+        voisins, les distances et les ancrages bloqués (pas le hash, voir rebuild_caches).
+        """
+        return self._walls_view
+
+    @walls.setter
+    def walls(self, walls: Iterable[Tuple[int, int, str]]) -> None:
+        self._wall_set = set(walls)
+        self._walls_view = _WallSet(self)
+        self._compute_adjacency()
+        self._compute_distances()
+        self._compute_wall_blocks()
+
+    def compute_hash(self) -> int:
+        """
+        Recalcule entièrement le hash Zobrist (pions, murs, stocks et trait).
+        Utile après une modification directe de `positions` ou `walls`.
+
+        Returns:
+            int: Hash 64 bits de la position.
+        """
+        return zobrist.compute_hash(self.positions, self.walls, self.walls_count, self.turn)
+
+    def rebuild_caches(self) -> None:
+        """
+        Recalcule les données dérivées (hash, cartes de distance) à partir de l'état.
+        À appeler après avoir modifié directement `positions`, `walls` ou `walls_count`.
+        """
+        self.zobrist = self.compute_hash()
+        self._compute_adjacency()
+        self._compute_distances()
+        self._compute_wall_blocks()
+
+    def _compute_adjacency(self) -> None:
+        """
+        Recalcule entièrement les listes de voisins accessibles à partir de `walls`.
+        """
+        self._adj = [list(neighbors) for neighbors in distances.GRID_NEIGHBORS]
+        for wall in self._wall_set:
+            self._cut_edges(distances.wall_edges(wall))
+
+    def _cut_edges(self, edges: List[Tuple[int, int]]) -> None:
+        """
+        Retire des arêtes des listes de voisins (pose d'un mur).
+        """
+        adj = self._adj
+        for a, b in edges:
+            if b in adj[a]:
+                adj[a].remove(b)
+                adj[b].remove(a)
+
+    def _restore_edges(self, edges: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """
+        Rend des arêtes aux listes de voisins (retrait d'un mur), à leur place d'origine :
+        l'ordre des voisins, donc le plus court chemin choisi, ne dépend pas de l'historique.
+        Une arête encore coupée par un autre mur (murs chevauchants ajoutés via `walls`)
+        reste retirée.
+
+        Returns:
+            List[Tuple[int, int]]: Les arêtes effectivement rendues.
+        """
+        adj = self._adj
+        restored = []
+        for a, b in edges:
+            if b in adj[a] or self.is_wall_blocking(a % 9, a // 9, b % 9, b // 9):
+                continue
+            for c, n in ((a, b), (b, a)):
+                adj[c].append(n)
+                adj[c].sort(key=distances.GRID_NEIGHBORS[c].index)
+            restored.append((a, b))
+        return restored
+
+    def _compute_distances(self) -> None:
+        """
+        Calcule entièrement les cartes de distance des deux joueurs (BFS depuis l'arrivée).
+        """
+        for pid in (1, 2):
+            self._dist[pid] = distances.compute_distance_map(self._cell_neighbors, pid)
+        self.bfs_calls += 2
+
+    def _compute_wall_blocks(self) -> None:
+        """
+        Recalcule entièrement l'index des ancrages bloqués à partir de `walls`.
+        """
+        self._wall_blocks = dict.fromkeys(BLOCKED_ANCHORS, 0)
+        for wall in self._wall_set:
+            for anchor in BLOCKED_ANCHORS[wall]:
+                self._wall_blocks[anchor] += 1
+
+    def _cell_neighbors(self, c: int) -> List[int]:
+        """
+        Voisins accessibles d'une case donnée par son index y * 9 + x.
+        La liste est celle du plateau, modifiée à chaque mur : ne pas la modifier ni la conserver.
+        """
+        return self._adj[c]
+
+    def _add_wall(self, wall: Tuple[int, int, str], check_paths: bool = False) -> bool:
+        """
+        Ajoute un mur et met à jour les distances des seules cases touchées.
+
+        Avec check_paths, le mur est refusé s'il enferme un joueur. Une recherche guidée vers
+        l'arrivée n'est lancée que si le mur coupe un plus court chemin de ce joueur : les
+        cartes de distance ne sont alors mises à jour que pour un mur légal.
+
+        Returns:
+            bool: False si le mur a été refusé (plateau inchangé).
+        """
+        edges = distances.wall_edges(wall)
+        self._cut_edges(edges)
+        if check_paths:
+            for pid in (1, 2):
+                if not distances.cuts_shortest_path(self._dist[pid], edges):
+                    continue
+                x, y = self.positions[pid]
+                self.bfs_calls += 1
+                if not distances.goal_reachable(self._cell_neighbors, y * 9 + x, pid):
+                    self._restore_edges(edges)
+                    return False
+        self._wall_set.add(wall)
+        for anchor in BLOCKED_ANCHORS[wall]:
+            self._wall_blocks[anchor] += 1
+        for pid in (1, 2):
+            distances.update_after_block(self._cell_neighbors, self._dist[pid], edges)
+        self.bfs_calls += 2
+        return True
+
+    def _remove_wall(self, wall: Tuple[int, int, str]) -> None:
+        """
+        Retire un mur et met à jour les distances des seules cases touchées.
+        """
+        self._wall_set.remove(wall)
+        for anchor in BLOCKED_ANCHORS[wall]:
+            self._wall_blocks[anchor] -= 1
+        edges = self._restore_edges(distances.wall_edges(wall))
+        for pid in (1, 2):
+            distances.update_after_unblock(self._cell_neighbors, self._dist[pid], edges)
+        self.bfs_calls += 2
+
+    def _end_turn(self, player_id: int) -> None:
+        """
+        Donne le trait à l'adversaire du joueur qui vient de jouer.
+        """
+        if self.turn == player_id:
+            self.zobrist ^= zobrist.TURN_KEY
+        self.turn = 3 - player_id
 
     def copy(self) -> 'QuoridorBoard':
         """
-        Crée une copie profonde de l'état actuel du plateau.
+        Crée une copie indépendante de l'état actuel du plateau (caches dérivés compris).
 
         Returns:
             QuoridorBoard: Une nouvelle instance identique mais indépendante.
         """
-        return copy.deepcopy(self)
+        new = self.__class__.__new__(self.__class__)
+        new.__dict__.update(self.__dict__)
+        new.positions = dict(self.positions)
+        new._wall_set = set(self._wall_set)
+        new._walls_view = _WallSet(new)
+        new.walls_count = dict(self.walls_count)
+        # Caches copiés entrée par entrée : bien moins coûteux qu'une copie profonde
+        new._adj = [list(neighbors) for neighbors in self._adj]
+        new._dist = {pid: list(dist) for pid, dist in self._dist.items()}
+        new._wall_blocks = dict(self._wall_blocks)
+        return new
+
+    def to_bytes(self) -> bytes:
+        """
+        Encode l'état complet du plateau (pions, murs, stocks, vainqueur, trait) sur
+        STATE_SIZE octets, identiques pour toutes les représentations : à envoyer à un
+        processus, à utiliser comme clé de cache ou à écrire sur disque.
+
+        Returns:
+            bytes: La position encodée.
+        """
+        return encode_state(self.positions, self._wall_set, self.walls_count, self.winner, self.turn)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'QuoridorBoard':
+        """
+        Reconstruit un plateau à partir de to_bytes (caches dérivés recalculés).
+
+        Args:
+            data (bytes): La position encodée.
+
+        Returns:
+            QuoridorBoard: Un nouveau plateau.
+
+        Raises:
+            ValueError: Si les données ne décrivent pas une position.
+        """
+        h, v, cell1, cell2, count1, count2, winner, turn = decode_state(data)
+        # Pas d'appel à __init__ : ses caches seraient aussitôt recalculés
+        board = cls.__new__(cls)
+        board.size = 9
+        board.positions = {1: (cell1 % 9, cell1 // 9), 2: (cell2 % 9, cell2 // 9)}
+        board._wall_set = set(mask_walls(h, 'H') + mask_walls(v, 'V'))
+        board._walls_view = _WallSet(board)
+        board.walls_count = {1: count1, 2: count2}
+        board.winner = winner
+        board.turn = turn
+        board.bfs_calls = 0
+        board._dist = {}
+        board.rebuild_caches()
+        return board
 
     def _is_wall_placement_valid(self, new_wall: Tuple[int, int, str]) -> bool:
         """
         Vérifie si un mur peut être posé sans chevauchement ni intersection illégale.
 
+        Simple lecture de l'index des ancrages bloqués, tenu à jour à chaque mur posé ou retiré.
+
         Args:
             new_wall (Tuple[int, int, str]): Le mur à tester (x, y, orientation).
 
         Returns:
             bool: True si le placement est valide physiquement, False sinon.
         """
-        nx, ny, no = new_wall
-        for wx, wy, wo in self.walls:
-            # Même point d'ancrage
-            if nx == wx and ny == wy:
-                return False
-            # Chevauchement horizontal
-            if no == 'H' and wo == 'H' and abs(nx - wx) < 2 and ny == wy:
-                return False
-            # Chevauchement vertical
-            if no == 'V' and wo == 'V' and nx == wx and abs(ny - wy) < 2:
-                return False
-            # Intersection en croix (ne peut pas couper un mur perpendiculaire au centre)
-            if no != wo and nx == wx and ny == wy:
-                return False
-        return True
+        return self._wall_blocks.get(new_wall, 1) == 0
+
+    def legal_wall_anchors(self) -> List[Tuple[int, int, str]]:
+        """
+        Retourne tous les murs physiquement posables (sans chevauchement ni croisement).
+        Le maintien d'un chemin vers l'arrivée n'est pas vérifié ici (voir place_wall).
+
+        Returns:
+            List[Tuple[int, int, str]]: Les murs (x, y, orientation) libres.
+        """
+        return [wall for wall, count in self._wall_blocks.items() if count == 0]
 
     def place_wall(self, player_id: int, x: int, y: int, orientation: str) -> bool:
         """
@@ -77,13 +412,15 @@ class QuoridorBoard:
         if not self._is_wall_placement_valid(new_wall):
             return False
 
-        # Ajout temporaire pour vérifier l'accessibilité via BFS
-        self.walls.add(new_wall)
-        if not (self.is_path_available(1) and self.is_path_available(2)):
-            self.walls.remove(new_wall)
+        # Le mur n'est posé que s'il laisse un chemin aux deux joueurs
+        if not self._add_wall(new_wall, check_paths=True):
             return False
 
-        self.walls_count[player_id] -= 1
+        count = self.walls_count[player_id]
+        self.zobrist ^= (zobrist.WALL_KEYS[new_wall] ^ zobrist.WALLS_COUNT_KEYS[player_id][count]
+                         ^ zobrist.WALLS_COUNT_KEYS[player_id][count - 1])
+        self.walls_count[player_id] = count - 1
+        self._end_turn(player_id)
         return True
 
     def move_pawn(self, player_id: int, new_pos: Tuple[int, int]) -> bool:
@@ -103,13 +440,57 @@ class QuoridorBoard:
         if new_pos not in self.get_legal_pawn_moves(player_id):
             return False
 
+        self.zobrist ^= zobrist.pawn_key(player_id, self.positions[player_id]) ^ zobrist.pawn_key(player_id, new_pos)
         self.positions[player_id] = new_pos
+        self._end_turn(player_id)
 
         # Vérification de la condition de victoire [cite: 38]
         if (player_id == 1 and new_pos[1] == 8) or (player_id == 2 and new_pos[1] == 0):
             self.winner = player_id
         return True
 
+    def apply_move(self, move: Move, player_id: Optional[int] = None) -> Optional[MoveToken]:
+        """
+        Joue un coup directement sur ce plateau (sans copie), de façon réversible.
+
+        Args:
+            move (Move): Le coup à jouer, ex: ("MOVE", (4, 1)) ou ("WALL", (4, 4, 'H')).
+            player_id (Optional[int]): Joueur qui joue le coup (par défaut celui qui a le trait).
+
+        Returns:
+            Optional[MoveToken]: Jeton à passer à undo_move, ou None si le coup est illégal
+                                 (le plateau n'est alors pas modifié).
+        """
+        if player_id is None:
+            player_id = self.turn
+        move_type, data = move
+        token = (move_type, player_id, data, self.positions[player_id], self.winner, self.turn,
+                 self.zobrist)
+
+        if move_type == "MOVE":
+            played = self.move_pawn(player_id, data)
+        else:
+            played = self.place_wall(player_id, *data)
+        return token if played else None
+
+    def undo_move(self, token: MoveToken) -> None:
+        """
+        Annule exactement un coup joué avec apply_move (y compris vainqueur et stock de murs).
+        Les coups doivent être annulés dans l'ordre inverse où ils ont été joués.
+
+        Args:
+            token (MoveToken): Le jeton renvoyé par apply_move.
+        """
+        move_type, player_id, data, previous_pos, previous_winner, previous_turn, previous_hash = token
+        if move_type == "MOVE":
+            self.positions[player_id] = previous_pos
+        else:
+            self._remove_wall(tuple(data))
+            self.walls_count[player_id] += 1
+        self.winner = previous_winner
+        self.turn = previous_turn
+        self.zobrist = previous_hash
+
     def get_legal_pawn_moves(self, player_id: int) -> List[Tuple[int, int]]:
         """
         Calcule les déplacements possibles, incluant les sauts.
@@ -146,9 +527,35 @@ class QuoridorBoard:
                 moves.append((nx, ny))
         return moves
 
+    def get_legal_moves(self, player_id: Optional[int] = None) -> List[Move]:
+        """
+        Énumère tous les coups légaux : déplacements (sauts compris) et chaque mur posable
+        qui laisse un chemin aux deux joueurs. Contrairement à get_optimized_moves, aucun
+        mur n'est écarté : c'est la référence pour vérifier le moteur (voir perft).
+
+        Args:
+            player_id (Optional[int]): Joueur qui joue (par défaut celui qui a le trait).
+
+        Returns:
+            List[Move]: Les coups légaux (aucun si la partie est terminée).
+        """
+        if player_id is None:
+            player_id = self.turn
+        if self.winner is not None:
+            return []
+        moves: List[Move] = [("MOVE", pos) for pos in self.get_legal_pawn_moves(player_id)]
+        if self.walls_count[player_id] > 0:
+            for wall in self.legal_wall_anchors():
+                # Le mur est posé puis retiré : place_wall vérifie les chemins
+                token = self.apply_move(("WALL", wall), player_id)
+                if token is not None:
+                    self.undo_move(token)
+                    moves.append(("WALL", wall))
+        return moves
+
     def is_path_available(self, player_id: int) -> bool:
         """
-        Vérifie si un chemin existe vers la ligne d'arrivée (BFS).
+        Vérifie si un chemin existe vers la ligne d'arrivée (lecture de la carte de distance).
 
         Args:
             player_id (int): ID du joueur.
@@ -156,18 +563,44 @@ class QuoridorBoard:
         Returns:
             bool: True si un chemin est trouvé.
         """
-        start = self.positions[player_id]
-        target_y = 8 if player_id == 1 else 0
-        queue = deque([start])
-        visited = {start}
-        while queue:
-            cx, cy = queue.popleft()
-            if cy == target_y: return True
-            for next_pos in self.get_accessible_neighbors(cx, cy):
-                if next_pos not in visited:
-                    visited.add(next_pos)
-                    queue.append(next_pos)
-        return False
+        x, y = self.positions[player_id]
+        return self._dist[player_id][y * 9 + x] < distances.UNREACHABLE
+
+    def shortest_path_len(self, player_id: int) -> int:
+        """
+        Longueur du plus court chemin vers la ligne d'arrivée (lecture de la carte de distance).
+
+        Args:
+            player_id (int): ID du joueur.
+
+        Returns:
+            int: Nombre de déplacements, ou 100 si aucun chemin n'existe.
+        """
+        x, y = self.positions[player_id]
+        dist = self._dist[player_id][y * 9 + x]
+        return dist if dist < distances.UNREACHABLE else 100
+
+    def shortest_path(self, player_id: int) -> List[Tuple[int, int]]:
+        """
+        Un plus court chemin vers la ligne d'arrivée (descente de la carte de distance).
+
+        Args:
+            player_id (int): ID du joueur.
+
+        Returns:
+            List[Tuple[int, int]]: Les cases du chemin, position du pion comprise
+                                   (vide si l'arrivée est inaccessible).
+        """
+        dist = self._dist[player_id]
+        x, y = self.positions[player_id]
+        c = y * 9 + x
+        if dist[c] >= distances.UNREACHABLE:
+            return []
+        path = [(x, y)]
+        while dist[c]:
+            c = next(n for n in self._cell_neighbors(c) if dist[n] == dist[c] - 1)
+            path.append((c % 9, c // 9))
+        return path
 
     def get_accessible_neighbors(self, x: int, y: int) -> List[Tuple[int, int]]:
         """
@@ -179,13 +612,7 @@ class QuoridorBoard:
         Returns:
             List[Tuple[int, int]]: Liste des voisins.
         """
-        neighbors = []
-        for dx, dy in [(0, 1), (0, -1), (-1, 0), (1, 0)]:
-            nx, ny = x + dx, y + dy
-            if 0 <= nx < self.size and 0 <= ny < self.size:
-                if not self.is_wall_blocking(x, y, nx, ny):
-                    neighbors.append((nx, ny))
-        return neighbors
+        return [(n % 9, n // 9) for n in self._adj[y * 9 + x]]
 
     def is_wall_blocking(self, x1: int, y1: int, x2: int, y2: int) -> bool:
         """
@@ -199,8 +626,8 @@ class QuoridorBoard:
         """
         if x1 == x2:
             my = min(y1, y2)
-            return (x1, my, 'H') in self.walls or (x1 - 1, my, 'H') in self.walls
+            return (x1, my, 'H') in self._wall_set or (x1 - 1, my, 'H') in self._wall_set
         if y1 == y2:
             mx = min(x1, x2)
-            return (mx, y1, 'V') in self.walls or (mx, y1 - 1, 'V') in self.walls
+            return (mx, y1, 'V') in self._wall_set or (mx, y1 - 1, 'V') in self._wall_set
         return False
\ No newline at end of file
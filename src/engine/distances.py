@@ -0,0 +1,202 @@
+import heapq
+from collections import deque
+from typing import Callable, List, Tuple
+
+# Distance attribuée aux cases d'où la ligne d'arrivée est inaccessible
+UNREACHABLE = 10_000
+
+# Fonction donnant les cases voisines accessibles d'une case (index y * 9 + x)
+Neighbors = Callable[[int], List[int]]
+
+# Voisins de chaque case sur un plateau sans mur, dans l'ordre bas, haut, gauche, droite
+GRID_NEIGHBORS: List[List[int]] = [
+    [c + delta for delta, ok in ((9, c < 72), (-9, c >= 9), (-1, c % 9 > 0), (1, c % 9 < 8)) if ok]
+    for c in range(81)
+]
+
+
+def goal_cells(player_id: int) -> List[int]:
+    """
+    Retourne les cases de la ligne d'arrivée d'un joueur.
+
+    Args:
+        player_id (int): ID du joueur.
+
+    Returns:
+        List[int]: Index des 9 cases (ligne 8 pour J1, ligne 0 pour J2).
+    """
+    target_y = 8 if player_id == 1 else 0
+    return [target_y * 9 + x for x in range(9)]
+
+
+def wall_edges(wall: Tuple[int, int, str]) -> List[Tuple[int, int]]:
+    """
+    Retourne les deux arêtes (paires de cases) coupées par un mur.
+
+    Args:
+        wall (Tuple[int, int, str]): Le mur (x, y, orientation).
+
+    Returns:
+        List[Tuple[int, int]]: Les arêtes bloquées.
+    """
+    x, y, orientation = wall
+    c = y * 9 + x
+    if orientation == 'H':
+        return [(c, c + 9), (c + 1, c + 10)]
+    return [(c, c + 1), (c + 9, c + 10)]
+
+
+def compute_distance_map(neighbors: Neighbors, player_id: int) -> List[int]:
+    """
+    BFS inverse depuis la ligne d'arrivée : distance de chaque case à l'objectif.
+
+    Args:
+        neighbors (Neighbors): Voisins accessibles d'une case.
+        player_id (int): ID du joueur.
+
+    Returns:
+        List[int]: Distance par case (UNREACHABLE si l'objectif est inaccessible).
+    """
+    dist = [UNREACHABLE] * 81
+    queue = deque(goal_cells(player_id))
+    for c in queue:
+        dist[c] = 0
+    while queue:
+        c = queue.popleft()
+        d = dist[c] + 1
+        for n in neighbors(c):
+            if dist[n] > d:
+                dist[n] = d
+                queue.append(n)
+    return dist
+
+
+def cuts_shortest_path(dist: List[int], edges: List[Tuple[int, int]]) -> bool:
+    """
+    Indique si des arêtes portent un plus court chemin de la carte : sinon, les couper ne
+    change aucune distance (et n'enferme donc personne).
+
+    Args:
+        dist (List[int]): Carte de distances.
+        edges (List[Tuple[int, int]]): Arêtes coupées.
+
+    Returns:
+        bool: True si au moins une distance peut augmenter.
+    """
+    return any(dist[a] == dist[b] + 1 or dist[b] == dist[a] + 1 for a, b in edges)
+
+
+def goal_reachable(neighbors: Neighbors, start: int, player_id: int) -> bool:
+    """
+    Recherche guidée vers la ligne d'arrivée (meilleur d'abord, heuristique : nombre de
+    rangées restantes), arrêtée dès qu'une case d'arrivée est atteinte. Quand un chemin
+    existe, elle ne visite en général que quelques cases, là où un parcours en largeur
+    explore tout le plateau.
+
+    Args:
+        neighbors (Neighbors): Voisins accessibles d'une case.
+        start (int): Case de départ (le pion).
+        player_id (int): ID du joueur (ligne d'arrivée).
+
+    Returns:
+        bool: True si la ligne d'arrivée est accessible.
+    """
+    target_y = 8 if player_id == 1 else 0
+    if start // 9 == target_y:
+        return True
+    seen = bytearray(81)
+    seen[start] = 1
+    heap = [(abs(target_y - start // 9), start)]
+    while heap:
+        _, c = heapq.heappop(heap)
+        for n in neighbors(c):
+            if not seen[n]:
+                remaining = abs(target_y - n // 9)
+                if not remaining:
+                    return True
+                seen[n] = 1
+                heapq.heappush(heap, (remaining, n))
+    return False
+
+
+def update_after_block(neighbors: Neighbors, dist: List[int], edges: List[Tuple[int, int]]) -> None:
+    """
+    Met à jour la carte après la pose d'un mur (les distances ne peuvent qu'augmenter).
+
+    Seules les cases dont tous les plus courts chemins passaient par une arête coupée
+    sont recalculées ; si le mur ne coupe aucun plus court chemin, rien n'est fait.
+
+    Args:
+        neighbors (Neighbors): Voisins accessibles (le mur doit déjà être posé).
+        dist (List[int]): Carte de distances à modifier sur place.
+        edges (List[Tuple[int, int]]): Arêtes coupées par le mur.
+    """
+    heap = []
+    for a, b in edges:
+        if dist[a] == dist[b] + 1:
+            heap.append((dist[a], a))
+        elif dist[b] == dist[a] + 1:
+            heap.append((dist[b], b))
+    if not heap:
+        return
+    heapq.heapify(heap)
+
+    # 1. Repérage de la zone touchée, par distance croissante : une case est touchée si
+    #    plus aucun voisin non touché n'est à distance d - 1.
+    affected = set()
+    checked = set()
+    while heap:
+        d, c = heapq.heappop(heap)
+        if c in checked:
+            continue
+        checked.add(c)
+        if d == 0 or any(dist[n] == d - 1 and n not in affected for n in neighbors(c)):
+            continue
+        affected.add(c)
+        for n in neighbors(c):
+            if dist[n] == d + 1 and n not in checked:
+                heapq.heappush(heap, (d + 1, n))
+
+    # 2. Recalcul de la zone touchée depuis sa frontière (Dijkstra à poids unitaires)
+    for c in affected:
+        dist[c] = UNREACHABLE
+    for c in affected:
+        best = min((dist[n] + 1 for n in neighbors(c) if n not in affected), default=UNREACHABLE)
+        if best < UNREACHABLE:
+            dist[c] = best
+            heap.append((best, c))
+    heapq.heapify(heap)
+    while heap:
+        d, c = heapq.heappop(heap)
+        if d != dist[c]:
+            continue
+        for n in neighbors(c):
+            if n in affected and dist[n] > d + 1:
+                dist[n] = d + 1
+                heapq.heappush(heap, (d + 1, n))
+
+
+def update_after_unblock(neighbors: Neighbors, dist: List[int], edges: List[Tuple[int, int]]) -> None:
+    """
+    Met à jour la carte après le retrait d'un mur (les distances ne peuvent que diminuer).
+
+    Args:
+        neighbors (Neighbors): Voisins accessibles (le mur doit déjà être retiré).
+        dist (List[int]): Carte de distances à modifier sur place.
+        edges (List[Tuple[int, int]]): Arêtes rouvertes.
+    """
+    queue = deque()
+    for a, b in edges:
+        if dist[b] + 1 < dist[a]:
+            dist[a] = dist[b] + 1
+            queue.append(a)
+        elif dist[a] + 1 < dist[b]:
+            dist[b] = dist[a] + 1
+            queue.append(b)
+    while queue:
+        c = queue.popleft()
+        d = dist[c] + 1
+        for n in neighbors(c):
+            if dist[n] > d:
+                dist[n] = d
+                queue.append(n)
@@ -0,0 +1,47 @@
+from src.engine.board import Move
+
+# Colonnes a à i (x = 0 à 8), rangées 1 à 9 (y = 0 à 8) : J1 part de e1, J2 de e9
+COLUMNS = "abcdefghi"
+
+
+def move_to_text(move: Move) -> str:
+    """
+    Écrit un coup en notation texte : case d'arrivée pour un déplacement ("e2"), case
+    d'ancrage suivie de l'orientation pour un mur ("e3h" : mur horizontal entre les
+    rangées 3 et 4, couvrant les colonnes e et f).
+
+    Args:
+        move (Move): Le coup.
+
+    Returns:
+        str: Le coup en notation texte.
+    """
+    kind, data = move
+    if kind == "MOVE":
+        x, y = data
+        return f"{COLUMNS[x]}{y + 1}"
+    x, y, orientation = data
+    return f"{COLUMNS[x]}{y + 1}{orientation.lower()}"
+
+
+def text_to_move(text: str) -> Move:
+    """
+    Lit un coup écrit par move_to_text.
+
+    Args:
+        text (str): Le coup en notation texte (ex: "e2", "d5v").
+
+    Returns:
+        Move: Le coup.
+
+    Raises:
+        ValueError: Si le texte n'est pas un coup valide.
+    """
+    text = text.strip().lower()
+    if len(text) in (2, 3) and text[0] in COLUMNS and text[1] in "123456789":
+        x, y = COLUMNS.index(text[0]), int(text[1]) - 1
+        if len(text) == 2:
+            return ("MOVE", (x, y))
+        if text[2] in "hv" and x < 8 and y < 8:
+            return ("WALL", (x, y, text[2].upper()))
+    raise ValueError(f"Coup invalide : {text!r}")
@@ -0,0 +1,92 @@
+import argparse
+import time
+from typing import Dict, Optional, Sequence, Tuple
+from src.engine.board import QuoridorBoard, Move
+from src.engine.bitboard import BitboardQuoridorBoard
+
+# Représentations du plateau disponibles en ligne de commande
+BOARDS = {"board": QuoridorBoard, "bitboard": BitboardQuoridorBoard}
+
+
+def perft(board: QuoridorBoard, depth: int) -> int:
+    """
+    Compte les feuilles de l'arbre de tous les coups légaux (get_legal_moves) jusqu'à
+    `depth` demi-coups. Les parties terminées avant la profondeur ne comptent pas.
+
+    Args:
+        board (QuoridorBoard): La position (rendue intacte), jouée par le joueur au trait.
+        depth (int): Nombre de demi-coups.
+
+    Returns:
+        int: Nombre de positions atteintes à la profondeur `depth`.
+    """
+    if depth == 0:
+        return 1
+    moves = board.get_legal_moves()
+    if depth == 1:
+        return len(moves)
+    nodes = 0
+    for move in moves:
+        token = board.apply_move(move)
+        nodes += perft(board, depth - 1)
+        board.undo_move(token)
+    return nodes
+
+
+def divide(board: QuoridorBoard, depth: int) -> Dict[Move, int]:
+    """
+    perft détaillé par coup racine (pour localiser une divergence entre deux moteurs).
+
+    Args:
+        board (QuoridorBoard): La position (rendue intacte).
+        depth (int): Nombre de demi-coups (au moins 1).
+
+    Returns:
+        Dict[Move, int]: Nombre de feuilles sous chaque coup racine.
+    """
+    counts = {}
+    for move in board.get_legal_moves():
+        token = board.apply_move(move)
+        counts[move] = perft(board, depth - 1)
+        board.undo_move(token)
+    return counts
+
+
+def timed_perft(board: QuoridorBoard, depth: int) -> Tuple[int, float, float]:
+    """
+    perft chronométré.
+
+    Args:
+        board (QuoridorBoard): La position (rendue intacte).
+        depth (int): Nombre de demi-coups.
+
+    Returns:
+        Tuple[int, float, float]: Nombre de feuilles, durée en secondes et nœuds par seconde.
+    """
+    start = time.perf_counter()
+    nodes = perft(board, depth)
+    elapsed = time.perf_counter() - start
+    return nodes, elapsed, nodes / elapsed if elapsed > 0 else 0.0
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Point d'entrée : python -m src.engine.perft [profondeur] [--boards board bitboard] [--divide]"""
+    parser = argparse.ArgumentParser(description="Compte les coups légaux (perft) depuis la position initiale.")
+    parser.add_argument("depth", type=int, nargs="?", default=2, help="Nombre de demi-coups.")
+    parser.add_argument("--boards", nargs="*", default=list(BOARDS), choices=list(BOARDS),
+                        help="Représentations du plateau mesurées.")
+    parser.add_argument("--divide", action="store_true", help="Détaille le compte par coup racine.")
+    args = parser.parse_args(argv)
+
+    for name in args.boards:
+        board = BOARDS[name]()
+        if args.divide:
+            for move, count in sorted(divide(board, args.depth).items()):
+                print(f"   {move}: {count}")
+        for depth in range(1, args.depth + 1):
+            nodes, elapsed, nps = timed_perft(board, depth)
+            print(f"{name:<9} perft({depth}) = {nodes:>10}  {elapsed:8.2f} s  {nps:>10.0f} nœuds/s")
+
+
+if __name__ == "__main__":
+    main()
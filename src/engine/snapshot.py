@@ -0,0 +1,96 @@
+from typing import Dict, List, Optional, Tuple
+from src.engine import zobrist
+from src.engine.board import QuoridorBoard, decode_state, mask_walls
+
+
+class BoardSnapshot:
+    """
+    Instantané immuable d'une position, construit sur l'encodage de QuoridorBoard.to_bytes :
+    hachable et comparable (utilisable comme clé de dictionnaire), léger à copier, à envoyer
+    à un processus ou à écrire sur disque. Deux représentations d'une même position donnent
+    le même instantané.
+    """
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: bytes) -> None:
+        """
+        Args:
+            data (bytes): Une position encodée (voir QuoridorBoard.to_bytes).
+
+        Raises:
+            ValueError: Si les données ne décrivent pas une position.
+        """
+        decode_state(data)
+        object.__setattr__(self, "data", bytes(data))
+
+    @classmethod
+    def from_board(cls, board: QuoridorBoard) -> 'BoardSnapshot':
+        """
+        Fige l'état d'un plateau.
+
+        Args:
+            board (QuoridorBoard): Le plateau (quelle que soit sa représentation).
+
+        Returns:
+            BoardSnapshot: L'instantané.
+        """
+        return cls(board.to_bytes())
+
+    def to_board(self, board_cls: type = QuoridorBoard) -> QuoridorBoard:
+        """
+        Reconstruit un plateau modifiable.
+
+        Args:
+            board_cls (type): La représentation à instancier.
+
+        Returns:
+            QuoridorBoard: Un nouveau plateau.
+        """
+        return board_cls.from_bytes(self.data)
+
+    @property
+    def positions(self) -> Dict[int, Tuple[int, int]]:
+        _, _, cell1, cell2, _, _, _, _ = decode_state(self.data)
+        return {1: (cell1 % 9, cell1 // 9), 2: (cell2 % 9, cell2 // 9)}
+
+    @property
+    def walls(self) -> List[Tuple[int, int, str]]:
+        h, v = decode_state(self.data)[:2]
+        return mask_walls(h, 'H') + mask_walls(v, 'V')
+
+    @property
+    def walls_count(self) -> Dict[int, int]:
+        _, _, _, _, count1, count2, _, _ = decode_state(self.data)
+        return {1: count1, 2: count2}
+
+    @property
+    def winner(self) -> Optional[int]:
+        return decode_state(self.data)[6]
+
+    @property
+    def turn(self) -> int:
+        return decode_state(self.data)[7]
+
+    @property
+    def zobrist(self) -> int:
+        """Hash Zobrist de la position (le même que celui du plateau)."""
+        return zobrist.compute_hash(self.positions, self.walls, self.walls_count, self.turn)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError("BoardSnapshot est immuable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("BoardSnapshot est immuable")
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, BoardSnapshot) and self.data == other.data
+
+    def __hash__(self) -> int:
+        return hash(self.data)
+
+    def __reduce__(self) -> tuple:
+        return (BoardSnapshot, (self.data,))
+
+    def __repr__(self) -> str:
+        return f"BoardSnapshot({self.data.hex()})"
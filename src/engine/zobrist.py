@@ -0,0 +1,59 @@
+import random
+from typing import Dict, List, Tuple
+
+# Graine fixe : les clés (et donc les hash) sont identiques d'une exécution à l'autre,
+# ce qui permet de les sauvegarder sur disque (livre d'ouvertures, caches...).
+_rng = random.Random(0x51D0_2024)
+
+
+def _key() -> int:
+    return _rng.getrandbits(64)
+
+
+# PAWN_KEYS[player_id][y * 9 + x]
+PAWN_KEYS: Dict[int, List[int]] = {pid: [_key() for _ in range(81)] for pid in (1, 2)}
+# WALL_KEYS[(x, y, orientation)]
+WALL_KEYS: Dict[Tuple[int, int, str], int] = {
+    (x, y, o): _key() for o in ('H', 'V') for y in range(8) for x in range(8)
+}
+# WALLS_COUNT_KEYS[player_id][murs restants]
+WALLS_COUNT_KEYS: Dict[int, List[int]] = {pid: [_key() for _ in range(11)] for pid in (1, 2)}
+# Ajouté au hash quand c'est au Joueur 2 de jouer
+TURN_KEY: int = _key()
+
+
+def pawn_key(player_id: int, pos: Tuple[int, int]) -> int:
+    """
+    Retourne la clé Zobrist d'un pion sur une case.
+
+    Args:
+        player_id (int): ID du joueur.
+        pos (Tuple[int, int]): Coordonnées (x, y) du pion.
+
+    Returns:
+        int: Clé 64 bits.
+    """
+    return PAWN_KEYS[player_id][pos[1] * 9 + pos[0]]
+
+
+def compute_hash(positions: Dict[int, Tuple[int, int]], walls, walls_count: Dict[int, int],
+                 turn: int) -> int:
+    """
+    Calcule le hash Zobrist complet d'une position (sans mise à jour incrémentale).
+
+    Args:
+        positions (Dict[int, Tuple[int, int]]): Positions des pions.
+        walls (Iterable[Tuple[int, int, str]]): Murs posés.
+        walls_count (Dict[int, int]): Murs restants par joueur.
+        turn (int): Joueur ayant le trait.
+
+    Returns:
+        int: Hash 64 bits de la position.
+    """
+    h = pawn_key(1, positions[1]) ^ pawn_key(2, positions[2])
+    for wall in walls:
+        h ^= WALL_KEYS[wall]
+    h ^= WALLS_COUNT_KEYS[1][walls_count[1]] ^ WALLS_COUNT_KEYS[2][walls_count[2]]
+    if turn == 2:
+        h ^= TURN_KEY
+    return h
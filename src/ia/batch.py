@@ -0,0 +1,202 @@
+from typing import List, Optional, Tuple
+from src.engine.board import QuoridorBoard
+from src.ia.moves_optimization import MoveType, PATH_WINDOW, wall_window
+
+try:
+    import numpy as np
+except ImportError:  # NumPy est optionnel : la recherche classique fonctionne sans
+    np = None
+
+# Distance attribuée aux cases d'où l'arrivée est inaccessible
+UNREACHABLE = 10_000
+
+
+def is_available() -> bool:
+    """Indique si NumPy est installé (mode batch utilisable)."""
+    return np is not None
+
+
+def wall_grids(board: QuoridorBoard) -> Tuple['np.ndarray', 'np.ndarray']:
+    """
+    Convertit les murs du plateau en deux grilles booléennes 8x8 indexées [y, x].
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Murs horizontaux et verticaux.
+    """
+    h = np.zeros((8, 8), dtype=bool)
+    v = np.zeros((8, 8), dtype=bool)
+    for x, y, orientation in board.walls:
+        (h if orientation == 'H' else v)[y, x] = True
+    return h, v
+
+
+def legal_wall_mask(board: QuoridorBoard) -> 'np.ndarray':
+    """
+    Calcule en une fois la validité physique (sans chevauchement ni croisement) des
+    128 murs possibles, comme _is_wall_placement_valid pour chaque ancrage.
+
+    Returns:
+        np.ndarray: Tableau booléen (8, 8, 2) indexé [x, y, orientation] (0 = 'H', 1 = 'V').
+    """
+    h, v = wall_grids(board)
+    blocked_h = h | v
+    blocked_h[:, 1:] |= h[:, :-1]   # Chevauchement avec un mur 'H' à gauche
+    blocked_h[:, :-1] |= h[:, 1:]   # ... ou à droite
+    blocked_v = h | v
+    blocked_v[1:, :] |= v[:-1, :]   # Chevauchement avec un mur 'V' au-dessus
+    blocked_v[:-1, :] |= v[1:, :]   # ... ou en dessous
+    return np.stack([~blocked_h.T, ~blocked_v.T], axis=-1)
+
+
+def distance_maps(h: 'np.ndarray', v: 'np.ndarray', goal_rows: 'np.ndarray',
+                  targets: Optional[Tuple['np.ndarray', 'np.ndarray']] = None) -> 'np.ndarray':
+    """
+    Transformée de distance vectorisée : BFS multi-sources depuis la ligne d'arrivée,
+    menée simultanément sur un lot de plateaux.
+
+    Args:
+        h (np.ndarray): Murs horizontaux du lot, forme (B, 8, 8) indexée [b, y, x].
+        v (np.ndarray): Murs verticaux du lot, forme (B, 8, 8).
+        goal_rows (np.ndarray): Ligne d'arrivée de chaque plateau du lot, forme (B,).
+        targets (Optional[Tuple[np.ndarray, np.ndarray]]): Cases (y, x) dont seule la distance
+            intéresse, une par plateau : la propagation s'arrête dès qu'elles sont atteintes.
+
+    Returns:
+        np.ndarray: Distances (B, 9, 9) indexées [b, y, x] (UNREACHABLE si non atteinte).
+    """
+    batch = h.shape[0]
+    # Arête (y, x) -> (y + 1, x) bloquée par un mur 'H' en (x, y) ou (x - 1, y)
+    south = np.zeros((batch, 8, 9), dtype=bool)
+    south[:, :, :8] |= h
+    south[:, :, 1:] |= h
+    south_open = ~south
+    # Arête (y, x) -> (y, x + 1) bloquée par un mur 'V' en (x, y) ou (x, y - 1)
+    east = np.zeros((batch, 9, 8), dtype=bool)
+    east[:, :8, :] |= v
+    east[:, 1:, :] |= v
+    east_open = ~east
+
+    index = np.arange(batch)
+    dist = np.full((batch, 9, 9), UNREACHABLE, dtype=np.int32)
+    reached = np.zeros((batch, 9, 9), dtype=bool)
+    reached[index, goal_rows, :] = True
+    dist[reached] = 0
+    frontier = reached.copy()
+    step = 0
+    while True:
+        if targets is not None and reached[index, targets[0], targets[1]].all():
+            return dist
+        nxt = np.zeros_like(frontier)
+        nxt[:, 1:, :] |= frontier[:, :-1, :] & south_open
+        nxt[:, :-1, :] |= frontier[:, 1:, :] & south_open
+        nxt[:, :, 1:] |= frontier[:, :, :-1] & east_open
+        nxt[:, :, :-1] |= frontier[:, :, 1:] & east_open
+        nxt &= ~reached
+        if not nxt.any():
+            return dist
+        step += 1
+        dist[nxt] = step
+        reached |= nxt
+        frontier = nxt
+
+
+def get_optimized_moves_batch(board: QuoridorBoard, player_id: int, window: str = PATH_WINDOW,
+                              width: Optional[int] = None) -> List[MoveType]:
+    """
+    Même liste (et même ordre) que get_optimized_moves, mais les murs candidats sont
+    filtrés par legal_wall_mask au lieu d'un test mur par mur.
+
+    Args:
+        board (QuoridorBoard): L'instance actuelle du plateau.
+        player_id (int): L'identifiant du joueur qui doit jouer.
+        window (str): Fenêtre des murs candidats (voir wall_window).
+        width (Optional[int]): Largeur de la fenêtre (défaut selon la fenêtre).
+
+    Returns:
+        List[MoveType]: Une liste de tuples décrivant les coups possibles.
+    """
+    moves: List[MoveType] = [("MOVE", pos) for pos in board.get_legal_pawn_moves(player_id)]
+    moves.extend(("WALL", wall) for wall in candidate_walls_batch(board, player_id, window, width))
+    return moves
+
+
+def candidate_walls_batch(board: QuoridorBoard, player_id: int, window: str = PATH_WINDOW,
+                          width: Optional[int] = None) -> List[Tuple[int, int, str]]:
+    """
+    Murs candidats de get_optimized_moves_batch, seuls (pour une génération par étapes).
+
+    Returns:
+        List[Tuple[int, int, str]]: Les murs de la fenêtre physiquement posables.
+    """
+    if board.walls_count[player_id] <= 0:
+        return []
+    legal = legal_wall_mask(board)
+    return [wall for wall in wall_window(board, window, width) if legal[wall[0], wall[1], int(wall[2] == 'V')]]
+
+
+def evaluate_children(board: QuoridorBoard, player_id: int, moves: List[MoveType],
+                      eval_player: int, strategy: str) -> List[Optional[float]]:
+    """
+    Évalue d'un coup tous les fils d'un nœud (comme evaluate_board après chaque coup).
+
+    Les déplacements de pion ne changent pas les murs : un seul plateau du lot suffit
+    pour tous. Chaque mur candidat ajoute un plateau au lot ; la même propagation donne
+    aussi sa légalité (aucun joueur enfermé).
+
+    Args:
+        board (QuoridorBoard): La position du nœud (non modifiée).
+        player_id (int): Joueur qui joue les coups.
+        moves (List[MoveType]): Les coups à évaluer (murs physiquement valides).
+        eval_player (int): Point de vue de l'évaluation (l'IA).
+        strategy (str): "simple" ou "advanced".
+
+    Returns:
+        List[Optional[float]]: Le score de chaque fils, None si le coup est illégal.
+    """
+    opp_player = 3 - eval_player
+    n = len(moves)
+    is_wall = np.array([kind == "WALL" for kind, _ in moves], dtype=bool)
+
+    # Positions des pions dans chaque fils, forme (n, 2) par joueur : [x, y]
+    pos = {pid: np.tile(np.array(board.positions[pid]), (n, 1)) for pid in (1, 2)}
+    for i, (kind, data) in enumerate(moves):
+        if kind == "MOVE":
+            pos[player_id][i] = data
+
+    # Un plateau du lot par fils : murs actuels, plus le mur candidat le cas échéant
+    h, v = wall_grids(board)
+    hb = np.repeat(h[None], n, axis=0)
+    vb = np.repeat(v[None], n, axis=0)
+    for i, (kind, data) in enumerate(moves):
+        if kind == "WALL":
+            x, y, orientation = data
+            (hb if orientation == 'H' else vb)[i, y, x] = True
+
+    # Les deux joueurs sont traités dans le même lot (2 * n plateaux) ; la propagation
+    # s'arrête dès que chaque pion est atteint.
+    lengths = {}
+    if strategy == "advanced" or is_wall.any():
+        goal_rows = np.repeat(np.array([8, 0]), n)
+        ty = np.concatenate([pos[1][:, 1], pos[2][:, 1]])
+        tx = np.concatenate([pos[1][:, 0], pos[2][:, 0]])
+        dist = distance_maps(np.concatenate([hb, hb]), np.concatenate([vb, vb]), goal_rows, (ty, tx))
+        flat = dist[np.arange(2 * n), ty, tx]
+        lengths = {1: flat[:n], 2: flat[n:]}
+        legal = (lengths[1] < UNREACHABLE) & (lengths[2] < UNREACHABLE)
+    else:
+        legal = np.ones(n, dtype=bool)
+
+    if strategy == "advanced":
+        counts = np.array([board.walls_count[eval_player] - board.walls_count[opp_player]] * n)
+        # Le joueur qui pose un mur en perd un
+        counts[is_wall] += -1 if player_id == eval_player else 1
+        len_p = np.where(lengths[eval_player] < UNREACHABLE, lengths[eval_player], 100)
+        len_o = np.where(lengths[opp_player] < UNREACHABLE, lengths[opp_player], 100)
+        scores = (len_o - len_p) * 10 + counts * 5
+    else:
+        # Stratégie "simple" (et stratégie par défaut)
+        target_p = 8 if eval_player == 1 else 0
+        target_o = 8 if opp_player == 1 else 0
+        scores = (np.abs(target_o - pos[opp_player][:, 1]) - np.abs(target_p - pos[eval_player][:, 1])) * 10
+
+    return [int(score) if ok else None for score, ok in zip(scores.tolist(), legal.tolist())]
@@ -0,0 +1,246 @@
+from collections import deque
+from typing import List, Optional, Tuple
+from src.engine.board import QuoridorBoard
+from src.ia.move_ordering import path_cutting_walls
+from src.ia.moves_optimization import MoveType
+
+# Phases de jeu : les deux joueurs ont des murs, un seul en a encore, plus aucun (course pure)
+MIDDLEGAME = "middlegame"
+ONE_SIDED = "one_sided"
+RACE = "race"
+
+# Résultat d'une position de course pour le joueur qui a le trait
+WIN = 1
+DRAW = 0
+LOSS = -1
+
+# Score d'une partie gagnée (supérieur à toute évaluation heuristique)
+WIN_SCORE = 10_000
+
+
+def game_phase(board: QuoridorBoard) -> str:
+    """
+    Phase de jeu selon les murs restants.
+
+    Args:
+        board (QuoridorBoard): La position.
+
+    Returns:
+        str: MIDDLEGAME, ONE_SIDED ou RACE.
+    """
+    left = (board.walls_count[1] > 0) + (board.walls_count[2] > 0)
+    return MIDDLEGAME if left == 2 else ONE_SIDED if left == 1 else RACE
+
+
+def endgame_moves(board: QuoridorBoard, player_id: int) -> List[MoveType]:
+    """
+    Générateur de coups de fin de partie (un seul joueur a encore des murs).
+
+    Le joueur sans mur n'a que ses déplacements de pion. L'autre n'a que des murs coupant
+    le plus court chemin adverse, où qu'ils soient sur le plateau : dans une course, un mur
+    qui n'allonge pas ce chemin ne fait que perdre un temps.
+
+    Args:
+        board (QuoridorBoard): L'instance actuelle du plateau.
+        player_id (int): L'identifiant du joueur qui doit jouer.
+
+    Returns:
+        List[MoveType]: Les déplacements, puis les murs physiquement posables.
+    """
+    moves: List[MoveType] = [("MOVE", pos) for pos in board.get_legal_pawn_moves(player_id)]
+    moves.extend(("WALL", wall) for wall in endgame_walls(board, player_id))
+    return moves
+
+
+def endgame_walls(board: QuoridorBoard, player_id: int) -> List[Tuple[int, int, str]]:
+    """
+    Murs candidats de endgame_moves, seuls (pour une génération par étapes).
+
+    Returns:
+        List[Tuple[int, int, str]]: Les murs physiquement posables coupant le chemin adverse.
+    """
+    if board.walls_count[player_id] <= 0:
+        return []
+    return [wall for wall in sorted(path_cutting_walls(board.shortest_path(3 - player_id)))
+            if 0 <= wall[0] < 8 and 0 <= wall[1] < 8 and board._is_wall_placement_valid(wall)]
+
+
+def race_evaluate(board: QuoridorBoard, player_id: int, strategy: str = "advanced") -> float:
+    """
+    Évaluation de fin de partie tenant compte du trait : à distances égales, le joueur qui
+    a le trait arrive le premier. Un score positif signifie que la course est gagnée si
+    aucun mur ne vient la modifier. Antisymétrique, comme evaluate_board.
+
+    Args:
+        board (QuoridorBoard): La position.
+        player_id (int): Point de vue de l'évaluation.
+        strategy (str): Ignoré (même signature que evaluate_board).
+
+    Returns:
+        float: Le score de la position.
+    """
+    if board.winner is not None:
+        return WIN_SCORE if board.winner == player_id else -WIN_SCORE
+    opp_id = 3 - player_id
+    margin = (board.shortest_path_len(opp_id) - board.shortest_path_len(player_id)) * 2
+    margin += 1 if board.turn == player_id else -1
+    return margin * 5 + (board.walls_count[player_id] - board.walls_count[opp_id]) * 5
+
+
+class RaceSolver:
+    """
+    Résolution exacte d'une course (plus aucun mur en réserve) par analyse rétrograde.
+
+    Les murs ne bougent plus : une position se résume aux cases des deux pions et au trait,
+    soit 81 * 81 * 2 états. Partant des parties terminées, on remonte les coups : un état
+    est gagné s'il mène à un état perdu pour l'adversaire, perdu si tous ses coups mènent à
+    des états gagnés pour l'adversaire. Sauts et blocages mutuels sont ainsi pris en compte
+    exactement. Les états jamais résolus sont nuls (les pions se bloquent indéfiniment).
+    """
+
+    def __init__(self, board: QuoridorBoard) -> None:
+        """
+        Args:
+            board (QuoridorBoard): Une position de la course (seuls ses murs sont utilisés).
+        """
+        self.walls = frozenset(board.walls)
+        # Déplacements de chaque état non terminal (index des cases d'arrivée)
+        self._moves: List[Optional[List[int]]] = []
+        self.results: List[int] = []
+        # Nombre de demi-coups jusqu'à la fin de la partie (jeu optimal des deux côtés)
+        self.plies: List[int] = []
+        self._solve(board)
+
+    @staticmethod
+    def _index(cell1: int, cell2: int, turn: int) -> int:
+        return (cell1 * 81 + cell2) * 2 + turn - 1
+
+    def _state(self, board: QuoridorBoard) -> int:
+        (x1, y1), (x2, y2) = board.positions[1], board.positions[2]
+        return self._index(y1 * 9 + x1, y2 * 9 + x2, board.turn)
+
+    def _solve(self, board: QuoridorBoard) -> None:
+        """Construit le graphe des états puis le résout depuis les positions terminales."""
+        neighbors = [list(board._cell_neighbors(c)) for c in range(81)]
+        saved = dict(board.positions)
+
+        def pawn_moves(player_id: int, cell: int, opp_cell: int) -> List[int]:
+            if opp_cell not in neighbors[cell]:
+                return neighbors[cell]
+            # Pions face à face : sauts calculés par les règles du plateau
+            board.positions[player_id] = (cell % 9, cell // 9)
+            board.positions[3 - player_id] = (opp_cell % 9, opp_cell // 9)
+            return [y * 9 + x for x, y in board.get_legal_pawn_moves(player_id)]
+
+        size = 81 * 81 * 2
+        moves: List[Optional[List[int]]] = [None] * size
+        results = [DRAW] * size
+        plies = [0] * size
+        remaining = [0] * size
+        parents: List[List[int]] = [[] for _ in range(size)]
+        queue = deque()
+        try:
+            for c1 in range(81):
+                for c2 in range(81):
+                    if c1 == c2:
+                        continue
+                    for turn in (1, 2):
+                        state = self._index(c1, c2, turn)
+                        if c1 >= 72 or c2 < 9:
+                            # Partie terminée : le joueur qui a le trait a perdu
+                            results[state] = LOSS if (c1 >= 72) == (turn == 2) else WIN
+                            queue.append(state)
+                            continue
+                        if turn == 1:
+                            targets = pawn_moves(1, c1, c2)
+                            children = [self._index(n, c2, 2) for n in targets]
+                        else:
+                            targets = pawn_moves(2, c2, c1)
+                            children = [self._index(c1, n, 1) for n in targets]
+                        moves[state] = targets
+                        remaining[state] = len(children)
+                        for child in children:
+                            parents[child].append(state)
+        finally:
+            for pid in (1, 2):
+                board.positions[pid] = saved[pid]
+
+        # Parcours en largeur : les états sont résolus par nombre croissant de demi-coups
+        while queue:
+            state = queue.popleft()
+            for parent in parents[state]:
+                if results[parent] != DRAW:
+                    continue
+                if results[state] == LOSS:
+                    results[parent] = WIN
+                else:
+                    remaining[parent] -= 1
+                    if remaining[parent]:
+                        continue
+                    results[parent] = LOSS
+                plies[parent] = plies[state] + 1
+                queue.append(parent)
+
+        self._moves = moves
+        self.results = results
+        self.plies = plies
+
+    def matches(self, board: QuoridorBoard) -> bool:
+        """Indique si la table a été calculée pour les murs de ce plateau."""
+        return frozenset(board.walls) == self.walls
+
+    def outcome(self, board: QuoridorBoard) -> Tuple[int, int]:
+        """
+        Résultat exact de la position pour le joueur qui a le trait.
+
+        Args:
+            board (QuoridorBoard): La position (mêmes murs que la table).
+
+        Returns:
+            Tuple[int, int]: WIN, DRAW ou LOSS, et le nombre de demi-coups restants.
+        """
+        state = self._state(board)
+        return self.results[state], self.plies[state]
+
+    def score(self, board: QuoridorBoard, player_id: int) -> float:
+        """
+        Score exact de la position du point de vue de player_id : gagner vite vaut
+        mieux que gagner tard, perdre tard mieux que perdre vite.
+
+        Args:
+            board (QuoridorBoard): La position (mêmes murs que la table).
+            player_id (int): Point de vue.
+
+        Returns:
+            float: ±(WIN_SCORE - demi-coups), 0 pour une nulle.
+        """
+        result, plies = self.outcome(board)
+        if board.turn != player_id:
+            result = -result
+        return result * (WIN_SCORE - plies)
+
+    def best_move(self, board: QuoridorBoard) -> Optional[MoveType]:
+        """
+        Coup optimal du joueur qui a le trait.
+
+        Args:
+            board (QuoridorBoard): La position (mêmes murs que la table).
+
+        Returns:
+            Optional[MoveType]: Le déplacement, None si la partie est terminée.
+        """
+        state = self._state(board)
+        targets = self._moves[state]
+        if not targets:
+            return None
+        (x1, y1), (x2, y2) = board.positions[1], board.positions[2]
+        c1, c2 = y1 * 9 + x1, y2 * 9 + x2
+
+        def key(cell: int) -> Tuple[int, int]:
+            child = self._index(cell, c2, 2) if board.turn == 1 else self._index(c1, cell, 1)
+            result, plies = self.results[child], self.plies[child]
+            # Adversaire perdant (au plus vite), sinon nulle, sinon défaite la plus lointaine
+            return (0, plies) if result == LOSS else (1, 0) if result == DRAW else (2, -plies)
+
+        cell = min(targets, key=key)
+        return ("MOVE", (cell % 9, cell // 9))
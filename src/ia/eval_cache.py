@@ -0,0 +1,142 @@
+import os
+import struct
+from collections import OrderedDict
+from typing import Callable, Optional, Tuple
+from src.engine.board import QuoridorBoard
+
+# Fichier par défaut (conservé d'un tournoi à l'autre)
+DEFAULT_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "data",
+                                  "eval_cache.bin")
+
+# En-tête : signature, version, nombre d'entrées
+_MAGIC = b"QEC1"
+_HEADER = struct.Struct("<4sBxxxI")
+# Entrée : hash Zobrist, type d'évaluation, point de vue, score
+_ENTRY = struct.Struct("<QBBd")
+# Types d'évaluation enregistrables (stratégies de evaluate_board, puis évaluation de fin de partie)
+_KINDS = ["simple", "advanced", "race"]
+
+# Clé d'une évaluation : (hash Zobrist, stratégie, joueur)
+CacheKey = Tuple[int, str, int]
+
+
+class EvaluationCache:
+    """
+    Cache LRU des évaluations de positions, partagé entre les coups d'une partie et entre
+    les parties d'un tournoi (le hash Zobrist, à graine fixe, est stable d'une exécution à l'autre).
+    """
+
+    def __init__(self, max_entries: int = 1 << 20) -> None:
+        """
+        Args:
+            max_entries (int): Nombre maximal d'évaluations conservées (les moins récentes sont oubliées).
+        """
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[CacheKey, float]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        """Part des évaluations servies par le cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def get(self, key: CacheKey) -> Optional[float]:
+        """
+        Cherche une évaluation (et la marque comme récente).
+
+        Args:
+            key (CacheKey): (hash, stratégie, joueur).
+
+        Returns:
+            Optional[float]: Le score, None s'il n'est pas en cache.
+        """
+        score = self._entries.get(key)
+        if score is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return score
+
+    def put(self, key: CacheKey, score: float) -> None:
+        """
+        Mémorise une évaluation, en oubliant la moins récente si le cache est plein.
+
+        Args:
+            key (CacheKey): (hash, stratégie, joueur).
+            score (float): Le score.
+        """
+        self._entries[key] = score
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def wrap(self, evaluate: Callable, kind: Optional[str] = None) -> Callable:
+        """
+        Enveloppe une fonction d'évaluation pour passer par le cache.
+
+        Args:
+            evaluate (Callable): evaluate_board ou une fonction de même signature.
+            kind (Optional[str]): Type d'évaluation utilisé dans la clé à la place de la
+                                  stratégie (ex: "race" pour endgame.race_evaluate).
+
+        Returns:
+            Callable: La fonction avec cache.
+        """
+        def wrapper(board: QuoridorBoard, player_id: int, strategy: str) -> float:
+            key = (board.zobrist, kind or strategy, player_id)
+            score = self.get(key)
+            if score is None:
+                score = evaluate(board, player_id, strategy)
+                self.put(key, score)
+            return score
+        return wrapper
+
+    def save(self, path: str = DEFAULT_CACHE_PATH) -> None:
+        """
+        Écrit le cache au format binaire (18 octets par évaluation, des moins récentes aux plus
+        récentes). Les évaluations d'une stratégie inconnue ne sont pas enregistrées.
+
+        Args:
+            path (str): Chemin du fichier.
+        """
+        entries = [(key, kind, player, score) for (key, kind, player), score in self._entries.items()
+                   if kind in _KINDS]
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, 1, len(entries)))
+            for key, kind, player, score in entries:
+                f.write(_ENTRY.pack(key, _KINDS.index(kind), player, score))
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_CACHE_PATH, max_entries: int = 1 << 20) -> 'EvaluationCache':
+        """
+        Charge un cache écrit par save (cache vide si le fichier n'existe pas).
+
+        Args:
+            path (str): Chemin du fichier.
+            max_entries (int): Taille maximale du cache.
+
+        Returns:
+            EvaluationCache: Le cache.
+
+        Raises:
+            ValueError: Si le fichier n'est pas un cache d'évaluations.
+        """
+        cache = cls(max_entries)
+        if not os.path.exists(path):
+            return cache
+        with open(path, "rb") as f:
+            data = f.read()
+        if len(data) < _HEADER.size:
+            raise ValueError(f"Cache d'évaluations invalide : {path}")
+        magic, version, count = _HEADER.unpack_from(data)
+        if magic != _MAGIC or version != 1 or len(data) != _HEADER.size + count * _ENTRY.size:
+            raise ValueError(f"Cache d'évaluations invalide : {path}")
+        for key, kind, player, score in _ENTRY.iter_unpack(data[_HEADER.size:]):
+            cache.put((key, _KINDS[kind], player), score)
+        return cache
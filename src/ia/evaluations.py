@@ -1,5 +1,4 @@
 from src.engine.board import QuoridorBoard
-from collections import deque
 
 
 def evaluate_board(board: QuoridorBoard, player_id: int, strategy: str) -> float:
@@ -57,21 +56,8 @@ def bfs_shortest_path_len(board: QuoridorBoard, pid: int) -> int:
     """
     Calcule la longueur du chemin le plus court vers la victoire.
     Retourne une grande valeur (100) si bloqué (théoriquement impossible avec nos règles).
-    """
-    start = board.positions[pid]
-    target_y = 8 if pid == 1 else 0
-
-    queue = deque([(start, 0)])  # (pos, distance)
-    visited = {start}
-
-    while queue:
-        (cx, cy), dist = queue.popleft()
-        if cy == target_y:
-            return dist
 
-        for nx, ny in board.get_accessible_neighbors(cx, cy):
-            if (nx, ny) not in visited:
-                visited.add((nx, ny))
-                queue.append(((nx, ny), dist + 1))
-
-    return 100  # Valeur de pénalité si aucun chemin trouvé
\ No newline at end of file
+    Le calcul est délégué au plateau, qui peut utiliser une représentation plus
+    rapide (voir BitboardQuoridorBoard).
+    """
+    return board.shortest_path_len(pid)
@@ -0,0 +1,292 @@
+import math
+import random
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+from src.engine.board import QuoridorBoard
+from src.ia.endgame import endgame_moves, race_evaluate
+from src.ia.move_ordering import path_cutting_walls
+from src.ia.moves_optimization import MoveType
+
+
+class MCTSNode:
+    """
+    Nœud de l'arbre UCT. `wins` compte les victoires du joueur qui a joué `move`
+    (celui qui choisit ce nœud depuis son parent).
+    """
+
+    __slots__ = ("move", "player", "parent", "key", "children", "untried", "visits", "wins")
+
+    def __init__(self, move: Optional[MoveType], player: int, parent: Optional['MCTSNode'], key: int) -> None:
+        self.move = move
+        self.player = player
+        self.parent = parent
+        # Hash Zobrist de la position du nœud (pour retrouver un sous-arbre au coup suivant)
+        self.key = key
+        self.children: List['MCTSNode'] = []
+        # Coups pas encore développés (None tant que le nœud n'a pas été atteint)
+        self.untried: Optional[List[MoveType]] = None
+        self.visits = 0
+        self.wins = 0.0
+
+    def select_child(self, exploration: float) -> 'MCTSNode':
+        """Enfant maximisant le score UCB1 (taux de victoire + bonus d'exploration)."""
+        log_visits = math.log(self.visits)
+        return max(self.children,
+                   key=lambda c: c.wins / c.visits + exploration * math.sqrt(log_visits / c.visits))
+
+
+def rollout(board: QuoridorBoard, rng: random.Random, max_plies: int = 40, wall_rate: float = 0.15) -> int:
+    """
+    Fin de partie simulée, guidée par les plus courts chemins : chaque joueur avance le long
+    de son plus court chemin ou, de temps en temps, pose un mur coupant celui de l'adversaire.
+    Au-delà de `max_plies`, ou si le joueur au trait ne peut plus bouger, le vainqueur est
+    celui qui gagne la course (distances et trait).
+
+    Args:
+        board (QuoridorBoard): La position de départ (rendue intacte).
+        rng (random.Random): Générateur aléatoire.
+        max_plies (int): Nombre maximal de demi-coups simulés.
+        wall_rate (float): Probabilité de tenter un mur à chaque coup.
+
+    Returns:
+        int: Le joueur vainqueur (1 ou 2).
+    """
+    tokens = []
+    try:
+        for _ in range(max_plies):
+            if board.winner is not None:
+                return board.winner
+            player = board.turn
+            token = None
+            if board.walls_count[player] > 0 and rng.random() < wall_rate:
+                walls = sorted(path_cutting_walls(board.shortest_path(3 - player)))
+                if walls:
+                    token = board.apply_move(("WALL", rng.choice(walls)), player)
+            if token is None:
+                path = board.shortest_path(player)
+                if len(path) > 1:
+                    token = board.apply_move(("MOVE", path[1]), player)
+            if token is None:
+                # Case suivante occupée par l'adversaire : déplacement (ou saut) au hasard
+                moves = board.get_legal_pawn_moves(player)
+                if moves:
+                    token = board.apply_move(("MOVE", rng.choice(moves)), player)
+            if token is None:
+                # Pion bloqué : la simulation s'arrête et la course départage les joueurs
+                break
+            tokens.append(token)
+        if board.winner is not None:
+            return board.winner
+        return 1 if race_evaluate(board, 1) > 0 else 2
+    finally:
+        while tokens:
+            board.undo_move(tokens.pop())
+
+
+def _rollout_batch(states: List[bytes], board_cls: type, seed: int, max_plies: int, wall_rate: float) -> List[int]:
+    """Tâche exécutée dans un processus : une simulation par position du lot."""
+    rng = random.Random(seed)
+    return [rollout(board_cls.from_bytes(state), rng, max_plies, wall_rate) for state in states]
+
+
+class MCTSIA:
+    """
+    IA Monte Carlo Tree Search (UCT), alternative à QuoridorIA avec la même interface
+    (get_best_move, stop, close) : son coût dépend du budget accordé, pas de la profondeur.
+
+    L'arbre ne développe que les déplacements et les murs coupant le plus court chemin
+    adverse (voir endgame.endgame_moves). Il est conservé d'un coup à l'autre : le sous-arbre
+    de la position jouée devient la nouvelle racine.
+    """
+
+    def __init__(self, player_id: int, iterations: Optional[int] = 2000, time_limit_ms: Optional[int] = None,
+                 exploration: float = 1.4, max_plies: int = 40, wall_rate: float = 0.15, workers: int = 1,
+                 batch_size: int = 64, seed: Optional[int] = None) -> None:
+        """
+        Args:
+            player_id (int): ID du joueur (1 ou 2).
+            iterations (Optional[int]): Nombre de simulations par coup (None = limité par le temps seul).
+            time_limit_ms (Optional[int]): Budget de temps par coup.
+            exploration (float): Constante d'exploration de UCB1.
+            max_plies (int): Longueur maximale d'une simulation.
+            wall_rate (float): Probabilité de poser un mur à chaque coup simulé.
+            workers (int): Nombre de processus pour les simulations (1 = dans ce processus).
+            batch_size (int): Feuilles simulées ensemble quand workers > 1 (perte virtuelle).
+            seed (Optional[int]): Graine des simulations (parties reproductibles).
+        """
+        if iterations is None and time_limit_ms is None:
+            raise ValueError("Il faut un nombre d'itérations ou un budget de temps.")
+        self.player_id = player_id
+        self.iterations = iterations
+        self.time_limit_ms = time_limit_ms
+        self.exploration = exploration
+        self.max_plies = max_plies
+        self.wall_rate = wall_rate
+        self.workers = workers
+        self.batch_size = batch_size
+        self._rng = random.Random(seed)
+        self._root: Optional[MCTSNode] = None
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._stop_event = threading.Event()
+        # Même interface de suivi que QuoridorIA (voir AIWorker et play_game)
+        self.current_depth = 0
+        self.nodes = 0
+        self.stats = None
+
+    def close(self) -> None:
+        """Libère les processus de simulation éventuels."""
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+    def stop(self) -> None:
+        """Demande l'arrêt de la recherche : get_best_move renvoie le coup le plus visité."""
+        self._stop_event.set()
+
+    def clear_stop(self) -> None:
+        """
+        Efface un arrêt demandé hors recherche (même rôle que QuoridorIA.clear_stop) : à
+        appeler depuis le thread qui lance la recherche, avant de la démarrer.
+        """
+        self._stop_event.clear()
+
+    def _reuse_root(self, board: QuoridorBoard) -> MCTSNode:
+        """
+        Retrouve la position courante parmi les petits-enfants de l'ancienne racine (notre coup
+        puis la réponse adverse) ; sinon, un nouvel arbre est créé.
+        """
+        if self._root is not None:
+            for child in self._root.children:
+                for grandchild in [child] + child.children:
+                    if grandchild.key == board.zobrist:
+                        grandchild.parent = None
+                        grandchild.move = None
+                        return grandchild
+        return MCTSNode(None, 3 - self.player_id, None, board.zobrist)
+
+    def _descend(self, board: QuoridorBoard, tokens: list) -> Tuple[MCTSNode, int]:
+        """
+        Sélection puis développement d'une feuille : les coups sont joués sur `board`
+        (leurs jetons ajoutés à `tokens`).
+
+        Returns:
+            Tuple[MCTSNode, int]: La feuille et sa profondeur.
+        """
+        node = self._root
+        depth = 0
+        while node.untried == [] and node.children:
+            node = node.select_child(self.exploration)
+            tokens.append(board.apply_move(node.move, node.player))
+            depth += 1
+        if board.winner is not None:
+            return node, depth
+        if node.untried is None:
+            node.untried = endgame_moves(board, board.turn)
+            self._rng.shuffle(node.untried)
+        while node.untried:
+            move = node.untried.pop()
+            player = board.turn
+            token = board.apply_move(move, player)
+            if token is not None:
+                child = MCTSNode(move, player, node, board.zobrist)
+                node.children.append(child)
+                tokens.append(token)
+                return child, depth + 1
+        return node, depth
+
+    @staticmethod
+    def _backpropagate(node: MCTSNode, winner: int, visits: int = 1) -> None:
+        while node is not None:
+            node.visits += visits
+            if node.player == winner:
+                node.wins += 1
+            node = node.parent
+
+    def _iterate(self, board: QuoridorBoard) -> None:
+        """Une simulation : sélection, développement, partie simulée, rétropropagation."""
+        tokens = []
+        try:
+            leaf, depth = self._descend(board, tokens)
+            winner = rollout(board, self._rng, self.max_plies, self.wall_rate)
+        finally:
+            while tokens:
+                board.undo_move(tokens.pop())
+        self.current_depth = max(self.current_depth, depth)
+        self._backpropagate(leaf, winner)
+
+    def _iterate_batch(self, board: QuoridorBoard, count: int) -> None:
+        """
+        `count` simulations réparties sur les processus. Chaque feuille choisie reçoit une
+        perte virtuelle (visite sans victoire) pour que les suivantes explorent ailleurs.
+        """
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(self.workers)
+        leaves, states = [], []
+        for _ in range(count):
+            tokens = []
+            try:
+                leaf, depth = self._descend(board, tokens)
+                states.append(board.to_bytes())
+            finally:
+                while tokens:
+                    board.undo_move(tokens.pop())
+            self.current_depth = max(self.current_depth, depth)
+            self._backpropagate(leaf, 0)
+            leaves.append(leaf)
+
+        chunk = math.ceil(len(states) / self.workers)
+        futures = [self._executor.submit(_rollout_batch, states[i:i + chunk], type(board), self._rng.getrandbits(32),
+                                         self.max_plies, self.wall_rate)
+                   for i in range(0, len(states), chunk)]
+        winners = [winner for future in futures for winner in future.result()]
+        for leaf, winner in zip(leaves, winners):
+            # La visite a déjà été comptée par la perte virtuelle
+            self._backpropagate(leaf, winner, visits=0)
+
+    def get_best_move(self, board: QuoridorBoard) -> Optional[MoveType]:
+        """
+        Lance les simulations dans le budget (itérations et/ou temps) puis joue le coup
+        le plus visité.
+
+        Args:
+            board (QuoridorBoard): L'état actuel du plateau (rendu intact).
+
+        Returns:
+            Optional[MoveType]: Le coup choisi.
+        """
+        board.turn = self.player_id
+        board.rebuild_caches()
+        self._root = self._reuse_root(board)
+        self.nodes = 0
+        self.current_depth = 0
+        deadline = None if self.time_limit_ms is None else time.perf_counter() + self.time_limit_ms / 1000
+
+        try:
+            while not self._stop_event.is_set():
+                if self.iterations is not None and self.nodes >= self.iterations:
+                    break
+                if deadline is not None and time.perf_counter() >= deadline:
+                    break
+                if self.workers > 1:
+                    count = self.batch_size
+                    if self.iterations is not None:
+                        count = min(count, self.iterations - self.nodes)
+                    self._iterate_batch(board, count)
+                    self.nodes += count
+                else:
+                    self._iterate(board)
+                    self.nodes += 1
+        finally:
+            self._stop_event.clear()
+
+        if not self._root.children:
+            # Aucune simulation (arrêt immédiat) : premier coup jouable
+            for move in endgame_moves(board, self.player_id):
+                token = board.apply_move(move, self.player_id)
+                if token is not None:
+                    board.undo_move(token)
+                    return move
+            return None
+        return max(self._root.children, key=lambda c: c.visits).move
@@ -1,112 +1,573 @@
 import math
-from typing import Tuple, Optional, List,Union
+import threading
+import time
+from functools import partial
+from typing import Callable, Iterator, Tuple, Optional, List,Union
 from src.engine.board import QuoridorBoard
 from src.ia.evaluations import evaluate_board
-from src.ia.moves_optimization import get_optimized_moves
+from src.ia.moves_optimization import (get_optimized_moves, candidate_walls, MoveType, WALL_WINDOWS, PATH_WINDOW,
+                                       DEFAULT_WINDOW_WIDTH)
+from src.ia.transposition import TranspositionTable, EXACT, LOWER_BOUND, UPPER_BOUND
+from src.ia.parallel import ParallelRootSearch
+from src.ia import batch as batch_eval
+from src.ia.stats import SearchStats
+from src.ia.move_ordering import MoveOrderer
+from src.ia.opening_book import OpeningBook
+from src.ia import endgame
+from src.ia.eval_cache import EvaluationCache
+
+class SearchTimeout(Exception):
+    """Levée à l'intérieur de la recherche quand le budget de temps est épuisé (ou sur demande d'arrêt)."""
+
 
 class QuoridorIA:
     """
     Intelligence Artificielle capable de simuler et choisir le meilleur coup.
     """
 
-    def __init__(self, player_id: int, depth: int, strategy: str) -> None:
+    def __init__(self, player_id: int, depth: int, strategy: str, tt_size_power: int = 18,
+                 time_limit_ms: Optional[int] = None, workers: int = 1, batch: bool = False,
+                 stats: bool = False, move_ordering: bool = True, pvs: bool = False,
+                 aspiration_window: Optional[int] = None, opening_book: Optional[OpeningBook] = None,
+                 endgame_mode: bool = True, eval_cache: Optional[EvaluationCache] = None,
+                 wall_window: str = PATH_WINDOW, window_width: Optional[int] = None) -> None:
         """
         Initialise l'IA.
 
         Args:
             player_id (int): ID du joueur (1 ou 2).
-            depth (int): Profondeur de recherche.
+            depth (int): Profondeur de recherche (profondeur maximale si time_limit_ms est donné).
             strategy (str): Nom de la fonction d'évaluation à utiliser.
+            tt_size_power (int): Taille de la table de transposition (2**n entrées).
+            time_limit_ms (Optional[int]): Budget de temps par coup (approfondissement itératif).
+            workers (int): Nombre de processus pour répartir les coups de la racine (1 = séquentiel).
+            batch (bool): Génère les murs et évalue les feuilles par lots avec NumPy.
+            stats (bool): Collecte des statistiques de recherche (voir SearchStats) dans `self.stats`.
+            move_ordering (bool): Ordonne les coups (killers, historique, plus courts chemins) ;
+                                  sinon seul le coup de la table de transposition passe en tête.
+            pvs (bool): Principal Variation Search : fenêtre nulle pour les coups après le premier.
+            aspiration_window (Optional[int]): Demi-largeur de la fenêtre d'aspiration autour du
+                                               score de l'itération précédente (avec time_limit_ms).
+            opening_book (Optional[OpeningBook]): Livre consulté avant toute recherche (ignoré s'il
+                                                  a été construit avec une autre stratégie).
+            endgame_mode (bool): Bascule automatiquement en fin de partie : course résolue
+                                 exactement quand plus personne n'a de mur, recherche limitée
+                                 aux murs du seul joueur qui en a encore sinon (voir endgame).
+            eval_cache (Optional[EvaluationCache]): Cache des évaluations, qui peut être partagé
+                                                    entre plusieurs IA (ex: un tournoi).
+            wall_window (str): Murs candidats du milieu de partie : voisinage des plus courts
+                               chemins ("path") ou boîte englobant les pions ("box").
+            window_width (Optional[int]): Largeur de cette fenêtre (défaut selon la fenêtre).
+
+        Raises:
+            ValueError: Si la fenêtre est inconnue ou sa largeur inférieure à 1.
         """
         self.player_id = player_id
         self.depth = depth
         self.strategy = strategy
+        self.time_limit_ms = time_limit_ms
+        # Profondeur de la dernière recherche entièrement terminée
+        self.completed_depth = 0
+        self._deadline: Optional[float] = None
+        # Progression de la recherche en cours (lisible depuis un autre thread)
+        self.current_depth = 0
+        self.nodes = 0
+        self._stop_event = threading.Event()
+        self._root_best_move: Optional[MoveType] = None
+        # Conservée d'un coup à l'autre : les positions déjà vues ne sont pas recherchées à nouveau
+        self.tt_size_power = tt_size_power
+        self.tt = TranspositionTable(tt_size_power)
+        self._parallel = ParallelRootSearch(workers) if workers > 1 else None
+        if batch and not batch_eval.is_available():
+            raise ImportError("Le mode batch nécessite NumPy (pip install numpy).")
+        self.batch = batch
+        self.pvs = pvs
+        self.opening_book = opening_book if opening_book is not None and opening_book.strategy == strategy else None
+        self.aspiration_window = aspiration_window
+        self.orderer: Optional[MoveOrderer] = MoveOrderer() if move_ordering else None
+        # Profondeur de l'itération en cours (le niveau d'un nœud est _root_depth - depth)
+        self._root_depth = depth
+        # Instrumentation optionnelle : sans elle, la recherche ne paie qu'un test `is None`
+        self.stats: Optional[SearchStats] = SearchStats() if stats else None
+        self.endgame_mode = endgame_mode
+        self.eval_cache = eval_cache
+        if wall_window not in WALL_WINDOWS:
+            raise ValueError(f"Fenêtre de murs inconnue : {wall_window!r}")
+        self.wall_window = wall_window
+        self.window_width = DEFAULT_WINDOW_WIDTH[wall_window] if window_width is None else window_width
+        if self.window_width < 1:
+            raise ValueError(f"Largeur de fenêtre invalide : {self.window_width}")
+        # Phase de jeu de la dernière recherche (générateur et évaluation en dépendent)
+        self.phase: Optional[str] = None
+        # Table de la course en cours, réutilisée tant que les murs ne changent pas
+        self._race: Optional[endgame.RaceSolver] = None
+        # Ensemble de murs candidats de la phase courante ("path:1", "box:2" ou "endgame")
+        self.candidate_set = ""
+        self._set_phase(endgame.MIDDLEGAME)
+
+    def _set_phase(self, phase: str) -> None:
+        """
+        Choisit le générateur de coups et la fonction d'évaluation de la phase de jeu.
+        Les scores des deux évaluations n'étant pas comparables, la table de transposition
+        est vidée à chaque changement de phase.
+
+        Args:
+            phase (str): endgame.MIDDLEGAME ou endgame.ONE_SIDED (RACE est résolue sans recherche).
+        """
+        if phase == self.phase:
+            return
+        if self.phase is not None:
+            self.tt.clear()
+        self.phase = phase
+        if phase == endgame.MIDDLEGAME:
+            window = {"window": self.wall_window, "width": self.window_width}
+            generate = partial(batch_eval.get_optimized_moves_batch if self.batch else get_optimized_moves, **window)
+            walls = partial(batch_eval.candidate_walls_batch if self.batch else candidate_walls, **window)
+            evaluate = evaluate_board
+            self.candidate_set = f"{self.wall_window}:{self.window_width}"
+        else:
+            generate = endgame.endgame_moves
+            walls = endgame.endgame_walls
+            evaluate = endgame.race_evaluate
+            self.candidate_set = "endgame"
+        # Les feuilles ne sont évaluées par lots qu'avec l'évaluation de milieu de partie
+        self._batch_leaves = self.batch and phase == endgame.MIDDLEGAME
+        if self.eval_cache is not None:
+            evaluate = self.eval_cache.wrap(evaluate, None if phase == endgame.MIDDLEGAME else "race")
+        if self.stats is not None:
+            generate = self.stats.timed_moves(generate)
+            walls = self.stats.counted_walls(walls, self.candidate_set)
+            evaluate = self.stats.timed_evaluate(evaluate)
+        # Liste complète (racine, feuilles par lots) ou murs seuls (génération par étapes)
+        self._generate_moves = generate
+        self._generate_walls = walls
+        self._evaluate = evaluate
+
+    def close(self) -> None:
+        """Libère les processus de calcul éventuels (recherche parallèle)."""
+        if self._parallel is not None:
+            self._parallel.shutdown()
+
+    def stop(self) -> None:
+        """
+        Demande l'arrêt de la recherche en cours (appelable depuis un autre thread) :
+        get_best_move renvoie alors le meilleur coup trouvé jusque-là.
+        """
+        self._stop_event.set()
+
+    def clear_stop(self) -> None:
+        """
+        Efface un arrêt demandé hors recherche. À appeler depuis le thread qui lance la
+        recherche, avant de la démarrer : un stop() arrivé ensuite n'est jamais perdu.
+        """
+        self._stop_event.clear()
+
+    def _order_moves(self, board: QuoridorBoard, moves: List[MoveType], player_id: int, depth: int,
+                     hash_move: Optional[MoveType]) -> List[MoveType]:
+        """
+        Ordonne les coups d'un nœud (voir MoveOrderer). Sans ordonnancement, seul le meilleur
+        coup mémorisé dans la table de transposition est placé en tête de liste.
+        """
+        if self.orderer is not None:
+            return self.orderer.order(board, moves, player_id, self._root_depth - depth, depth, hash_move)
+        if hash_move is not None and hash_move in moves:
+            moves.remove(hash_move)
+            moves.insert(0, hash_move)
+        return moves
+
+    def _staged_moves(self, board: QuoridorBoard, player_id: int, depth: int,
+                      hash_move: Optional[MoveType]) -> Iterator[MoveType]:
+        """
+        Coups d'un nœud intérieur, produits à la demande (voir MoveOrderer.staged) : si le coup
+        de la table ou un déplacement provoque une coupure, les murs ne sont jamais générés.
+        """
+        pawns = lambda: board.get_legal_pawn_moves(player_id)
+        walls = lambda: self._generate_walls(board, player_id)
+        if self.orderer is not None:
+            moves = self.orderer.staged(board, player_id, self._root_depth - depth, depth, hash_move, pawns, walls)
+        else:
+            moves = self._unordered_moves(hash_move, pawns, walls)
+        if self.stats is not None:
+            moves = self.stats.timed_stages(moves)
+        return moves
+
+    @staticmethod
+    def _unordered_moves(hash_move: Optional[MoveType], pawns: Callable, walls: Callable) -> Iterator[MoveType]:
+        """Sans ordonnancement : coup de la table, puis déplacements, puis murs."""
+        if hash_move is not None:
+            yield hash_move
+        for move in [("MOVE", pos) for pos in pawns()] + [("WALL", wall) for wall in walls()]:
+            if move != hash_move:
+                yield move
 
-    def alpha_beta(self, board: QuoridorBoard, depth: int, alpha: float,
-                   beta: float, maximizing_player: bool) -> float:
+    def negamax(self, board: QuoridorBoard, depth: int, alpha: float, beta: float) -> float:
         """
-        Algorithme de recherche avec élagage pour optimiser le temps de calcul.
+        Recherche Alpha-Bêta sous forme negamax : le score est toujours donné du point de vue
+        du joueur qui a le trait. Les évaluations étant antisymétriques
+        (eval(J1) = -eval(J2)), une seule branche sert aux deux joueurs.
 
         Args:
             board (QuoridorBoard): État simulé du plateau.
-            depth (int): Profondeur actuelle.
-            alpha (float): Meilleur score garanti pour MAX.
-            beta (float): Meilleur score garanti pour MIN.
-            maximizing_player (bool): True si c'est le tour de l'IA.
+            depth (int): Profondeur restante.
+            alpha (float): Score déjà garanti au joueur qui a le trait.
+            beta (float): Score au-delà duquel l'adversaire évitera cette position.
 
         Returns:
-            float: Score de l'évaluation.
+            float: Score de la position pour le joueur qui a le trait.
         """
+        self.nodes += 1
+        current_player = board.turn
         if depth == 0 or board.winner is not None:
-            return evaluate_board(board, self.player_id, self.strategy)
+            return self._evaluate(board, current_player, self.strategy)
+        self._check_time()
 
-        current_player = self.player_id if maximizing_player else (3 - self.player_id)
-        moves = get_optimized_moves(board, current_player)
-
-        if maximizing_player:
-            value = -math.inf
-            for type, data in moves:
-                new_board = board.copy()
-                if type == "MOVE":
-                    new_board.move_pawn(current_player, data)
+        # Table de transposition : seules les entrées calculées à la même profondeur
+        # sont utilisées pour couper, le score reste donc celui d'un alpha-bêta classique.
+        key = board.zobrist
+        entry = self.tt.probe(key)
+        hash_move = None
+        if entry is not None:
+            hash_move = entry.best_move
+            if entry.depth == depth:
+                if entry.flag == EXACT:
+                    return entry.score
+                if entry.flag == LOWER_BOUND:
+                    alpha = max(alpha, entry.score)
                 else:
-                    new_board.place_wall(current_player, *data)
+                    beta = min(beta, entry.score)
+                if alpha >= beta:
+                    return entry.score
+        alpha_start, beta_start = alpha, beta
+
+        best_move = None
+        stats = self.stats
 
-                value = max(value, self.alpha_beta(new_board, depth - 1, alpha, beta, False))
-                alpha = max(alpha, value)
-                if alpha >= beta: break
+        if depth == 1 and self._batch_leaves:
+            # Tous les fils sont des feuilles : évaluation vectorisée en une fois
+            moves = self._generate_moves(board, current_player)
+            if stats is not None:
+                start = time.perf_counter()
+            scores = batch_eval.evaluate_children(board, current_player, moves, current_player, self.strategy)
+            if stats is not None:
+                stats.eval_time += time.perf_counter() - start
+                stats.leaf_evals += len(moves)
+            value = -math.inf
+            for move, score in zip(moves, scores):
+                if score is None:
+                    continue  # Mur refusé (il enfermerait un joueur)
+                if best_move is None or score > value:
+                    value, best_move = score, move
+            if best_move is None:
+                return self._evaluate(board, current_player, self.strategy)
+            self.tt.store(key, depth, value, EXACT, best_move)
             return value
+
+        # Les coups sont produits par étapes, joués puis annulés sur le même plateau (pas de copie)
+        value = -math.inf
+        for index, move in enumerate(self._staged_moves(board, current_player, depth, hash_move)):
+            token = self._make(board, move, current_player)
+            if token is None:
+                continue  # Mur refusé (il enfermerait un joueur)
+
+            try:
+                score = self._search_child(board, depth - 1, alpha, beta, best_move is None)
+            finally:
+                self._unmake(board, token)
+            if score > value:
+                value, best_move = score, move
+            alpha = max(alpha, value)
+            if alpha >= beta:
+                if stats is not None:
+                    stats.record_cutoff(index)
+                if self.orderer is not None:
+                    self.orderer.record_cutoff(move, self._root_depth - depth, depth)
+                break
+
+        if best_move is None:
+            # Aucun coup jouable : on évalue la position telle quelle
+            return self._evaluate(board, current_player, self.strategy)
+
+        if value <= alpha_start:
+            flag = UPPER_BOUND
+        elif value >= beta_start:
+            flag = LOWER_BOUND
         else:
-            value = math.inf
-            for type, data in moves:
-                new_board = board.copy()
-                if type == "MOVE":
-                    new_board.move_pawn(current_player, data)
-                else:
-                    new_board.place_wall(current_player, *data)
+            flag = EXACT
+        self.tt.store(key, depth, value, flag, best_move)
+        return value
 
-                value = min(value, self.alpha_beta(new_board, depth - 1, alpha, beta, True))
-                beta = min(beta, value)
-                if alpha >= beta: break
-            return value
+    def _search_child(self, board: QuoridorBoard, depth: int, alpha: float, beta: float, first: bool) -> float:
+        """
+        Score d'un fils (le coup vient d'être joué), du point de vue du joueur qui l'a joué.
 
-    def get_best_move(self, board: QuoridorBoard) -> Tuple[str, Union[Tuple[int, int], Tuple[int, int, str]]]:
+        En mode PVS, seul le premier fils est cherché avec la fenêtre (alpha, beta) : les
+        suivants sont d'abord testés avec une fenêtre nulle (alpha, alpha + 1), qui suffit à
+        prouver qu'ils ne font pas mieux, et ne sont recherchés entièrement que dans le cas contraire.
+
+        Args:
+            board (QuoridorBoard): Le plateau après le coup.
+            depth (int): Profondeur restante sous le fils.
+            alpha (float): Borne basse du parent.
+            beta (float): Borne haute du parent.
+            first (bool): True pour le premier coup légal du nœud.
+
+        Returns:
+            float: Le score du fils.
         """
-        Détermine le meilleur coup à jouer pour l'IA en lançant l'algorithme Alpha-Beta.
+        if first or not self.pvs:
+            return -self.negamax(board, depth, -beta, -alpha)
+        score = -self.negamax(board, depth, -alpha - 1, -alpha)
+        if alpha < score < beta:
+            score = -self.negamax(board, depth, -beta, -alpha)
+        return score
+
+    def _make(self, board: QuoridorBoard, move: MoveType, player_id: int):
+        """Joue un coup sur le plateau (apply_move), chronométré si les statistiques sont actives."""
+        if self.stats is None:
+            return board.apply_move(move, player_id)
+        start = time.perf_counter()
+        token = board.apply_move(move, player_id)
+        self.stats.make_unmake_time += time.perf_counter() - start
+        return token
+
+    def _unmake(self, board: QuoridorBoard, token) -> None:
+        """Annule un coup (undo_move), chronométré si les statistiques sont actives."""
+        if self.stats is None:
+            board.undo_move(token)
+            return
+        start = time.perf_counter()
+        board.undo_move(token)
+        self.stats.make_unmake_time += time.perf_counter() - start
+
+    def _check_time(self) -> None:
+        """
+        Interrompt la recherche si le budget de temps est dépassé ou si stop() a été appelé.
+
+        Raises:
+            SearchTimeout: Si l'échéance est atteinte.
+        """
+        if self._stop_event.is_set():
+            raise SearchTimeout()
+        if self._deadline is not None and time.perf_counter() >= self._deadline:
+            raise SearchTimeout()
+
+    def search_root(self, board: QuoridorBoard, depth: int, alpha: float = -math.inf,
+                    beta: float = math.inf) -> Tuple[Optional[MoveType], float]:
+        """
+        Recherche Alpha-Beta complète à une profondeur donnée depuis la racine.
 
         Args:
-            board (QuoridorBoard): L'état actuel du plateau.
+            board (QuoridorBoard): L'état actuel du plateau (c'est à l'IA de jouer).
+            depth (int): Profondeur de recherche.
+            alpha (float): Borne basse de la fenêtre (fenêtre d'aspiration).
+            beta (float): Borne haute de la fenêtre. Si le score obtenu sort de
+                          (alpha, beta), ce n'est qu'une borne et il faut chercher à nouveau.
 
         Returns:
-            Tuple: Le meilleur coup trouvé (ex: ("MOVE", (4, 5)) ou ("WALL", (4, 4, 'H'))).
+            Tuple[Optional[MoveType], float]: Le meilleur coup et son score.
         """
-        # On récupère les coups possibles (optimisés)
-        moves = get_optimized_moves(board, self.player_id)
+        # On récupère les coups possibles (optimisés). Le coup mémorisé (meilleur coup
+        # de l'itération précédente) est essayé en premier.
+        entry = self.tt.probe(board.zobrist)
+        hash_move = entry.best_move if entry is not None else None
+        self._root_depth = depth
+        moves = self._order_moves(board, self._generate_moves(board, self.player_id), self.player_id, depth,
+                                  hash_move)
+
+        if self._parallel is not None:
+            best_move, best_value = self._parallel.search(self, board, moves, depth)
+            if best_move is not None:
+                self.tt.store(board.zobrist, depth, best_value, EXACT, best_move)
+            return best_move, best_value
 
         best_move = None
         best_value = -math.inf
-
-        # Initialisation alpha/beta pour la racine
-        alpha = -math.inf
-        beta = math.inf
+        alpha_start = alpha
 
         # On itère sur les coups de premier niveau pour trouver lequel donne le meilleur score
-        for type, data in moves:
+        # La recherche joue et annule les coups directement sur `board`, qui est
+        # rendu dans son état d'origine à la fin (même si elle est interrompue).
+        for move in moves:
             # Simulation du coup
-            new_board = board.copy()
-            if type == "MOVE":
-                new_board.move_pawn(self.player_id, data)
-            else:
-                new_board.place_wall(self.player_id, *data)
+            token = self._make(board, move, self.player_id)
+            if token is None:
+                continue  # Mur refusé (il enfermerait un joueur)
 
-            # Appel récursif (c'est maintenant au tour de MIN de jouer, d'où False)
-            value = self.alpha_beta(new_board, self.depth - 1, alpha, beta, False)
+            # Appel récursif (c'est maintenant à l'adversaire de jouer)
+            try:
+                value = self._search_child(board, depth - 1, alpha, beta, best_move is None)
+            finally:
+                self._unmake(board, token)
 
             if value > best_value:
                 best_value = value
-                best_move = (type, data)
+                best_move = move
+                # Coup de secours si la recherche est arrêtée avant la fin de la première itération
+                if self.completed_depth == 0:
+                    self._root_best_move = move
 
             # Mise à jour de l'alpha pour l'élagage
             alpha = max(alpha, value)
+            if alpha >= beta:
+                break  # Échec haut de la fenêtre d'aspiration
+
+        if best_move is not None:
+            if best_value <= alpha_start:
+                flag = UPPER_BOUND
+            elif best_value >= beta:
+                flag = LOWER_BOUND
+            else:
+                flag = EXACT
+            self.tt.store(board.zobrist, depth, best_value, flag, best_move)
+        return best_move, best_value
+
+    def get_principal_variation(self, board: QuoridorBoard, max_length: int) -> List[MoveType]:
+        """
+        Reconstruit la variante principale en suivant les meilleurs coups de la table.
+
+        Args:
+            board (QuoridorBoard): La position de départ (non modifiée).
+            max_length (int): Nombre maximal de coups.
+
+        Returns:
+            List[MoveType]: La suite de coups attendue.
+        """
+        pv: List[MoveType] = []
+        tokens = []
+        while len(pv) < max_length and board.winner is None:
+            entry = self.tt.probe(board.zobrist)
+            if entry is None or entry.best_move is None:
+                break
+            token = board.apply_move(entry.best_move)
+            if token is None:
+                break
+            pv.append(entry.best_move)
+            tokens.append(token)
+        while tokens:
+            board.undo_move(tokens.pop())
+        return pv
+
+    def get_best_move(self, board: QuoridorBoard) -> Tuple[str, Union[Tuple[int, int], Tuple[int, int, str]]]:
+        """
+        Détermine le meilleur coup à jouer pour l'IA en lançant l'algorithme Alpha-Beta.
+
+        Sans budget de temps, la recherche se fait directement à la profondeur `depth`.
+        Avec `time_limit_ms`, on approfondit itérativement (1, 2, ..., depth) et on
+        renvoie le coup de la dernière itération terminée dans le temps imparti.
+
+        Args:
+            board (QuoridorBoard): L'état actuel du plateau.
+
+        Returns:
+            Tuple: Le meilleur coup trouvé (ex: ("MOVE", (4, 5)) ou ("WALL", (4, 4, 'H'))).
+        """
+        # C'est à l'IA de jouer : on resynchronise le trait et le hash, au cas où le
+        # plateau aurait été modifié directement (positions, murs...).
+        board.turn = self.player_id
+        board.rebuild_caches()
+        self.tt.new_search()
+        if self.orderer is not None:
+            self.orderer.new_search()
+        self.nodes = 0
+        self.completed_depth = 0
+        self._root_best_move = None
+        if self.stats is not None:
+            self.stats.reset()
+            start = time.perf_counter()
+            bfs_start = board.bfs_calls
+
+        try:
+            # Position connue du livre d'ouvertures : aucune recherche
+            if self.opening_book is not None:
+                move = self.opening_book.lookup(board)
+                if move is not None:
+                    token = board.apply_move(move, self.player_id)
+                    if token is not None:
+                        board.undo_move(token)
+                        return move
+
+            phase = endgame.game_phase(board) if self.endgame_mode else endgame.MIDDLEGAME
+            if phase == endgame.RACE:
+                return self._solve_race(board)
+            self._set_phase(phase)
+
+            if self.time_limit_ms is None:
+                self.current_depth = self.depth
+                try:
+                    best_move, _ = self.search_root(board, self.depth)
+                except SearchTimeout:
+                    # Arrêt demandé par stop() : meilleur coup racine évalué jusque-là,
+                    # ou à défaut celui d'une recherche à profondeur 1 (non interruptible)
+                    if self._root_best_move is None:
+                        self._stop_event.clear()
+                        self._root_best_move, _ = self.search_root(board, 1)
+                    return self._root_best_move
+                self.completed_depth = self.depth
+                return best_move
+            return self._iterative_deepening(board)
+        finally:
+            self._stop_event.clear()
+            if self.stats is not None:
+                self.stats.nodes = self.nodes
+                self.stats.searches = 1
+                self.stats.depth_total = self.completed_depth
+                self.stats.bfs_calls = board.bfs_calls - bfs_start
+                self.stats.total_time = time.perf_counter() - start
+
+    def _solve_race(self, board: QuoridorBoard) -> Optional[MoveType]:
+        """
+        Plus aucun mur en réserve : coup exact de la course (voir endgame.RaceSolver).
+        La table n'est calculée qu'une fois par course, les murs ne changeant plus.
+        """
+        if self._race is None or not self._race.matches(board):
+            self._race = endgame.RaceSolver(board)
+        return self._race.best_move(board)
 
-        return best_move
\ No newline at end of file
+    def _iterative_deepening(self, board: QuoridorBoard) -> Optional[MoveType]:
+        """
+        Approfondissement itératif dans le budget `time_limit_ms` (voir get_best_move).
+        """
+        start = time.perf_counter()
+        budget = self.time_limit_ms / 1000
+        best_move = None
+        score = None
+        for depth in range(1, self.depth + 1):
+            self.current_depth = depth
+            # La profondeur 1 est toujours terminée pour avoir un coup à jouer (sauf stop())
+            self._deadline = start + budget if depth > 1 else None
+            try:
+                move, score = self._aspiration_search(board, depth, score)
+            except SearchTimeout:
+                break
+            finally:
+                self._deadline = None
+            best_move = move
+            self.completed_depth = depth
+            # L'itération suivante coûte bien plus cher : inutile de la lancer
+            # s'il reste moins de la moitié du budget.
+            if time.perf_counter() - start > budget / 2:
+                break
+        return best_move if best_move is not None else self._root_best_move
+
+    def _aspiration_search(self, board: QuoridorBoard, depth: int,
+                           previous: Optional[float]) -> Tuple[Optional[MoveType], float]:
+        """
+        Recherche racine dans une fenêtre d'aspiration centrée sur le score de l'itération
+        précédente ; si le score en sort, on recommence avec la fenêtre complète.
+
+        Args:
+            board (QuoridorBoard): L'état actuel du plateau.
+            depth (int): Profondeur de recherche.
+            previous (Optional[float]): Score de l'itération précédente (None à la première).
+
+        Returns:
+            Tuple[Optional[MoveType], float]: Le meilleur coup et son score exact.
+        """
+        if self.aspiration_window is None or previous is None or self._parallel is not None:
+            return self.search_root(board, depth)
+        alpha = previous - self.aspiration_window
+        beta = previous + self.aspiration_window
+        move, score = self.search_root(board, depth, alpha, beta)
+        if alpha < score < beta:
+            return move, score
+        return self.search_root(board, depth)
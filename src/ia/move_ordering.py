@@ -0,0 +1,187 @@
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
+from src.engine.board import QuoridorBoard
+from src.ia.moves_optimization import MoveType
+
+# Nombre de coups "killer" mémorisés par niveau de l'arbre
+KILLER_SLOTS = 2
+# Profondeur restante à partir de laquelle le gain exact des murs est calculé (coup joué
+# puis annulé) ; plus bas, le sous-arbre est trop petit pour rentabiliser ce calcul.
+EXACT_GAIN_MIN_DEPTH = 2
+
+
+def path_cutting_walls(path: List[Tuple[int, int]]) -> Set[Tuple[int, int, str]]:
+    """
+    Murs coupant au moins une arête d'un chemin.
+
+    Args:
+        path (List[Tuple[int, int]]): Suite de cases voisines.
+
+    Returns:
+        Set[Tuple[int, int, str]]: Les murs (x, y, orientation) qui couperaient le chemin.
+    """
+    walls = set()
+    for (x1, y1), (x2, y2) in zip(path, path[1:]):
+        if x1 == x2:
+            # Pas vertical : murs 'H' sous la case du haut
+            y = min(y1, y2)
+            walls.add((x1, y, 'H'))
+            walls.add((x1 - 1, y, 'H'))
+        else:
+            # Pas horizontal : murs 'V' à droite de la case de gauche
+            x = min(x1, x2)
+            walls.add((x, y1, 'V'))
+            walls.add((x, y1 - 1, 'V'))
+    return walls
+
+
+class MoveOrderer:
+    """
+    Ordonne les coups pour l'Alpha-Beta : les coupures arrivent d'autant plus tôt que
+    le meilleur coup est essayé en premier.
+
+    Ordre produit, après le coup de la table de transposition :
+        1. déplacements qui avancent le long du plus court chemin ;
+        2. murs qui allongent le plus court chemin adverse (gain décroissant), ou près des
+           feuilles, simplement ceux qui coupent ce chemin ;
+        3. coups "killer" ayant provoqué une coupure au même niveau ;
+        4. le reste, trié par score d'historique.
+    """
+
+    def __init__(self) -> None:
+        # killers[ply] : derniers coups ayant provoqué une coupure à ce niveau
+        self.killers: List[List[MoveType]] = []
+        # Score d'historique : somme des depth² des coupures provoquées par chaque coup
+        self.history: Dict[MoveType, int] = {}
+
+    def new_search(self) -> None:
+        """Début d'une recherche : les killers sont oubliés, l'historique est atténué."""
+        self.killers = []
+        self.history = {move: score // 2 for move, score in self.history.items() if score > 1}
+
+    def record_cutoff(self, move: MoveType, ply: int, depth: int) -> None:
+        """
+        Mémorise un coup ayant provoqué une coupure.
+
+        Args:
+            move (MoveType): Le coup.
+            ply (int): Niveau dans l'arbre (0 = racine).
+            depth (int): Profondeur restante au nœud (pondère l'historique).
+        """
+        while len(self.killers) <= ply:
+            self.killers.append([])
+        killers = self.killers[ply]
+        if move not in killers:
+            killers.insert(0, move)
+            del killers[KILLER_SLOTS:]
+        self.history[move] = self.history.get(move, 0) + depth * depth
+
+    def order(self, board: QuoridorBoard, moves: List[MoveType], player_id: int, ply: int,
+              depth: int, hash_move: Optional[MoveType] = None) -> List[MoveType]:
+        """
+        Trie une liste de coups déjà générée du plus prometteur au moins prometteur
+        (même ordre que staged, utilisé à la racine).
+
+        Args:
+            board (QuoridorBoard): La position (rendue intacte).
+            moves (List[MoveType]): Les coups générés.
+            player_id (int): Le joueur qui joue ces coups.
+            ply (int): Niveau dans l'arbre (pour les killers).
+            depth (int): Profondeur restante au nœud.
+            hash_move (Optional[MoveType]): Coup de la table de transposition, placé en tête.
+
+        Returns:
+            List[MoveType]: Les coups réordonnés (les murs refusés, qui enfermeraient un joueur,
+                            sont écartés).
+        """
+        pawns = [data for kind, data in moves if kind == "MOVE"]
+        walls = [data for kind, data in moves if kind == "WALL"]
+        if hash_move not in moves:
+            hash_move = None
+        return list(self.staged(board, player_id, ply, depth, hash_move, lambda: pawns, lambda: walls))
+
+    def staged(self, board: QuoridorBoard, player_id: int, ply: int, depth: int, hash_move: Optional[MoveType],
+               pawn_moves: Callable[[], List[Tuple[int, int]]],
+               candidate_walls: Callable[[], List[Tuple[int, int, str]]]) -> Iterator[MoveType]:
+        """
+        Génération paresseuse par étapes : chaque étape n'est calculée que si la recherche
+        la demande, c'est-à-dire si aucun coup précédent n'a provoqué de coupure.
+
+            0. le coup de la table de transposition (sa légalité est vérifiée en le jouant) ;
+            1. déplacements qui avancent le long du plus court chemin ;
+            2. murs qui allongent le plus court chemin adverse (gain décroissant), ou près des
+               feuilles, simplement ceux qui coupent ce chemin ;
+            3. coups "killer" ;
+            4. le reste, trié par score d'historique.
+
+        Le plateau doit être dans le même état à chaque reprise du générateur (la recherche
+        annule ses coups avant de demander le suivant).
+
+        Args:
+            board (QuoridorBoard): La position.
+            player_id (int): Le joueur qui joue.
+            ply (int): Niveau dans l'arbre (pour les killers).
+            depth (int): Profondeur restante au nœud.
+            hash_move (Optional[MoveType]): Coup de la table de transposition.
+            pawn_moves (Callable): Calcule les déplacements de pion légaux.
+            candidate_walls (Callable): Calcule les murs candidats (physiquement posables).
+
+        Yields:
+            MoveType: Les coups, chacun une seule fois. Les murs candidats peuvent encore être
+                      refusés par apply_move (ils enfermeraient un joueur).
+        """
+        opp_id = 3 - player_id
+        history = self.history
+        if hash_move is not None:
+            yield hash_move
+
+        # 1. Cases du plus court chemin atteignables en un coup (pas simple ou saut)
+        ahead = board.shortest_path(player_id)[1:3]
+        pawns = pawn_moves()
+        for pos in sorted((pos for pos in pawns if pos in ahead), key=ahead.index, reverse=True):
+            move = ("MOVE", pos)
+            if move != hash_move:
+                yield move
+
+        # 2. Seuls les murs coupant un plus court chemin adverse peuvent l'allonger :
+        # le gain exact n'est calculé que pour eux.
+        walls = candidate_walls() if board.walls_count[player_id] > 0 else []
+        cutting = path_cutting_walls(board.shortest_path(opp_id)) if walls else set()
+        refused = set()
+        gains = []
+        if cutting:
+            exact = depth >= EXACT_GAIN_MIN_DEPTH
+            opp_len = board.shortest_path_len(opp_id)
+            for index, wall in enumerate(walls):
+                if wall not in cutting:
+                    continue
+                if exact:
+                    token = board.apply_move(("WALL", wall), player_id)
+                    if token is None:
+                        refused.add(wall)  # Mur refusé (il enfermerait un joueur)
+                        continue
+                    gain = board.shortest_path_len(opp_id) - opp_len
+                    board.undo_move(token)
+                else:
+                    gain = 1
+                if gain > 0:
+                    gains.append((-gain, index, wall))
+        gains.sort()
+        for _, _, wall in gains:
+            move = ("WALL", wall)
+            if move != hash_move:
+                yield move
+
+        # 3. et 4. Killers puis le reste, par historique décroissant
+        done = {wall for _, _, wall in gains} | refused
+        rest = [("MOVE", pos) for pos in pawns if pos not in ahead]
+        rest += [("WALL", wall) for wall in walls if wall not in done]
+        killers = self.killers[ply] if ply < len(self.killers) else []
+        keyed = []
+        for index, move in enumerate(rest):
+            if move == hash_move:
+                continue
+            key = (0, killers.index(move)) if move in killers else (1, -history.get(move, 0))
+            keyed.append((key, index, move))
+        keyed.sort()
+        for _, _, move in keyed:
+            yield move
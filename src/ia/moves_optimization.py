@@ -1,11 +1,19 @@
-from typing import List, Tuple, Union
+from typing import List, Optional, Set, Tuple, Union
 from src.engine.board import QuoridorBoard
 
 # Définition d'un type pour les coups : ("MOVE", (x,y)) ou ("WALL", (x,y,o))
 MoveType = Tuple[str, Union[Tuple[int, int], Tuple[int, int, str]]]
 
+# Fenêtres de murs candidats : boîte englobant les deux pions, ou voisinage des plus courts chemins
+BOX_WINDOW = "box"
+PATH_WINDOW = "path"
+WALL_WINDOWS = (BOX_WINDOW, PATH_WINDOW)
+# Largeur par défaut : marge autour des pions (boîte) ou des cases du chemin (chemins)
+DEFAULT_WINDOW_WIDTH = {BOX_WINDOW: 2, PATH_WINDOW: 1}
 
-def get_optimized_moves(board: QuoridorBoard, player_id: int) -> List[MoveType]:
+
+def get_optimized_moves(board: QuoridorBoard, player_id: int, window: str = PATH_WINDOW,
+                        width: Optional[int] = None) -> List[MoveType]:
     """
     Génère une liste priorisée et réduite de coups pour l'IA.
 
@@ -15,6 +23,8 @@ def get_optimized_moves(board: QuoridorBoard, player_id: int) -> List[MoveType]:
     Args:
         board (QuoridorBoard): L'instance actuelle du plateau.
         player_id (int): L'identifiant du joueur qui doit jouer.
+        window (str): Fenêtre des murs candidats (voir wall_window).
+        width (Optional[int]): Largeur de la fenêtre (défaut selon la fenêtre).
 
     Returns:
         List[MoveType]: Une liste de tuples décrivant les coups possibles.
@@ -28,25 +38,78 @@ def get_optimized_moves(board: QuoridorBoard, player_id: int) -> List[MoveType]:
     for pos in pawn_moves:
         moves.append(("MOVE", pos))
 
-    # 2. Ajouter les murs INTELLIGENTS (Heuristique de proximité)
-    # Si le joueur a encore des murs, on ne considère que ceux autour des joueurs.
-    if board.walls_count[player_id] > 0:
-        # On récupère les positions des deux joueurs pour définir une "zone d'intérêt"
-        p1_x, p1_y = board.positions[1]
-        p2_x, p2_y = board.positions[2]
-
-        # On définit une boîte englobante autour des joueurs + 2 cases de marge
-        min_x = max(0, min(p1_x, p2_x) - 2)
-        max_x = min(board.size - 1, max(p1_x, p2_x) + 2)
-        min_y = max(0, min(p1_y, p2_y) - 2)
-        max_y = min(board.size - 1, max(p1_y, p2_y) + 2)
-
-        for x in range(min_x, max_x):
-            for y in range(min_y, max_y):
-                for orientation in ['H', 'V']:
-                    # On ne garde que les murs physiquement posables
-                    # Note: On utilise la méthode 'privée' pour tester vite sans copier tout le plateau
-                    if board._is_wall_placement_valid((x, y, orientation)):
-                        moves.append(("WALL", (x, y, orientation)))
-
-    return moves
\ No newline at end of file
+    # 2. Ajouter les murs INTELLIGENTS (proches des chemins ou des pions)
+    for wall in candidate_walls(board, player_id, window, width):
+        moves.append(("WALL", wall))
+
+    return moves
+
+
+def wall_window(board: QuoridorBoard, window: str = PATH_WINDOW, width: Optional[int] = None) -> List[Tuple[int, int, str]]:
+    """
+    Murs candidats d'une fenêtre, sans test de validité.
+
+    - BOX_WINDOW : tous les murs d'une boîte englobant les deux pions, avec `width` cases de
+      marge. La boîte couvre presque tout le plateau quand les pions sont éloignés.
+    - PATH_WINDOW : les murs touchant une case des plus courts chemins des deux joueurs (à
+      `width` cases près), donc tous ceux qui coupent ces chemins même loin devant les pions,
+      plus ceux qui prolongent ou touchent un mur déjà posé.
+
+    Args:
+        board (QuoridorBoard): L'instance actuelle du plateau.
+        window (str): BOX_WINDOW ou PATH_WINDOW.
+        width (Optional[int]): Largeur de la fenêtre (>= 1, défaut selon la fenêtre).
+
+    Returns:
+        List[Tuple[int, int, str]]: Les murs candidats, triés.
+    """
+    if width is None:
+        width = DEFAULT_WINDOW_WIDTH[window]
+    last = board.size - 1
+    if window == BOX_WINDOW:
+        (p1_x, p1_y), (p2_x, p2_y) = board.positions[1], board.positions[2]
+        cells = [(x, y) for x in range(min(p1_x, p2_x), max(p1_x, p2_x) + 1)
+                 for y in range(min(p1_y, p2_y), max(p1_y, p2_y) + 1)]
+    else:
+        cells = set(board.shortest_path(1)) | set(board.shortest_path(2))
+
+    # Ancrages dont le mur longe une case à `width` cases près (width = 1 : ses 4 coins)
+    anchors: Set[Tuple[int, int]] = set()
+    for cx, cy in cells:
+        for x in range(max(0, cx - width), min(last, cx + width)):
+            for y in range(max(0, cy - width), min(last, cy + width)):
+                anchors.add((x, y))
+    walls = {(x, y, orientation) for x, y in anchors for orientation in ('H', 'V')}
+
+    if window == PATH_WINDOW:
+        # Murs en contact avec une extrémité d'un mur posé : prolongement ou mur perpendiculaire
+        for x, y, orientation in board.walls:
+            if orientation == 'H':
+                walls.update([(x - 2, y, 'H'), (x + 2, y, 'H')])
+                walls.update((x + dx, y + dy, 'V') for dx in (-1, 1) for dy in (-1, 0, 1))
+            else:
+                walls.update([(x, y - 2, 'V'), (x, y + 2, 'V')])
+                walls.update((x + dx, y + dy, 'H') for dx in (-1, 0, 1) for dy in (-1, 1))
+        walls = {wall for wall in walls if 0 <= wall[0] < last and 0 <= wall[1] < last}
+    return sorted(walls)
+
+
+def candidate_walls(board: QuoridorBoard, player_id: int, window: str = PATH_WINDOW,
+                    width: Optional[int] = None) -> List[Tuple[int, int, str]]:
+    """
+    Murs candidats de get_optimized_moves, seuls (pour une génération par étapes).
+
+    Args:
+        board (QuoridorBoard): L'instance actuelle du plateau.
+        player_id (int): L'identifiant du joueur qui doit jouer.
+        window (str): Fenêtre des murs candidats (voir wall_window).
+        width (Optional[int]): Largeur de la fenêtre (défaut selon la fenêtre).
+
+    Returns:
+        List[Tuple[int, int, str]]: Les murs de la fenêtre physiquement posables.
+    """
+    if board.walls_count[player_id] <= 0:
+        return []
+    # On ne garde que les murs physiquement posables
+    # Note: On utilise la méthode 'privée' pour tester vite sans copier tout le plateau
+    return [wall for wall in wall_window(board, window, width) if board._is_wall_placement_valid(wall)]
@@ -0,0 +1,178 @@
+import os
+import struct
+from collections import deque
+from typing import Dict, Optional
+from src.engine.board import QuoridorBoard, Move
+from src.engine.bitboard import BitboardQuoridorBoard
+
+# Fichier par défaut (généré hors ligne, voir build_opening_book)
+DEFAULT_BOOK_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "data",
+                                 "opening_book.bin")
+
+# En-tête : signature, version, profondeur de recherche, stratégie, nombre d'entrées
+_MAGIC = b"QOB1"
+_HEADER = struct.Struct("<4sBBBxI")
+# Entrée : hash Zobrist (64 bits) et coup encodé (16 bits)
+_ENTRY = struct.Struct("<QH")
+_STRATEGIES = ["simple", "advanced"]
+
+
+def encode_move(move: Move) -> int:
+    """
+    Encode un coup sur 16 bits : case (y * 9 + x) pour un déplacement,
+    0x100 | orientation << 6 | (y * 8 + x) pour un mur.
+
+    Args:
+        move (Move): Le coup.
+
+    Returns:
+        int: Le coup encodé.
+    """
+    kind, data = move
+    if kind == "MOVE":
+        x, y = data
+        return y * 9 + x
+    x, y, orientation = data
+    return 0x100 | (orientation == 'V') << 6 | (y * 8 + x)
+
+
+def decode_move(code: int) -> Move:
+    """
+    Décode un coup encodé par encode_move.
+
+    Args:
+        code (int): Le coup encodé.
+
+    Returns:
+        Move: Le coup.
+    """
+    if code & 0x100:
+        anchor = code & 0x3F
+        return ("WALL", (anchor % 8, anchor // 8, 'V' if code & 0x40 else 'H'))
+    return ("MOVE", (code % 9, code // 9))
+
+
+class OpeningBook:
+    """
+    Livre d'ouvertures : meilleur coup précalculé pour chaque position connue,
+    indexé par le hash Zobrist de la position (graine fixe, stable d'une exécution à l'autre).
+    """
+
+    def __init__(self, depth: int, strategy: str, entries: Optional[Dict[int, Move]] = None) -> None:
+        """
+        Args:
+            depth (int): Profondeur des recherches ayant produit le livre.
+            strategy (str): Stratégie d'évaluation utilisée ("simple" ou "advanced").
+            entries (Optional[Dict[int, Move]]): Coups par hash de position.
+        """
+        self.depth = depth
+        self.strategy = strategy
+        self.entries: Dict[int, Move] = entries if entries is not None else {}
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def lookup(self, board: QuoridorBoard) -> Optional[Move]:
+        """
+        Cherche la position dans le livre (le hash doit être à jour, trait compris).
+
+        Args:
+            board (QuoridorBoard): La position courante.
+
+        Returns:
+            Optional[Move]: Le coup du livre, None si la position est inconnue.
+        """
+        return self.entries.get(board.zobrist)
+
+    def save(self, path: str = DEFAULT_BOOK_PATH) -> None:
+        """
+        Écrit le livre au format binaire (10 octets par position).
+
+        Args:
+            path (str): Chemin du fichier.
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, 1, self.depth, _STRATEGIES.index(self.strategy), len(self.entries)))
+            for key in sorted(self.entries):
+                f.write(_ENTRY.pack(key, encode_move(self.entries[key])))
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_BOOK_PATH) -> Optional['OpeningBook']:
+        """
+        Charge un livre écrit par save.
+
+        Args:
+            path (str): Chemin du fichier.
+
+        Returns:
+            Optional[OpeningBook]: Le livre, ou None si le fichier n'existe pas.
+
+        Raises:
+            ValueError: Si le fichier n'est pas un livre d'ouvertures.
+        """
+        if not os.path.exists(path):
+            return None
+        with open(path, "rb") as f:
+            data = f.read()
+        if len(data) < _HEADER.size:
+            raise ValueError(f"Livre d'ouvertures invalide : {path}")
+        magic, version, depth, strategy, count = _HEADER.unpack_from(data)
+        if magic != _MAGIC or version != 1 or strategy >= len(_STRATEGIES) \
+                or len(data) != _HEADER.size + count * _ENTRY.size:
+            raise ValueError(f"Livre d'ouvertures invalide : {path}")
+        entries = {key: decode_move(code) for key, code in _ENTRY.iter_unpack(data[_HEADER.size:])}
+        return cls(depth, _STRATEGIES[strategy], entries)
+
+
+def build_opening_book(depth: int = 4, plies: int = 4, strategy: str = "advanced",
+                       verbose: bool = False) -> OpeningBook:
+    """
+    Construit un livre par auto-apprentissage hors ligne : chaque position atteinte dans les
+    `plies` premiers demi-coups est cherchée à profondeur `depth`. Pour couvrir les écarts de
+    l'adversaire, tous les déplacements de pion sont explorés (les murs sortent du livre).
+
+    Args:
+        depth (int): Profondeur de recherche pour chaque position.
+        plies (int): Nombre de demi-coups couverts depuis la position initiale.
+        strategy (str): Stratégie d'évaluation.
+        verbose (bool): Affiche la progression.
+
+    Returns:
+        OpeningBook: Le livre construit.
+    """
+    # Import tardif : minimax importe ce module
+    from src.ia.minimax import QuoridorIA
+
+    ias = {pid: QuoridorIA(pid, depth, strategy) for pid in (1, 2)}
+    book = OpeningBook(depth, strategy)
+    # Représentation rapide : les hash Zobrist sont identiques à ceux de QuoridorBoard
+    queue = deque([(BitboardQuoridorBoard(), 0)])
+    while queue:
+        board, ply = queue.popleft()
+        if board.zobrist in book.entries or board.winner is not None:
+            continue
+        player = board.turn
+        move = ias[player].get_best_move(board)
+        if move is None:
+            continue
+        book.entries[board.zobrist] = move
+        if verbose:
+            print(f"   {len(book)} positions (demi-coup {ply})...", end="\r")
+        if ply + 1 >= plies:
+            continue
+        children = [("MOVE", pos) for pos in board.get_legal_pawn_moves(player)]
+        if move not in children:
+            children.append(move)
+        for child in children:
+            next_board = board.copy()
+            if next_board.apply_move(child, player) is not None:
+                queue.append((next_board, ply + 1))
+    return book
+
+
+if __name__ == "__main__":
+    # Génération du livre utilisé par défaut par l'interface et le serveur (option pour les tournois)
+    opening_book = build_opening_book(depth=4, plies=4, verbose=True)
+    opening_book.save()
+    print(f"\n📖 Livre d'ouvertures : {len(opening_book)} positions -> {DEFAULT_BOOK_PATH}")
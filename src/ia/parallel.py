@@ -0,0 +1,179 @@
+import math
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor, wait
+from typing import Dict, List, Optional, Tuple
+from src.engine.board import QuoridorBoard, Move
+from src.ia.eval_cache import EvaluationCache
+
+# Nombre maximal de coups racine (5 déplacements + 128 murs au plus)
+MAX_ROOT_MOVES = 256
+
+# État propre à chaque processus de calcul : bornes et demande d'arrêt partagées, IA
+# réutilisées d'une tâche à l'autre (leur table de transposition reste chaude).
+_shared_alphas = None
+_shared_stop = None
+_worker_ias: Dict[tuple, object] = {}
+
+
+def _init_worker(shared_alphas, shared_stop) -> None:
+    global _shared_alphas, _shared_stop
+    _shared_alphas = shared_alphas
+    _shared_stop = shared_stop
+
+
+class _SharedStop:
+    """
+    Remplace l'Event d'arrêt des IA d'un processus de calcul : la demande d'arrêt du
+    processus principal est lue dans la mémoire partagée.
+    """
+
+    def is_set(self) -> bool:
+        return bool(_shared_stop.value)
+
+
+def _search_root_move(state: bytes, board_cls: type, player_id: int, strategy: str, tt_size_power: int,
+                      batch: bool, depth: int, move: Move, index: int,
+                      deadline: Optional[float], phase: str, wall_window: str, window_width: int,
+                      pvs: bool, move_ordering: bool, eval_cache_size: Optional[int]) -> Optional[float]:
+    """
+    Tâche exécutée dans un processus : évalue un coup racine.
+
+    La borne alpha utilisée est la meilleure valeur déjà obtenue par les coups qui
+    précèdent `index` dans l'ordre de la racine, ce qui garantit le même choix final
+    qu'une recherche séquentielle. L'IA du processus reprend les réglages de l'IA appelante ;
+    son cache d'évaluations (eval_cache_size entrées) est propre au processus.
+
+    Returns:
+        Optional[float]: Le score du coup, ou None s'il est illégal.
+    """
+    # Import tardif : minimax importe ce module
+    from src.ia.minimax import QuoridorIA
+
+    key = (player_id, strategy, tt_size_power, batch, wall_window, window_width, pvs, move_ordering,
+           eval_cache_size)
+    ia = _worker_ias.get(key)
+    if ia is None:
+        ia = _worker_ias[key] = QuoridorIA(
+            player_id, depth, strategy, tt_size_power, batch=batch, move_ordering=move_ordering, pvs=pvs,
+            eval_cache=EvaluationCache(eval_cache_size) if eval_cache_size is not None else None,
+            wall_window=wall_window, window_width=window_width)
+        ia._stop_event = _SharedStop()
+    ia.tt.new_search()
+    ia._set_phase(phase)
+
+    board = board_cls.from_bytes(state)
+    token = board.apply_move(move, player_id)
+    if token is None:
+        return None
+
+    ia._root_depth = depth
+    alpha = max(_shared_alphas[:index])
+    if deadline is not None:
+        ia._deadline = time.perf_counter() + (deadline - time.time())
+    try:
+        value = -ia.negamax(board, depth - 1, -math.inf, -alpha)
+    finally:
+        ia._deadline = None
+    _shared_alphas[index] = value
+    return value
+
+
+class ParallelRootSearch:
+    """
+    Répartit les coups de la racine sur un pool de processus (schéma "Young Brothers Wait") :
+    le premier coup est cherché localement pour obtenir une borne alpha, puis les coups
+    suivants sont distribués aux processus, qui partagent les scores obtenus.
+    """
+
+    def __init__(self, workers: int) -> None:
+        """
+        Args:
+            workers (int): Nombre de processus de calcul.
+        """
+        self.workers = workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._alphas = None
+        self._stop = None
+
+    def _ensure_pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._alphas = multiprocessing.RawArray('d', MAX_ROOT_MOVES)
+            self._stop = multiprocessing.RawValue('b', 0)
+            self._executor = ProcessPoolExecutor(self.workers, initializer=_init_worker,
+                                                 initargs=(self._alphas, self._stop))
+        return self._executor
+
+    def shutdown(self) -> None:
+        """Arrête les processus de calcul."""
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+    def search(self, ia, board: QuoridorBoard, moves: List[Move], depth: int) -> Tuple[Optional[Move], float]:
+        """
+        Recherche parallèle de la racine.
+
+        Args:
+            ia (QuoridorIA): L'IA qui cherche (joueur, stratégie, table de transposition).
+            board (QuoridorBoard): Le plateau courant (c'est à l'IA de jouer).
+            moves (List[Move]): Les coups racine, dans l'ordre de recherche.
+            depth (int): Profondeur de recherche.
+
+        Returns:
+            Tuple[Optional[Move], float]: Le meilleur coup et son score.
+        """
+        executor = self._ensure_pool()
+
+        # 1. Le fils aîné est cherché localement pour obtenir une première borne
+        best_move = None
+        best_value = -math.inf
+        remaining = list(moves)
+        while remaining and best_move is None:
+            move = remaining.pop(0)
+            token = board.apply_move(move, ia.player_id)
+            if token is None:
+                continue
+            try:
+                best_value = -ia.negamax(board, depth - 1, -math.inf, math.inf)
+            finally:
+                board.undo_move(token)
+            best_move = move
+        if best_move is not None and ia.completed_depth == 0:
+            # Coup de secours si la recherche est arrêtée avant la fin de la première itération
+            ia._root_best_move = best_move
+        if not remaining:
+            return best_move, best_value
+
+        # 2. Les frères sont distribués (dans l'ordre) avec les bornes partagées
+        remaining = remaining[:MAX_ROOT_MOVES - 1]
+        self._alphas[0] = best_value
+        for i in range(1, len(remaining) + 1):
+            self._alphas[i] = -math.inf
+
+        deadline = None
+        if ia._deadline is not None:
+            deadline = time.time() + (ia._deadline - time.perf_counter())
+        state = board.to_bytes()
+        self._stop.value = 0
+        futures = [executor.submit(_search_root_move, state, type(board), ia.player_id, ia.strategy,
+                                   ia.tt_size_power, ia.batch, depth, move, i + 1, deadline, ia.phase,
+                                   ia.wall_window, ia.window_width, ia.pvs, ia.orderer is not None,
+                                   ia.eval_cache.max_entries if ia.eval_cache is not None else None)
+                   for i, move in enumerate(remaining)]
+        try:
+            for future, move in zip(futures, remaining):
+                value = future.result()
+                if value is not None and value > best_value:
+                    best_value = value
+                    best_move = move
+                ia._check_time()  # Arrêt demandé (stop()) pendant que les processus calculent
+        except BaseException:
+            # Les tâches déjà lancées s'arrêtent à la demande et sont attendues : aucune
+            # ne doit écrire de borne pendant la recherche suivante.
+            self._stop.value = 1
+            for future in futures:
+                future.cancel()
+            wait(futures)
+            raise
+        return best_move, best_value
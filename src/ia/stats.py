@@ -0,0 +1,208 @@
+import time
+from typing import Callable, Dict, Iterator, List
+
+
+class SearchStats:
+    """
+    Compteurs d'une recherche (activés avec QuoridorIA(stats=True)).
+
+    Les temps sont mesurés avec time.perf_counter, en secondes. Le temps de "jeu/annulation"
+    correspond à apply_move + undo_move (la recherche ne copie plus le plateau).
+    """
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        """Remet tous les compteurs à zéro (appelé au début de chaque get_best_move)."""
+        self.nodes = 0
+        self.leaf_evals = 0
+        # Nombre de coupures beta selon le rang du coup qui les provoque (0 = premier coup)
+        self.cutoffs: Dict[int, int] = {}
+        # Nombre de recherches cumulées (1 coup = 1 recherche) et somme de leurs profondeurs
+        self.searches = 0
+        self.depth_total = 0
+        self.bfs_calls = 0
+        # Générations de murs candidats par ensemble utilisé ("path:1", "box:2", "endgame")
+        self.wall_sets: Dict[str, int] = {}
+        self.wall_candidates = 0
+        self.movegen_time = 0.0
+        self.eval_time = 0.0
+        self.make_unmake_time = 0.0
+        self.total_time = 0.0
+
+    def timed_moves(self, generate: Callable) -> Callable:
+        """
+        Enveloppe un générateur de coups pour mesurer son temps d'exécution.
+
+        Args:
+            generate (Callable): get_optimized_moves ou une fonction de même signature.
+
+        Returns:
+            Callable: La fonction instrumentée.
+        """
+        def wrapper(board, player_id):
+            start = time.perf_counter()
+            moves = generate(board, player_id)
+            self.movegen_time += time.perf_counter() - start
+            return moves
+        return wrapper
+
+    def counted_walls(self, generate: Callable, candidate_set: str) -> Callable:
+        """
+        Enveloppe un générateur de murs candidats pour compter les murs produits et
+        l'ensemble de candidats utilisé. Son temps est compté par timed_stages, qui
+        englobe chacun de ses appels.
+
+        Args:
+            generate (Callable): candidate_walls ou une fonction de même signature.
+            candidate_set (str): Nom de l'ensemble de candidats (fenêtre et largeur).
+
+        Returns:
+            Callable: La fonction instrumentée.
+        """
+        def wrapper(board, player_id):
+            walls = generate(board, player_id)
+            self.wall_sets[candidate_set] = self.wall_sets.get(candidate_set, 0) + 1
+            self.wall_candidates += len(walls)
+            return walls
+        return wrapper
+
+    def timed_stages(self, moves: Iterator) -> Iterator:
+        """
+        Enveloppe une génération par étapes (MoveOrderer.staged) : le temps passé à produire
+        chaque coup (déplacements, murs candidats, tri par gain exact) compte comme génération.
+
+        Args:
+            moves (Iterator): Les coups produits à la demande.
+
+        Returns:
+            Iterator: Les mêmes coups.
+        """
+        while True:
+            start = time.perf_counter()
+            move = next(moves, None)
+            self.movegen_time += time.perf_counter() - start
+            if move is None:
+                return
+            yield move
+
+    def timed_evaluate(self, evaluate: Callable) -> Callable:
+        """
+        Enveloppe la fonction d'évaluation pour compter les feuilles et mesurer leur coût.
+
+        Args:
+            evaluate (Callable): evaluate_board ou une fonction de même signature.
+
+        Returns:
+            Callable: La fonction instrumentée.
+        """
+        def wrapper(board, player_id, strategy):
+            start = time.perf_counter()
+            score = evaluate(board, player_id, strategy)
+            self.eval_time += time.perf_counter() - start
+            self.leaf_evals += 1
+            return score
+        return wrapper
+
+    def record_cutoff(self, index: int) -> None:
+        """
+        Enregistre une coupure beta.
+
+        Args:
+            index (int): Rang du coup ayant provoqué la coupure dans la liste ordonnée.
+        """
+        self.cutoffs[index] = self.cutoffs.get(index, 0) + 1
+
+    @property
+    def total_cutoffs(self) -> int:
+        return sum(self.cutoffs.values())
+
+    @property
+    def first_move_cutoff_rate(self) -> float:
+        """Part des coupures obtenues dès le premier coup (qualité de l'ordonnancement)."""
+        total = self.total_cutoffs
+        return self.cutoffs.get(0, 0) / total if total else 0.0
+
+    @property
+    def effective_branching_factor(self) -> float:
+        """Facteur de branchement effectif : (nœuds par recherche) ** (1 / profondeur moyenne)."""
+        if self.searches == 0 or self.depth_total == 0 or self.nodes == 0:
+            return 0.0
+        return (self.nodes / self.searches) ** (self.searches / self.depth_total)
+
+    @property
+    def walls_per_generation(self) -> float:
+        """Nombre moyen de murs candidats par génération (facteur de branchement des murs)."""
+        generations = sum(self.wall_sets.values())
+        return self.wall_candidates / generations if generations else 0.0
+
+    @property
+    def bfs_per_move(self) -> float:
+        """Nombre moyen de calculs de plus court chemin (BFS) par recherche."""
+        return self.bfs_calls / self.searches if self.searches else 0.0
+
+    def cutoff_histogram(self, size: int = 4) -> List[int]:
+        """
+        Coupures par rang de coup, les rangs >= size - 1 étant regroupés dans la dernière case.
+
+        Args:
+            size (int): Nombre de cases.
+
+        Returns:
+            List[int]: Nombre de coupures par rang.
+        """
+        histogram = [0] * size
+        for index, count in self.cutoffs.items():
+            histogram[min(index, size - 1)] += count
+        return histogram
+
+    def merge(self, other: 'SearchStats') -> None:
+        """
+        Ajoute les compteurs d'une autre recherche (cumul sur une partie).
+
+        Args:
+            other (SearchStats): Les statistiques à ajouter.
+        """
+        self.nodes += other.nodes
+        self.leaf_evals += other.leaf_evals
+        for index, count in other.cutoffs.items():
+            self.cutoffs[index] = self.cutoffs.get(index, 0) + count
+        self.searches += other.searches
+        self.depth_total += other.depth_total
+        self.bfs_calls += other.bfs_calls
+        for name, count in other.wall_sets.items():
+            self.wall_sets[name] = self.wall_sets.get(name, 0) + count
+        self.wall_candidates += other.wall_candidates
+        self.movegen_time += other.movegen_time
+        self.eval_time += other.eval_time
+        self.make_unmake_time += other.make_unmake_time
+        self.total_time += other.total_time
+
+    def as_dict(self) -> Dict[str, float]:
+        """
+        Résumé à plat des compteurs (une valeur par colonne de CSV, voir STATS_FIELDS).
+
+        Returns:
+            Dict[str, float]: Les statistiques.
+        """
+        return {
+            "nodes": self.nodes,
+            "leaf_evals": self.leaf_evals,
+            "cutoffs": self.total_cutoffs,
+            "cutoff_hist": "/".join(str(count) for count in self.cutoff_histogram()),
+            "first_move_cutoff_rate": round(self.first_move_cutoff_rate, 4),
+            "ebf": round(self.effective_branching_factor, 3),
+            "bfs_per_move": round(self.bfs_per_move, 1),
+            "wall_sets": "/".join(f"{name}={count}" for name, count in sorted(self.wall_sets.items())),
+            "walls_per_gen": round(self.walls_per_generation, 1),
+            "movegen_time": round(self.movegen_time, 4),
+            "eval_time": round(self.eval_time, 4),
+            "make_unmake_time": round(self.make_unmake_time, 4),
+            "search_time": round(self.total_time, 4),
+        }
+
+
+# Clés de SearchStats.as_dict, dans l'ordre des colonnes
+STATS_FIELDS = ["nodes", "leaf_evals", "cutoffs", "cutoff_hist", "first_move_cutoff_rate", "ebf", "bfs_per_move",
+                "wall_sets", "walls_per_gen", "movegen_time", "eval_time", "make_unmake_time", "search_time"]
@@ -0,0 +1,78 @@
+from typing import List, NamedTuple, Optional
+from src.engine.board import Move
+
+# Types de borne stockés avec un score
+EXACT = 0
+LOWER_BOUND = 1  # Le vrai score est >= score (coupure beta)
+UPPER_BOUND = 2  # Le vrai score est <= score (aucun coup n'a dépassé alpha)
+
+
+class TTEntry(NamedTuple):
+    """Résultat d'une recherche mémorisé pour une position."""
+    key: int
+    depth: int
+    score: float
+    flag: int
+    best_move: Optional[Move]
+    generation: int
+
+
+class TranspositionTable:
+    """
+    Table de transposition de taille fixe indexée par le hash Zobrist du plateau.
+
+    Politique de remplacement : une case est écrasée si elle est vide, si elle contient
+    la même position, si elle date d'une recherche précédente, ou si la nouvelle entrée
+    a été calculée à une profondeur au moins égale.
+    """
+
+    def __init__(self, size_power: int = 18) -> None:
+        """
+        Args:
+            size_power (int): La table contient 2**size_power entrées.
+        """
+        self.size = 1 << size_power
+        self._mask = self.size - 1
+        self._entries: List[Optional[TTEntry]] = [None] * self.size
+        self.generation = 0
+
+    def new_search(self) -> None:
+        """Marque le début d'une nouvelle recherche (les anciennes entrées deviennent remplaçables)."""
+        self.generation += 1
+
+    def clear(self) -> None:
+        """Vide entièrement la table."""
+        self._entries = [None] * self.size
+        self.generation = 0
+
+    def probe(self, key: int) -> Optional[TTEntry]:
+        """
+        Cherche une position dans la table.
+
+        Args:
+            key (int): Hash Zobrist de la position.
+
+        Returns:
+            Optional[TTEntry]: L'entrée si la position est connue, None sinon.
+        """
+        entry = self._entries[key & self._mask]
+        if entry is not None and entry.key == key:
+            return entry
+        return None
+
+    def store(self, key: int, depth: int, score: float, flag: int, best_move: Optional[Move]) -> None:
+        """
+        Mémorise le résultat d'une recherche selon la politique de remplacement.
+
+        Args:
+            key (int): Hash Zobrist de la position.
+            depth (int): Profondeur restante de la recherche.
+            score (float): Score obtenu.
+            flag (int): EXACT, LOWER_BOUND ou UPPER_BOUND.
+            best_move (Optional[Move]): Meilleur coup trouvé (pour l'ordonnancement).
+        """
+        index = key & self._mask
+        old = self._entries[index]
+        if (old is None or old.key == key or old.generation != self.generation
+                or depth >= old.depth):
+            self._entries[index] = TTEntry(key, depth, score, flag, best_move, self.generation)
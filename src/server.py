@@ -0,0 +1,255 @@
+import sys
+import threading
+import time
+from typing import Dict, List, Optional, TextIO
+from src.engine.board import Move
+from src.engine.bitboard import BitboardQuoridorBoard
+from src.engine.notation import move_to_text, text_to_move
+from src.ia.minimax import QuoridorIA
+from src.ia.opening_book import OpeningBook
+
+ENGINE_NAME = "Quoridor IA"
+# Profondeur maximale quand seule une limite de temps est donnée (go movetime)
+MAX_DEPTH = 50
+
+# Options réglables par setoption : (type, défaut, min, max)
+OPTIONS = {
+    "Depth": ("spin", 3, 1, MAX_DEPTH),
+    "Strategy": ("combo", "advanced", None, None),
+    "Hash": ("spin", 18, 10, 24),
+    "Workers": ("spin", 1, 1, 64),
+    "PVS": ("check", False, None, None),
+    "OwnBook": ("check", True, None, None),
+    "Endgame": ("check", True, None, None),
+}
+STRATEGIES = ["simple", "advanced"]
+
+
+class EngineServer:
+    """
+    Moteur sans interface piloté par un protocole texte ligne à ligne, inspiré d'UCI :
+
+        uci                                   -> id, options, uciok
+        isready                               -> readyok
+        setoption name <nom> value <valeur>
+        ucinewgame                            (oublie les tables de l'IA)
+        position startpos [moves e2 e8 e3h ...]
+        go [depth N] [movetime MS]            -> info ..., puis bestmove <coup>
+        stop                                  (joue le meilleur coup trouvé jusque-là)
+        quit
+
+    Les coups sont en notation texte (voir src/engine/notation.py). Les IA (une par joueur)
+    sont conservées d'un coup à l'autre : tables de transposition et historique restent chauds.
+    La recherche tourne dans un thread pour que stop et isready restent traités.
+    """
+
+    def __init__(self, input_stream: TextIO = sys.stdin, output_stream: TextIO = sys.stdout) -> None:
+        """
+        Args:
+            input_stream (TextIO): Flux des commandes.
+            output_stream (TextIO): Flux des réponses.
+        """
+        self.input = input_stream
+        self.output = output_stream
+        self.options = {name: spec[1] for name, spec in OPTIONS.items()}
+        self.board = BitboardQuoridorBoard()
+        self.moves: List[Move] = []
+        self._ias: Dict[int, QuoridorIA] = {}
+        self._book: Optional[OpeningBook] = None
+        self._searching: Optional[QuoridorIA] = None
+        self._thread: Optional[threading.Thread] = None
+        self._output_lock = threading.Lock()
+
+    def send(self, line: str) -> None:
+        """Écrit une réponse (appelable depuis le thread de recherche)."""
+        with self._output_lock:
+            self.output.write(line + "\n")
+            self.output.flush()
+
+    def run(self) -> None:
+        """Traite les commandes jusqu'à quit ou la fin du flux d'entrée."""
+        for line in self.input:
+            if not self.handle(line):
+                break
+        self._wait()
+
+    def handle(self, line: str) -> bool:
+        """
+        Traite une commande.
+
+        Args:
+            line (str): La ligne reçue.
+
+        Returns:
+            bool: False si le moteur doit s'arrêter (quit).
+        """
+        tokens = line.split()
+        if not tokens:
+            return True
+        command, args = tokens[0], tokens[1:]
+        if command == "uci":
+            self._uci()
+        elif command == "isready":
+            self.send("readyok")
+        elif command == "setoption":
+            self._wait()
+            self._set_option(args)
+        elif command == "ucinewgame":
+            self._wait()
+            self._close_ias()
+            self._set_position([])
+        elif command == "position":
+            self._wait()
+            self._position(args)
+        elif command == "go":
+            self._wait()
+            self._go(args)
+        elif command == "stop":
+            self._stop()
+        elif command == "quit":
+            self._stop()
+            self._wait()
+            self._close_ias()
+            return False
+        else:
+            self.send(f"info string commande inconnue : {command}")
+        return True
+
+    def _uci(self) -> None:
+        self.send(f"id name {ENGINE_NAME}")
+        for name, (kind, default, low, high) in OPTIONS.items():
+            if kind == "spin":
+                self.send(f"option name {name} type spin default {default} min {low} max {high}")
+            elif kind == "check":
+                self.send(f"option name {name} type check default {str(default).lower()}")
+            else:
+                choices = " ".join(f"var {choice}" for choice in STRATEGIES)
+                self.send(f"option name {name} type combo default {default} {choices}")
+        self.send("uciok")
+
+    def _set_option(self, args: List[str]) -> None:
+        """setoption name <nom> value <valeur> (les IA sont recréées avec les nouvelles options)."""
+        if len(args) < 4 or args[0] != "name" or args[2] != "value" or args[1] not in OPTIONS:
+            self.send(f"info string option invalide : {' '.join(args)}")
+            return
+        name, value = args[1], args[3]
+        kind, _, low, high = OPTIONS[name]
+        if kind == "spin":
+            if not value.isdigit() or not low <= int(value) <= high:
+                self.send(f"info string valeur invalide pour {name} : {value}")
+                return
+            self.options[name] = int(value)
+        elif kind == "check":
+            self.options[name] = value.lower() == "true"
+        elif value in STRATEGIES:
+            self.options[name] = value
+        else:
+            self.send(f"info string valeur invalide pour {name} : {value}")
+            return
+        self._close_ias()
+
+    def _position(self, args: List[str]) -> None:
+        """position startpos [moves ...]"""
+        if not args or args[0] != "startpos":
+            self.send("info string seule la position 'startpos' est prise en charge")
+            return
+        texts = args[2:] if len(args) > 1 and args[1] == "moves" else []
+        try:
+            moves = [text_to_move(text) for text in texts]
+        except ValueError as e:
+            self.send(f"info string {e}")
+            return
+        self._set_position(moves)
+
+    def _set_position(self, moves: List[Move]) -> None:
+        """
+        Joue les coups depuis la position initiale. Si la liste prolonge celle de la position
+        courante (cas d'une partie en cours), seuls les nouveaux coups sont joués.
+        """
+        if moves[:len(self.moves)] != self.moves:
+            self.board = BitboardQuoridorBoard()
+            self.moves = []
+        for move in moves[len(self.moves):]:
+            if self.board.apply_move(move) is None:
+                self.send(f"info string coup illégal : {move_to_text(move)}")
+                return
+            self.moves.append(move)
+
+    def _get_ia(self, player_id: int) -> QuoridorIA:
+        """IA du joueur, créée avec les options courantes puis conservée."""
+        if player_id not in self._ias:
+            if self.options["OwnBook"] and self._book is None:
+                self._book = OpeningBook.load()
+            self._ias[player_id] = QuoridorIA(
+                player_id, self.options["Depth"], self.options["Strategy"], tt_size_power=self.options["Hash"],
+                workers=self.options["Workers"], pvs=self.options["PVS"],
+                opening_book=self._book if self.options["OwnBook"] else None,
+                endgame_mode=self.options["Endgame"])
+        return self._ias[player_id]
+
+    def _close_ias(self) -> None:
+        for ia in self._ias.values():
+            ia.close()
+        self._ias = {}
+
+    def _go(self, args: List[str]) -> None:
+        """go [depth N] [movetime MS] : lance la recherche en arrière-plan."""
+        params = dict(zip(args[::2], args[1::2]))
+        try:
+            depth = int(params["depth"]) if "depth" in params else None
+            movetime = int(params["movetime"]) if "movetime" in params else None
+        except ValueError:
+            self.send(f"info string paramètres invalides : {' '.join(args)}")
+            return
+        if self.board.winner is not None:
+            self.send("bestmove none")
+            return
+
+        ia = self._get_ia(self.board.turn)
+        ia.time_limit_ms = movetime
+        ia.depth = depth or (MAX_DEPTH if movetime is not None else self.options["Depth"])
+        self._searching = ia
+        # Armé avant le démarrage du thread : un stop reçu juste après go n'est pas perdu
+        ia.clear_stop()
+        self._thread = threading.Thread(target=self._search, args=(ia,), daemon=True)
+        self._thread.start()
+
+    def _search(self, ia: QuoridorIA) -> None:
+        """Thread de recherche : envoie les statistiques puis le meilleur coup."""
+        start = time.perf_counter()
+        try:
+            move = ia.get_best_move(self.board)
+        except Exception as e:  # Le moteur doit toujours répondre à go
+            self.send(f"info string erreur : {e}")
+            move = None
+        elapsed = time.perf_counter() - start
+        if move is None:
+            self.send("bestmove none")
+            return
+
+        info = [f"depth {ia.completed_depth}", f"nodes {ia.nodes}", f"time {round(elapsed * 1000)}",
+                f"nps {round(ia.nodes / elapsed) if elapsed > 0 else 0}"]
+        entry = ia.tt.probe(self.board.zobrist)
+        if entry is not None and entry.best_move == move:
+            info.append(f"score {round(entry.score)}")
+            pv = ia.get_principal_variation(self.board, max(ia.completed_depth, 1))
+            if pv:
+                info.append("pv " + " ".join(move_to_text(m) for m in pv))
+        self.send("info " + " ".join(info))
+        self.send(f"bestmove {move_to_text(move)}")
+
+    def _stop(self) -> None:
+        """Arrête la recherche en cours, s'il y en a une (un stop après bestmove est ignoré)."""
+        if self._searching is not None and self._thread is not None and self._thread.is_alive():
+            self._searching.stop()
+
+    def _wait(self) -> None:
+        """Attend la fin de la recherche en cours (les commandes suivantes portent sur sa position)."""
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._searching = None
+
+
+if __name__ == "__main__":
+    EngineServer().run()
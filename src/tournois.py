@@ -1,21 +1,46 @@
 import time
 import csv
-from typing import List, Dict
+import random
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import List, Dict, Optional, Iterator, Tuple
 from src.engine.board import QuoridorBoard
 from src.ia.minimax import QuoridorIA
+from src.ia.stats import SearchStats, STATS_FIELDS
+from src.ia.opening_book import OpeningBook
+from src.ia.eval_cache import EvaluationCache
 
+# Colonnes du CSV produit par run_tournament
+CSV_FIELDS = ["game", "winner", "moves", "time", "p1_walls_left", "p2_walls_left",
+              "p1_depth", "p2_depth", "seed"]
+# Colonnes ajoutées quand les statistiques de recherche sont demandées (cumul par joueur)
+STATS_CSV_FIELDS = [f"p{pid}_{field}" for pid in (1, 2) for field in STATS_FIELDS]
 
-def play_game(ia1: QuoridorIA, ia2: QuoridorIA) -> Dict:
+# IA réutilisées par chaque processus d'un tournoi parallèle (tables de transposition chaudes)
+_worker_ias: Dict[Tuple[int, int, Optional[int], bool, bool, bool], QuoridorIA] = {}
+# Livre d'ouvertures chargé une fois par processus
+_opening_book: Optional[OpeningBook] = None
+# Cache d'évaluations partagé par toutes les IA (et toutes les parties) d'un processus
+_eval_cache: Optional[EvaluationCache] = None
+
+
+def play_game(ia1: QuoridorIA, ia2: QuoridorIA, opening_moves: int = 0, seed: Optional[int] = None) -> Dict:
     """
     Simule une partie complète entre deux IA (sans affichage).
 
+    Si une IA a été créée avec stats=True, ses statistiques de recherche sont cumulées
+    sur toute la partie et ajoutées au résultat (colonnes STATS_CSV_FIELDS).
+
     Args:
         ia1 (QuoridorIA): L'IA qui commence (Joueur 1).
         ia2 (QuoridorIA): L'IA qui suit (Joueur 2).
+        opening_moves (int): Nombre de déplacements de pion aléatoires joués avant les IA,
+                             pour que des IA déterministes ne rejouent pas toujours la même partie.
+        seed (Optional[int]): Graine de l'ouverture aléatoire (reproductible).
 
     Returns:
         Dict: Dictionnaire contenant le vainqueur, le nombre de coups et la durée.
     """
+    game_stats = {ia.player_id: SearchStats() for ia in (ia1, ia2) if ia.stats is not None}
     board = QuoridorBoard()
     turn = 1
     move_count = 0
@@ -24,11 +49,20 @@ def play_game(ia1: QuoridorIA, ia2: QuoridorIA) -> Dict:
     # Limite de sécurité pour éviter les boucles infinies (match nul)
     MAX_MOVES = 200
 
+    # Ouverture aléatoire (déplacements de pion uniquement)
+    rng = random.Random(seed)
+    while move_count < opening_moves and board.winner is None:
+        board.move_pawn(turn, rng.choice(board.get_legal_pawn_moves(turn)))
+        move_count += 1
+        turn = 2 if turn == 1 else 1
+
     while board.winner is None and move_count < MAX_MOVES:
         current_ia = ia1 if turn == 1 else ia2
 
         # L'IA décide son coup
         move = current_ia.get_best_move(board)
+        if current_ia.stats is not None:
+            game_stats[current_ia.player_id].merge(current_ia.stats)
 
         if move is None:
             break  # Plus de coups possibles (cas rare)
@@ -46,16 +80,93 @@ def play_game(ia1: QuoridorIA, ia2: QuoridorIA) -> Dict:
 
     duration = time.time() - start_time
 
-    return {
+    result = {
         "winner": board.winner,
         "moves": move_count,
         "time": round(duration, 4),
         "p1_walls_left": board.walls_count[1],
         "p2_walls_left": board.walls_count[2]
     }
+    for pid, stats in game_stats.items():
+        result.update({f"p{pid}_{field}": value for field, value in stats.as_dict().items()})
+    return result
+
+
+def _reset_worker_state() -> None:
+    """
+    Oublie les IA et le cache d'évaluations d'un tournoi précédent (tables de transposition,
+    historiques, fichier de cache) : appelé au début de chaque tournoi et dans chaque processus.
+    """
+    global _opening_book, _eval_cache
+    _worker_ias.clear()
+    _opening_book = None
+    _eval_cache = None
+
+
+def _get_eval_cache(path: Optional[str] = None) -> EvaluationCache:
+    """Retourne le cache d'évaluations de ce processus (chargé depuis `path` au premier appel)."""
+    global _eval_cache
+    if _eval_cache is None:
+        _eval_cache = EvaluationCache.load(path) if path is not None else EvaluationCache()
+    return _eval_cache
 
 
-def run_tournament(n_games: int, depth_j1: int, depth_j2: int):
+def _get_ia(player_id: int, depth: int, time_limit_ms: Optional[int], stats: bool = False,
+            use_book: bool = False, eval_cache: bool = False, eval_cache_path: Optional[str] = None) -> QuoridorIA:
+    """Retourne l'IA de ce processus pour un joueur et une profondeur (créée au premier appel)."""
+    global _opening_book
+    key = (player_id, depth, time_limit_ms, stats, use_book, eval_cache)
+    if key not in _worker_ias:
+        if use_book and _opening_book is None:
+            _opening_book = OpeningBook.load()
+        _worker_ias[key] = QuoridorIA(player_id, depth=depth, strategy="advanced",
+                                      time_limit_ms=time_limit_ms, stats=stats,
+                                      opening_book=_opening_book if use_book else None,
+                                      eval_cache=_get_eval_cache(eval_cache_path) if eval_cache else None)
+    return _worker_ias[key]
+
+
+def _play_tournament_game(game: int, depth_p1: int, depth_p2: int, time_limit_ms: Optional[int],
+                          opening_moves: int, seed: Optional[int], stats: bool = False,
+                          use_book: bool = False, eval_cache: bool = False,
+                          eval_cache_path: Optional[str] = None) -> Dict:
+    """
+    Joue une partie du tournoi (exécutable dans un processus séparé).
+
+    Returns:
+        Dict: Les statistiques de play_game complétées par les paramètres de la partie.
+    """
+    # Stratégie 'advanced' pour les deux pour comparer uniquement la profondeur
+    ia1 = _get_ia(1, depth_p1, time_limit_ms, stats, use_book, eval_cache, eval_cache_path)
+    ia2 = _get_ia(2, depth_p2, time_limit_ms, stats, use_book, eval_cache, eval_cache_path)
+    result = play_game(ia1, ia2, opening_moves=opening_moves, seed=seed)
+    result.update({"game": game, "p1_depth": depth_p1, "p2_depth": depth_p2, "seed": seed})
+    return result
+
+
+def _iter_games(games: List[Tuple], workers: int) -> Iterator[Dict]:
+    """
+    Joue les parties et renvoie leurs résultats au fur et à mesure qu'elles se terminent.
+
+    Args:
+        games (List[Tuple]): Arguments de _play_tournament_game pour chaque partie.
+        workers (int): Nombre de processus (1 = dans le processus courant).
+    """
+    if workers <= 1:
+        for args in games:
+            yield _play_tournament_game(*args)
+        return
+
+    with ProcessPoolExecutor(workers, initializer=_reset_worker_state) as executor:
+        futures = [executor.submit(_play_tournament_game, *args) for args in games]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def run_tournament(n_games: int, depth_j1: int, depth_j2: int, time_limit_ms: Optional[int] = None,
+                   workers: int = 1, alternate_colors: bool = False, opening_moves: int = 0,
+                   seed: Optional[int] = None, stats: bool = False, use_book: bool = False,
+                   eval_cache: bool = False, eval_cache_path: Optional[str] = None):
     """
     Lance une série de parties et enregistre les résultats dans un CSV.
 
@@ -63,48 +174,83 @@ def run_tournament(n_games: int, depth_j1: int, depth_j2: int):
         n_games (int): Nombre de parties à jouer (min 50 selon le sujet).
         depth_j1 (int): Niveau de difficulté du Joueur 1.
         depth_j2 (int): Niveau de difficulté du Joueur 2.
+        time_limit_ms (Optional[int]): Budget de temps par coup. Si fourni, la profondeur
+                                       devient une profondeur maximale (approfondissement itératif).
+        workers (int): Nombre de processus jouant des parties en parallèle.
+        alternate_colors (bool): Si True, les deux IA échangent leur place une partie sur deux.
+        opening_moves (int): Nombre de déplacements aléatoires en début de partie.
+        seed (Optional[int]): Graine des ouvertures (la partie i utilise seed + i).
+        stats (bool): Ajoute au CSV les statistiques de recherche de chaque joueur
+                      (nœuds, coupures, facteur de branchement, temps par phase...).
+        use_book (bool): Les IA jouent les coups du livre d'ouvertures s'il a été généré
+                         (data/opening_book.bin). Désactivé par défaut : les résultats
+                         mesurent alors la recherche elle-même.
+        eval_cache (bool): Les IA partagent un cache d'évaluations entre coups et parties
+                           (un cache par processus).
+        eval_cache_path (Optional[str]): Fichier du cache (ex: eval_cache.DEFAULT_CACHE_PATH),
+                                         chargé au début du tournoi et, sans processus séparés,
+                                         réécrit à la fin pour le tournoi suivant.
     """
-    results = []
+    _reset_worker_state()
     print(f"🏆 Lancement du tournoi : IA Niv{depth_j1} vs IA Niv{depth_j2} ({n_games} parties)")
 
-    # Initialisation des IA
-    # Stratégie 'advanced' pour les deux pour comparer uniquement la profondeur
-    player1 = QuoridorIA(1, depth=depth_j1, strategy="advanced")
-    player2 = QuoridorIA(2, depth=depth_j2, strategy="advanced")
+    games = []
+    for i in range(n_games):
+        # Pour éviter le déterminisme absolu (mêmes parties), on peut alterner qui commence
+        # et/ou tirer une ouverture aléatoire différente pour chaque partie.
+        swap = alternate_colors and i % 2 == 1
+        depth_p1, depth_p2 = (depth_j2, depth_j1) if swap else (depth_j1, depth_j2)
+        game_seed = None if seed is None else seed + i
+        games.append((i + 1, depth_p1, depth_p2, time_limit_ms, opening_moves, game_seed, stats, use_book,
+                      eval_cache, eval_cache_path))
 
     wins = {1: 0, 2: 0, "Draw": 0}
 
-    for i in range(n_games):
-        print(f"   Partie {i + 1}/{n_games}...", end="\r")
+    # Les résultats sont écrits dans le CSV dès qu'une partie se termine
+    filename = f"../data/results/tournoi_d{depth_j1}_vs_d{depth_j2}.csv"
+    try:
+        f = open(filename, 'w', newline='')
+    except FileNotFoundError:
+        f = None
+        print("⚠️ Erreur: Le dossier 'data/results' n'existe pas. Créez-le ou lancez setup_project.ps1")
 
-        # Pour éviter le déterminisme absolu (mêmes parties), on peut alterner qui commence
-        # Mais ici, on garde J1 = IA1 pour respecter les paramètres
-        stats = play_game(player1, player2)
+    try:
+        writer = None
+        if f is not None:
+            writer = csv.DictWriter(f, fieldnames=CSV_FIELDS + (STATS_CSV_FIELDS if stats else []))
+            writer.writeheader()
 
-        if stats["winner"] is None:
-            wins["Draw"] += 1
-        else:
-            wins[stats["winner"]] += 1
+        for done, result in enumerate(_iter_games(games, workers), start=1):
+            print(f"   Partie {done}/{n_games}...", end="\r")
+
+            if result["winner"] is None:
+                wins["Draw"] += 1
+            else:
+                # On compte les victoires par IA (et non par place) quand les couleurs alternent
+                swapped = alternate_colors and result["game"] % 2 == 0
+                wins[3 - result["winner"] if swapped else result["winner"]] += 1
 
-        results.append(stats)
+            if writer is not None:
+                writer.writerow(result)
+                f.flush()
+    finally:
+        if f is not None:
+            f.close()
 
     print(f"\n✅ Tournoi terminé !")
-    print(f"Victoires J1 (Prof {depth_j1}): {wins[1]}")
-    print(f"Victoires J2 (Prof {depth_j2}): {wins[2]}")
+    print(f"Victoires IA 1 (Prof {depth_j1}): {wins[1]}")
+    print(f"Victoires IA 2 (Prof {depth_j2}): {wins[2]}")
     print(f"Matchs nuls : {wins['Draw']}")
-
-    # Sauvegarde CSV pour le rapport
-    filename = f"../data/results/tournoi_d{depth_j1}_vs_d{depth_j2}.csv"
-    try:
-        with open(filename, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=["winner", "moves", "time", "p1_walls_left", "p2_walls_left"])
-            writer.writeheader()
-            writer.writerows(results)
+    if eval_cache and workers <= 1:
+        cache = _get_eval_cache(eval_cache_path)
+        print(f"Cache d'évaluations : {cache.hits} succès, {cache.misses} échecs "
+              f"({cache.hit_rate:.1%}), {len(cache)} positions")
+        if eval_cache_path is not None:
+            cache.save(eval_cache_path)
+    if f is not None:
         print(f"📁 Données sauvegardées dans {filename}")
-    except FileNotFoundError:
-        print("⚠️ Erreur: Le dossier 'data/results' n'existe pas. Créez-le ou lancez setup_project.ps1")
 
 
 if __name__ == "__main__":
     # Exemple : 50 parties entre une IA Profondeur 1 (Rapide) et Profondeur 2 (Plus maline)
-    run_tournament(50, depth_j1=2, depth_j2=1)
\ No newline at end of file
+    run_tournament(50, depth_j1=2, depth_j2=1)
@@ -0,0 +1,84 @@
+import threading
+from typing import Optional, Tuple
+from src.engine.board import QuoridorBoard
+from src.ia.minimax import QuoridorIA
+from src.ia.moves_optimization import MoveType
+
+
+class AIWorker:
+    """
+    Fait réfléchir l'IA dans un thread séparé pour que la boucle d'affichage reste fluide.
+
+    La recherche porte sur une copie du plateau : l'interface peut continuer à dessiner
+    le plateau réel pendant que l'IA joue et annule ses coups simulés.
+    """
+
+    def __init__(self, ia: QuoridorIA) -> None:
+        """
+        Args:
+            ia (QuoridorIA): L'IA à faire réfléchir.
+        """
+        self.ia = ia
+        self._thread: Optional[threading.Thread] = None
+        self._result: Optional[MoveType] = None
+        self._error: Optional[BaseException] = None
+        self._cancelled = False
+
+    def start(self, board: QuoridorBoard) -> None:
+        """
+        Lance la recherche du coup de l'IA en arrière-plan.
+
+        Args:
+            board (QuoridorBoard): Le plateau courant (copié, jamais modifié).
+        """
+        self._result = None
+        self._error = None
+        self._cancelled = False
+        # Armé ici et non dans le thread : un force_move() ou cancel() immédiat n'est pas perdu
+        self.ia.clear_stop()
+        self._thread = threading.Thread(target=self._run, args=(board.copy(),), daemon=True)
+        self._thread.start()
+
+    def _run(self, board: QuoridorBoard) -> None:
+        try:
+            self._result = self.ia.get_best_move(board)
+        except BaseException as e:  # Remontée dans le thread de l'interface par result()
+            self._error = e
+
+    def is_running(self) -> bool:
+        """Indique si une recherche est en cours."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def is_done(self) -> bool:
+        """Indique si une recherche lancée est terminée (son coup peut être lu)."""
+        return self._thread is not None and not self._thread.is_alive()
+
+    def progress(self) -> Tuple[int, int]:
+        """
+        Returns:
+            Tuple[int, int]: La profondeur en cours de recherche et le nombre de nœuds visités.
+        """
+        return self.ia.current_depth, self.ia.nodes
+
+    def force_move(self) -> None:
+        """Arrête la recherche : l'IA jouera le meilleur coup trouvé jusque-là."""
+        if self.is_running():
+            self.ia.stop()
+
+    def cancel(self) -> None:
+        """Arrête la recherche et abandonne son résultat."""
+        self._cancelled = True
+        if self.is_running():
+            self.ia.stop()
+
+    def result(self) -> Optional[MoveType]:
+        """
+        Récupère le coup trouvé une fois la recherche terminée (puis remet le worker à zéro).
+
+        Returns:
+            Optional[MoveType]: Le coup choisi, None si la recherche a été annulée.
+        """
+        self._thread = None
+        if self._error is not None:
+            raise self._error
+        return None if self._cancelled else self._result
@@ -3,6 +3,8 @@ import sys
 import os
 from src.engine.board import QuoridorBoard
 from src.ia.minimax import QuoridorIA
+from src.ia.opening_book import OpeningBook
+from src.ui.ai_worker import AIWorker
 
 # --- CONSTANTES GRAPHIQUES ---
 SCREEN_WIDTH = 900  # Un peu plus large pour l'interface
@@ -25,6 +27,9 @@ COLOR_TEXT = (255, 255, 255)
 COLOR_BUTTON = (70, 130, 180)
 COLOR_BUTTON_HOVER = (100, 160, 210)
 
+# Budget de réflexion de l'IA par coup (approfondissement itératif jusqu'au niveau choisi)
+AI_TIME_LIMIT_MS = 2000
+
 
 class Button:
     """Classe utilitaire pour créer des boutons cliquables."""
@@ -74,6 +79,8 @@ class QuoridorGUI:
         # Variables de jeu
         self.board = None
         self.ia = None
+        self.ai_worker = None  # Réflexion de l'IA en arrière-plan
+        self.opening_book = OpeningBook.load()  # None si le livre n'a pas été généré
         self.vs_ia = True
         self.turn = 1  # 1 ou 2
         self.wall_orientation = 'H'
@@ -106,6 +113,7 @@ class QuoridorGUI:
 
     def start_game(self, vs_ia, difficulty=1):
         """Initialise une nouvelle partie."""
+        self.stop_ai()
         self.board = QuoridorBoard()
         self.vs_ia = vs_ia
         self.turn = 1
@@ -113,9 +121,12 @@ class QuoridorGUI:
 
         if self.vs_ia:
             strategy = "simple" if difficulty == 1 else "advanced"
-            self.ia = QuoridorIA(2, depth=difficulty, strategy=strategy)
+            self.ia = QuoridorIA(2, depth=difficulty, strategy=strategy, time_limit_ms=AI_TIME_LIMIT_MS,
+                                 opening_book=self.opening_book)
+            self.ai_worker = AIWorker(self.ia)
         else:
             self.ia = None
+            self.ai_worker = None
 
         self.state = 'GAME'
 
@@ -127,6 +138,7 @@ class QuoridorGUI:
             # Gestion des événements globale
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
+                    self.stop_ai()
                     pygame.quit()
                     sys.exit()
 
@@ -184,6 +196,15 @@ class QuoridorGUI:
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_SPACE:
                 self.wall_orientation = 'V' if self.wall_orientation == 'H' else 'H'
+            elif self.ai_worker is not None and self.ai_worker.is_running():
+                if event.key == pygame.K_f:
+                    # Forcer : l'IA joue tout de suite son meilleur coup actuel
+                    self.ai_worker.force_move()
+                elif event.key == pygame.K_ESCAPE:
+                    # Annuler : on abandonne la réflexion et la partie
+                    self.stop_ai()
+                    self.state = 'MENU'
+                    return
 
         if event.type == pygame.MOUSEMOTION:
             mx, my = pygame.mouse.get_pos()
@@ -218,15 +239,23 @@ class QuoridorGUI:
                 if success:
                     self.check_win_or_switch_turn()
 
+    def stop_ai(self):
+        """Interrompt la réflexion de l'IA en cours (changement de partie, fermeture)."""
+        if self.ai_worker is not None:
+            self.ai_worker.cancel()
+
     def update_game_logic(self):
-        # Tour de l'IA
+        # Tour de l'IA : la recherche tourne dans un thread, la boucle continue d'afficher
         if self.vs_ia and self.turn == 2 and self.board.winner is None:
-            self.message = "L'IA réfléchit..."
-            self.draw_game(pygame.mouse.get_pos())  # Force l'affichage du message
-            pygame.display.flip()
+            if not self.ai_worker.is_running() and not self.ai_worker.is_done():
+                self.ai_worker.start(self.board)
+
+            if self.ai_worker.is_running():
+                depth, nodes = self.ai_worker.progress()
+                self.message = f"L'IA réfléchit... (prof. {depth}, {nodes} nœuds)"
+                return
 
-            # Calcul du coup
-            move = self.ia.get_best_move(self.board)
+            move = self.ai_worker.result()
             if move:
                 type, data = move
                 if type == "MOVE":
@@ -291,7 +320,9 @@ class QuoridorGUI:
             "COMMANDES :",
             "Clic Gauche : Bouger",
             "Clic Droit : Mur",
-            "ESPACE : Tourner Mur"
+            "ESPACE : Tourner Mur",
+            "F : Forcer le coup de l'IA",
+            "ÉCHAP : Annuler (menu)"
         ]
         for line in help_texts:
             self.screen.blit(self.font_small.render(line, True, (150, 150, 150)), (panel_x + 20, help_y))
@@ -0,0 +1,26 @@
+import pytest
+from src.benchmark import POSITIONS, BOARDS, make_position, compare_results
+
+
+@pytest.mark.parametrize("name", list(POSITIONS))
+def test_reference_positions_are_reproducible(name):
+    """Chaque position de référence a le nombre de murs voulu, identique pour chaque représentation."""
+    boards = [make_position(name, cls) for cls in BOARDS.values()]
+    assert len(boards[0].walls) == POSITIONS[name]
+    assert boards[0].winner is None
+    assert {board.zobrist for board in boards} == {make_position(name).zobrist}
+    assert all(set(board.walls) == set(boards[0].walls) for board in boards)
+
+
+def test_compare_flags_regressions():
+    """Seules les mesures ralenties au-delà du seuil sont signalées."""
+    positions = {"opening": 42}
+    baseline = {"positions": positions, "results": {"a": 10.0, "b": 10.0, "c": 10.0}}
+    current = {"positions": positions, "results": {"a": 11.0, "b": 13.0, "c": 5.0, "d": 1.0}}
+    rows = {row["name"]: row for row in compare_results(baseline, current, threshold=0.15)}
+    assert sorted(rows) == ["a", "b", "c"]
+    assert [rows[name]["regression"] for name in "abc"] == [False, True, False]
+    assert rows["b"]["ratio"] == 1.3
+
+    with pytest.raises(ValueError):
+        compare_results({"positions": {"opening": 1}, "results": {}}, current)
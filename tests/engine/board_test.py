@@ -1,11 +1,13 @@
+import random
 import pytest
 from src.engine.board import QuoridorBoard
+from src.engine.bitboard import BitboardQuoridorBoard
 
 
-@pytest.fixture
-def board():
-    """Fixture : Crée un plateau neuf avant chaque test."""
-    return QuoridorBoard()
+@pytest.fixture(params=[QuoridorBoard, BitboardQuoridorBoard])
+def board(request):
+    """Fixture : Crée un plateau neuf avant chaque test (pour chaque représentation)."""
+    return request.param()
 
 
 # ==========================================
@@ -40,6 +42,19 @@ def test_copy_board(board):
     assert len(new_board.walls) == 2
 
 
+def test_copy_keeps_caches_independent():
+    """Les caches dérivés (voisins, distances, ancrages) de la copie évoluent seuls."""
+    board = QuoridorBoard()
+    board.place_wall(1, 3, 3, 'H')
+    new_board = board.copy()
+    assert new_board._dist == board._dist and new_board.zobrist == board.zobrist
+    new_board.place_wall(2, 4, 7, 'H')
+    assert board.place_wall(1, 4, 7, 'H')
+    reference = QuoridorBoard.from_bytes(board.to_bytes())
+    assert board._adj == reference._adj and board._dist == reference._dist
+    assert board._wall_blocks == reference._wall_blocks
+
+
 # ==========================================
 # 2. TESTS DE DÉPLACEMENTS SIMPLES
 # ==========================================
@@ -157,6 +172,17 @@ def test_place_wall_enclosing_player(board):
     assert board.place_wall(2, 0, 0, 'V') is False
 
 
+def test_add_wall_check_paths(board):
+    """_add_wall a la même signature pour les deux représentations et refuse un mur enfermant."""
+    board.positions[1] = (0, 0)
+    board.rebuild_caches()
+    assert board._add_wall((0, 0, 'H'), check_paths=True) is True
+    assert board._add_wall((1, 0, 'V'), check_paths=True) is False
+    assert set(board.walls) == {(0, 0, 'H')}
+    assert board._add_wall((1, 0, 'V')) is True
+    assert not board.is_path_available(1)
+
+
 # ==========================================
 # 5. TESTS DE VICTOIRE (CORRIGÉS)
 # ==========================================
@@ -190,4 +216,243 @@ def test_victory_condition_j2(board):
 
     # Coup gagnant
     assert board.move_pawn(2, (4, 0)) is True
-    assert board.winner == 2
\ No newline at end of file
+    assert board.winner == 2
+
+
+# ==========================================
+# 6. TESTS DE APPLY_MOVE / UNDO_MOVE
+# ==========================================
+
+def _snapshot(board):
+    return (dict(board.positions), set(board.walls), dict(board.walls_count), board.winner, board.turn)
+
+
+def test_apply_undo_restores_state(board):
+    """Une suite de coups annulée dans l'ordre inverse restaure exactement le plateau."""
+    rng = random.Random(7)
+    history = []
+    snapshots = []
+    while board.winner is None and len(history) < 40:
+        player = board.turn
+        if board.walls_count[player] > 0 and rng.random() < 0.4:
+            move = ("WALL", (rng.randrange(8), rng.randrange(8), rng.choice('HV')))
+        else:
+            move = ("MOVE", rng.choice(board.get_legal_pawn_moves(player)))
+        before = _snapshot(board)
+        token = board.apply_move(move)
+        if token is None:
+            assert _snapshot(board) == before  # Coup illégal : rien ne change
+            continue
+        history.append(token)
+        snapshots.append(before)
+
+    while history:
+        board.undo_move(history.pop())
+        assert _snapshot(board) == snapshots.pop()
+
+
+def test_undo_winning_move(board):
+    """L'annulation d'un coup gagnant efface le vainqueur."""
+    board.positions[2] = (0, 0)
+    board.positions[1] = (4, 7)
+    token = board.apply_move(("MOVE", (4, 8)), 1)
+    assert board.winner == 1
+    board.undo_move(token)
+    assert board.winner is None
+    assert board.positions[1] == (4, 7)
+
+
+def test_zobrist_hash_incremental(board):
+    """Le hash mis à jour coup par coup est égal au hash recalculé."""
+    rng = random.Random(11)
+    tokens = []
+    hashes = [board.zobrist]
+    for _ in range(30):
+        player = board.turn
+        if board.walls_count[player] > 0 and rng.random() < 0.5:
+            move = ("WALL", (rng.randrange(8), rng.randrange(8), rng.choice('HV')))
+        else:
+            move = ("MOVE", rng.choice(board.get_legal_pawn_moves(player)))
+        token = board.apply_move(move)
+        if token is not None:
+            assert board.zobrist == board.compute_hash()
+            tokens.append(token)
+            hashes.append(board.zobrist)
+        if board.winner is not None:
+            break
+    while tokens:
+        board.undo_move(tokens.pop())
+        hashes.pop()
+        assert board.zobrist == hashes[-1]
+
+
+def test_zobrist_transposition(board):
+    """Deux ordres de coups menant à la même position donnent le même hash."""
+    other = board.copy()
+    board.apply_move(("MOVE", (4, 1)))
+    board.apply_move(("MOVE", (4, 7)))
+    board.apply_move(("MOVE", (3, 1)))
+    other.apply_move(("MOVE", (3, 0)))
+    other.apply_move(("MOVE", (4, 7)))
+    other.apply_move(("MOVE", (3, 1)))
+    assert board.zobrist == other.zobrist
+    assert board.zobrist != QuoridorBoard().zobrist
+
+
+def test_distance_maps_incremental():
+    """Les cartes de distance mises à jour mur par mur égalent un BFS complet, y compris après annulation."""
+    from src.engine import distances
+    rng = random.Random(3)
+    for _ in range(30):
+        board = QuoridorBoard()
+        tokens = []
+        for _ in range(30):
+            move = ("WALL", (rng.randrange(8), rng.randrange(8), rng.choice('HV')))
+            token = board.apply_move(move, rng.choice((1, 2)))
+            if token is not None:
+                tokens.append(token)
+        expected = {pid: distances.compute_distance_map(board._cell_neighbors, pid) for pid in (1, 2)}
+        assert board._dist == expected
+        while tokens:
+            board.undo_move(tokens.pop())
+        assert board._dist == QuoridorBoard()._dist
+
+
+def test_direct_wall_edits_update_distances(board):
+    """Un mur ajouté ou retiré directement via `walls` met à jour les distances (murs chevauchants compris)."""
+    from src.engine import distances
+    from src.ia.evaluations import bfs_shortest_path_len
+    board.walls.add((3, 7, 'H'))
+    board.walls.add((5, 7, 'H'))
+    assert bfs_shortest_path_len(board, 2) == 10
+    board.walls.add((4, 7, 'H'))
+    board.walls.discard((3, 7, 'H'))
+    assert board.is_wall_blocking(4, 7, 4, 8)
+    assert bfs_shortest_path_len(board, 2) == 9
+    board.walls = {(0, 0, 'H')}
+    assert bfs_shortest_path_len(board, 2) == 8
+    board.walls.update([(6, 6, 'V')])
+    assert len(board.walls) == 2
+    reference = QuoridorBoard()
+    reference.walls.update({(0, 0, 'H'), (6, 6, 'V')})
+    reference.walls.remove((6, 6, 'V'))
+    assert reference._dist == {pid: distances.compute_distance_map(reference._cell_neighbors, pid) for pid in (1, 2)}
+
+
+def test_adjacency_edited_in_place():
+    """Les listes de voisins modifiées mur par mur égalent un recalcul complet, ordre compris."""
+    rng = random.Random(5)
+    for _ in range(20):
+        board = QuoridorBoard()
+        tokens = []
+        for _ in range(30):
+            token = board.apply_move(("WALL", (rng.randrange(8), rng.randrange(8), rng.choice('HV'))),
+                                     rng.choice((1, 2)))
+            if token is not None:
+                tokens.append(token)
+        rebuilt = QuoridorBoard()
+        rebuilt.walls = set(board.walls)
+        rebuilt.rebuild_caches()
+        assert board._adj == rebuilt._adj
+        while tokens:
+            board.undo_move(tokens.pop())
+        assert board._adj == QuoridorBoard()._adj
+
+
+def test_goal_reachable():
+    """La recherche guidée détecte un pion enfermé et s'arrête sur la ligne d'arrivée."""
+    from src.engine import distances
+    board = QuoridorBoard()
+    assert distances.goal_reachable(board._cell_neighbors, 4, 1)
+    assert distances.goal_reachable(board._cell_neighbors, 4, 2)
+    # Cases (0, 0) et (1, 0) fermées par un mur horizontal et un mur vertical
+    board.walls.update({(0, 0, 'H'), (1, 0, 'V')})
+    board.rebuild_caches()
+    assert not distances.goal_reachable(board._cell_neighbors, 1, 1)
+    assert distances.goal_reachable(board._cell_neighbors, 2, 1)
+
+
+
+def _overlaps(wall, other):
+    """Règle de chevauchement / croisement écrite naïvement (référence)."""
+    (nx, ny, no), (wx, wy, wo) = wall, other
+    if (nx, ny) == (wx, wy):
+        return True
+    if no == wo == 'H':
+        return ny == wy and abs(nx - wx) < 2
+    if no == wo == 'V':
+        return nx == wx and abs(ny - wy) < 2
+    return False
+
+
+def test_legal_wall_anchors_index(board):
+    """L'index des ancrages bloqués suit les poses et annulations de murs."""
+    rng = random.Random(11)
+    tokens = []
+    for _ in range(40):
+        token = board.apply_move(("WALL", (rng.randrange(8), rng.randrange(8), rng.choice('HV'))),
+                                 rng.choice((1, 2)))
+        if token is not None:
+            tokens.append(token)
+        expected = {(x, y, o) for x in range(8) for y in range(8) for o in 'HV'
+                    if not any(_overlaps((x, y, o), w) for w in board.walls)}
+        assert set(board.legal_wall_anchors()) == expected
+        assert all(board._is_wall_placement_valid(w) == (w in expected) for w in list(expected)[:20])
+    while tokens:
+        board.undo_move(tokens.pop())
+    assert len(board.legal_wall_anchors()) == 128
+
+
+def test_legal_wall_anchors_after_direct_edits(board):
+    """Les murs ajoutés ou retirés directement via `walls` bloquent et libèrent leurs ancrages."""
+    board.walls.add((3, 7, 'H'))
+    board.walls.add((5, 7, 'H'))
+    assert (4, 7, 'H') not in board.legal_wall_anchors()
+    assert not board.place_wall(1, 4, 7, 'H')
+    board.walls.discard((5, 7, 'H'))
+    assert (5, 7, 'H') in board.legal_wall_anchors()
+    assert board.place_wall(1, 5, 7, 'H')
+
+# ==========================================
+# 7. TESTS DE LA REPRÉSENTATION BITBOARD
+# ==========================================
+
+def test_bitboard_matches_reference_board():
+    """Compare les deux représentations sur des parties aléatoires."""
+    rng = random.Random(42)
+    for _ in range(20):
+        ref, fast = QuoridorBoard(), BitboardQuoridorBoard()
+        turn = 1
+        for _ in range(60):
+            if ref.winner is not None:
+                break
+            assert fast.get_legal_pawn_moves(turn) == ref.get_legal_pawn_moves(turn)
+            assert fast.shortest_path_len(turn) == ref.shortest_path_len(turn)
+            if rng.random() < 0.5:
+                x, y, o = rng.randrange(8), rng.randrange(8), rng.choice('HV')
+                assert fast._is_wall_placement_valid((x, y, o)) == ref._is_wall_placement_valid((x, y, o))
+                assert fast.place_wall(turn, x, y, o) == ref.place_wall(turn, x, y, o)
+            else:
+                pos = rng.choice(ref.get_legal_pawn_moves(turn))
+                assert fast.move_pawn(turn, pos) == ref.move_pawn(turn, pos)
+            assert set(fast.walls) == ref.walls
+            assert dict(fast.positions) == ref.positions
+            assert fast.walls_count == ref.walls_count
+            assert fast.winner == ref.winner
+            turn = 3 - turn
+
+
+def test_bitboard_wall_touch_shortcut_is_sound():
+    """Les murs acceptés sans propagation (un seul coin de contact) n'isolent jamais un joueur."""
+    from src.engine.bitboard import WALL_POSTS
+    rng = random.Random(5)
+    for _ in range(30):
+        board = BitboardQuoridorBoard()
+        for i in range(30):
+            board.place_wall(i % 2 + 1, rng.randrange(8), rng.randrange(8), rng.choice('HV'))
+        for x, y, o in board.legal_wall_anchors():
+            touching = WALL_POSTS[o][y * 8 + x] & board._posts
+            if touching & (touching - 1) == 0:
+                trial = board.copy()
+                trial.walls.add((x, y, o))
+                assert trial.is_path_available(1) and trial.is_path_available(2)
@@ -0,0 +1,52 @@
+import random
+import pytest
+from src.engine.board import QuoridorBoard
+from src.engine.bitboard import BitboardQuoridorBoard
+from src.engine.perft import perft, divide
+
+
+def _random_position(cls, seed, n_moves=12):
+    """Position reproductible (murs et déplacements aléatoires)."""
+    rng = random.Random(seed)
+    board = cls()
+    for _ in range(n_moves):
+        if rng.random() < 0.5 and board.apply_move(
+                ("WALL", (rng.randrange(8), rng.randrange(8), rng.choice('HV')))) is not None:
+            continue
+        board.apply_move(("MOVE", rng.choice(board.get_legal_pawn_moves(board.turn))))
+    return board
+
+
+@pytest.mark.parametrize("cls", [QuoridorBoard, BitboardQuoridorBoard])
+def test_perft_initial_position(cls):
+    """Depuis le départ : 3 déplacements et 128 murs."""
+    board = cls()
+    assert perft(board, 1) == 131
+    assert board.zobrist == cls().zobrist
+
+
+def test_perft_depth_two():
+    """Valeur de référence à 2 demi-coups (les murs autour de J2 lui retirent un déplacement)."""
+    assert perft(BitboardQuoridorBoard(), 2) == 16677
+
+
+def test_legal_moves_skip_path_closing_walls():
+    """Un mur qui enfermerait un joueur n'est pas légal ; une partie terminée n'a aucun coup."""
+    board = QuoridorBoard()
+    board.positions[1] = (0, 0)
+    board.walls.add((0, 0, 'H'))
+    board.rebuild_caches()
+    moves = board.get_legal_moves(2)
+    assert ("WALL", (1, 0, 'V')) not in moves
+    assert ("WALL", (2, 0, 'V')) in moves
+    assert ("WALL", (6, 6, 'V')) in moves
+    board.winner = 1
+    assert board.get_legal_moves(2) == []
+
+
+@pytest.mark.parametrize("seed", [3, 8])
+def test_representations_agree(seed):
+    """Les deux représentations énumèrent exactement les mêmes coups (oracle de correction)."""
+    boards = [_random_position(cls, seed) for cls in (QuoridorBoard, BitboardQuoridorBoard)]
+    assert set(boards[0].get_legal_moves()) == set(boards[1].get_legal_moves())
+    assert divide(boards[0], 2) == divide(boards[1], 2)
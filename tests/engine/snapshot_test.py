@@ -0,0 +1,60 @@
+import pickle
+import random
+import pytest
+from src.engine.board import QuoridorBoard, STATE_SIZE
+from src.engine.bitboard import BitboardQuoridorBoard
+from src.engine.snapshot import BoardSnapshot
+
+
+def _random_game(cls, seed, plies=40):
+    """Partie aléatoire (murs et déplacements), éventuellement terminée."""
+    rng = random.Random(seed)
+    board = cls()
+    for _ in range(plies):
+        if board.winner is not None:
+            break
+        moves = sorted(board.get_legal_moves())
+        pawns = [move for move in moves if move[0] == "MOVE"]
+        board.apply_move(rng.choice(moves) if rng.random() < 0.3 else rng.choice(pawns))
+    return board
+
+
+@pytest.mark.parametrize("cls", [QuoridorBoard, BitboardQuoridorBoard])
+def test_bytes_round_trip(cls):
+    """L'encodage a une taille fixe, est commun aux représentations et reconstruit tout l'état."""
+    for seed in range(10):
+        board = _random_game(cls, seed)
+        data = board.to_bytes()
+        assert len(data) == STATE_SIZE
+        assert data == _random_game(QuoridorBoard, seed).to_bytes()
+        for target in (QuoridorBoard, BitboardQuoridorBoard):
+            copy = target.from_bytes(data)
+            assert copy.positions == board.positions and set(copy.walls) == set(board.walls)
+            assert copy.walls_count == board.walls_count
+            assert (copy.winner, copy.turn, copy.zobrist) == (board.winner, board.turn, board.zobrist)
+            assert sorted(copy.get_legal_moves()) == sorted(board.get_legal_moves())
+
+
+def test_from_bytes_rejects_invalid_data():
+    data = QuoridorBoard().to_bytes()
+    with pytest.raises(ValueError):
+        QuoridorBoard.from_bytes(data[:-1])
+    with pytest.raises(ValueError):
+        BitboardQuoridorBoard.from_bytes(data[:-1] + b"\x03")  # Trait invalide
+    with pytest.raises(ValueError):
+        BoardSnapshot(data[:16] + bytes([4, 4]) + data[18:])  # Deux pions sur la même case
+
+
+def test_snapshot_is_immutable_and_hashable():
+    board = _random_game(BitboardQuoridorBoard, 3)
+    snapshot = BoardSnapshot.from_board(board)
+    assert snapshot == BoardSnapshot.from_board(_random_game(QuoridorBoard, 3))
+    assert {snapshot: 1}[BoardSnapshot(board.to_bytes())] == 1
+    assert snapshot.zobrist == board.zobrist and snapshot.turn == board.turn
+    assert sorted(snapshot.walls) == sorted(board.walls) and snapshot.positions == dict(board.positions)
+    assert pickle.loads(pickle.dumps(snapshot)) == snapshot
+    assert snapshot.to_board().zobrist == board.zobrist
+    with pytest.raises(AttributeError):
+        snapshot.data = b""
+    with pytest.raises(AttributeError):
+        snapshot.extra = 1
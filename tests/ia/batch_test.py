@@ -0,0 +1,39 @@
+import pytest
+from src.ia.evaluations import evaluate_board
+from src.ia.minimax import QuoridorIA
+from src.ia.moves_optimization import get_optimized_moves
+from tests.ia.minimax_test import _random_position
+
+pytest.importorskip("numpy")
+from src.ia import batch  # noqa: E402
+
+
+@pytest.mark.parametrize("seed", [0, 4, 7])
+def test_batch_moves_match_scalar(seed):
+    """La génération par masque donne les mêmes coups, dans le même ordre."""
+    board = _random_position(seed, n_moves=16)
+    for player in (1, 2):
+        assert batch.get_optimized_moves_batch(board, player) == get_optimized_moves(board, player)
+
+
+@pytest.mark.parametrize("strategy", ["simple", "advanced"])
+def test_evaluate_children_matches_evaluate_board(strategy):
+    """Chaque score du lot est celui d'evaluate_board après le coup (None si coup illégal)."""
+    board = _random_position(3, n_moves=16)
+    player = board.turn
+    moves = get_optimized_moves(board, player)
+    scores = batch.evaluate_children(board, player, moves, 1, strategy)
+    for move, score in zip(moves, scores):
+        token = board.apply_move(move, player)
+        if token is None:
+            assert score is None
+            continue
+        assert score == evaluate_board(board, 1, strategy)
+        board.undo_move(token)
+
+
+def test_batch_search_matches_scalar():
+    """Le mode batch ne change pas le coup choisi."""
+    board = _random_position(2)
+    expected = QuoridorIA(board.turn, depth=2, strategy="advanced").get_best_move(board)
+    assert QuoridorIA(board.turn, depth=2, strategy="advanced", batch=True).get_best_move(board) == expected
@@ -0,0 +1,80 @@
+import pytest
+from src.engine.board import QuoridorBoard
+from src.engine.bitboard import BitboardQuoridorBoard
+from src.ia import endgame
+from src.ia.minimax import QuoridorIA
+from src.ia.moves_optimization import get_optimized_moves, BOX_WINDOW
+
+
+def _board(cls, pos1, pos2, walls=(), counts=(0, 0), turn=1):
+    board = cls()
+    board.positions[1] = pos1
+    board.positions[2] = pos2
+    for wall in walls:
+        board.walls.add(wall)
+    board.walls_count[1], board.walls_count[2] = counts
+    board.turn = turn
+    board.rebuild_caches()
+    return board
+
+
+def _race(board, plies):
+    """Résultat de la course par recherche exhaustive (WIN/DRAW/LOSS pour le joueur au trait)."""
+    if board.winner is not None:
+        return endgame.LOSS
+    if plies == 0:
+        return endgame.DRAW
+    best = endgame.LOSS
+    for pos in board.get_legal_pawn_moves(board.turn):
+        token = board.apply_move(("MOVE", pos))
+        best = max(best, -_race(board, plies - 1))
+        board.undo_move(token)
+        if best == endgame.WIN:
+            break
+    return best
+
+
+@pytest.mark.parametrize("cls", [QuoridorBoard, BitboardQuoridorBoard])
+def test_race_solver_uses_jumps(cls):
+    """Face à face, le saut renverse une course perdue aux seules distances."""
+    board = _board(cls, (4, 3), (4, 4))
+    assert endgame.race_evaluate(board, 1) < 0
+    solver = endgame.RaceSolver(board)
+    assert solver.outcome(board) == (endgame.WIN, 7)
+    assert solver.best_move(board) == ("MOVE", (4, 5))
+
+
+@pytest.mark.parametrize("pos1, pos2, turn", [((4, 5), (4, 4), 1), ((2, 6), (3, 6), 2), ((4, 3), (3, 5), 1)])
+def test_race_solver_matches_exhaustive_search(pos1, pos2, turn):
+    """La table rétrograde donne le même résultat qu'une recherche exhaustive de la course."""
+    board = _board(BitboardQuoridorBoard, pos1, pos2, walls=[(3, 5, 'H'), (4, 3, 'V')], turn=turn)
+    result, plies = endgame.RaceSolver(board).outcome(board)
+    assert _race(board, plies) == result
+    if result != endgame.DRAW:
+        assert _race(board, plies - 1) == endgame.DRAW
+
+
+def test_ia_solves_race_without_search():
+    """Sans mur en réserve, l'IA joue le coup exact de la course sans recherche."""
+    board = _board(QuoridorBoard, (4, 3), (4, 4))
+    ia = QuoridorIA(1, depth=3, strategy="advanced")
+    assert ia.get_best_move(board) == ("MOVE", (4, 5))
+    assert ia.nodes == 0
+
+
+def test_endgame_moves_reach_walls_outside_bounding_box():
+    """Le joueur qui a encore des murs peut couper le chemin adverse loin des pions."""
+    board = _board(QuoridorBoard, (0, 7), (8, 8), counts=(3, 0), turn=1)
+    moves = endgame.endgame_moves(board, 1)
+    assert ("WALL", (7, 1, 'H')) in moves
+    assert ("WALL", (7, 1, 'H')) not in get_optimized_moves(board, 1, window=BOX_WINDOW)
+    assert all(kind == "MOVE" for kind, _ in endgame.endgame_moves(board, 2))
+
+
+def test_one_sided_endgame_switches_search():
+    """Un seul joueur a encore des murs : recherche de fin de partie, table vidée au changement."""
+    board = _board(BitboardQuoridorBoard, (4, 5), (4, 2), counts=(0, 2), turn=1)
+    ia = QuoridorIA(1, depth=2, strategy="advanced")
+    move = ia.get_best_move(board)
+    assert ia.phase == endgame.ONE_SIDED
+    assert board.apply_move(move, 1) is not None
@@ -0,0 +1,74 @@
+import pytest
+from src.ia.eval_cache import EvaluationCache
+from src.ia.minimax import QuoridorIA
+from src import tournois
+from src.tournois import play_game
+
+
+def test_lru_eviction_and_counters():
+    """Le cache oublie l'entrée la moins récemment utilisée et compte succès et échecs."""
+    cache = EvaluationCache(max_entries=2)
+    cache.put((1, "advanced", 1), 10)
+    cache.put((2, "advanced", 1), 20)
+    assert cache.get((1, "advanced", 1)) == 10
+    cache.put((3, "advanced", 1), 30)
+    assert cache.get((2, "advanced", 1)) is None
+    assert cache.get((1, "advanced", 2)) is None
+    assert (cache.hits, cache.misses, len(cache)) == (1, 2, 2)
+
+
+def test_save_and_load(tmp_path):
+    """Le cache enregistré est rechargé à l'identique (ordre LRU compris)."""
+    path = str(tmp_path / "cache.bin")
+    cache = EvaluationCache()
+    for i, kind in enumerate(["simple", "advanced", "race"]):
+        cache.put((2 ** 63 + i, kind, 1 + i % 2), -15 + i)
+    cache.save(path)
+
+    loaded = EvaluationCache.load(path, max_entries=2)
+    assert len(loaded) == 2
+    assert loaded.get((2 ** 63 + 2, "race", 1)) == -13
+    assert EvaluationCache.load(str(tmp_path / "missing.bin")).hits == 0
+
+
+@pytest.mark.parametrize("size", [0, 5, 12 + 10])
+def test_load_rejects_truncated_file(tmp_path, size):
+    """Un fichier vide ou tronqué (en-tête ou entrées) est refusé par ValueError."""
+    path = tmp_path / "cache.bin"
+    cache = EvaluationCache()
+    cache.put((1, "advanced", 1), 10)
+    cache.put((2, "advanced", 1), 20)
+    cache.save(str(path))
+    path.write_bytes(path.read_bytes()[:size])
+    with pytest.raises(ValueError):
+        EvaluationCache.load(str(path))
+
+
+def test_shared_cache_replays_games():
+    """Des IA déterministes rejouant la même partie trouvent toutes leurs évaluations en cache."""
+    cache = EvaluationCache()
+    plain = play_game(QuoridorIA(1, 2, "advanced"), QuoridorIA(2, 2, "advanced"))
+    results = []
+    for _ in range(2):
+        # Nouvelles IA (tables de transposition vides), même cache
+        ias = (QuoridorIA(1, 2, "advanced", eval_cache=cache), QuoridorIA(2, 2, "advanced", eval_cache=cache))
+        results.append(play_game(*ias))
+        if len(results) == 1:
+            misses = cache.misses
+
+    assert plain["moves"] == results[0]["moves"] == results[1]["moves"]
+    assert plain["winner"] == results[0]["winner"] == results[1]["winner"]
+    assert cache.misses == misses
+    assert cache.hits >= misses
+
+
+def test_each_tournament_starts_with_its_own_cache(tmp_path):
+    """Un second tournoi du même processus recrée ses IA et charge son propre fichier de cache."""
+    first_path, second_path = str(tmp_path / "first.bin"), str(tmp_path / "second.bin")
+    tournois.run_tournament(1, 1, 1, eval_cache=True, eval_cache_path=first_path)
+    first_cache = tournois._get_eval_cache()
+    first_ias = dict(tournois._worker_ias)
+    tournois.run_tournament(1, 1, 1, eval_cache=True, eval_cache_path=second_path)
+    assert tournois._get_eval_cache() is not first_cache
+    assert all(ia is not first_ias.get(key) for key, ia in tournois._worker_ias.items())
+    assert len(EvaluationCache.load(second_path)) == len(first_cache)
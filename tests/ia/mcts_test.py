@@ -0,0 +1,74 @@
+import random
+from src.engine.bitboard import BitboardQuoridorBoard
+from src.ia.mcts import MCTSIA, rollout
+
+
+def test_rollout_leaves_board_unchanged():
+    """La partie simulée est jouée puis annulée sur le même plateau."""
+    board = BitboardQuoridorBoard()
+    before = (dict(board.positions), set(board.walls), dict(board.walls_count), board.zobrist)
+    winners = {rollout(board, random.Random(seed)) for seed in range(5)}
+    assert winners <= {1, 2}
+    assert (dict(board.positions), set(board.walls), dict(board.walls_count), board.zobrist) == before
+
+
+def test_rollout_stops_when_pawn_is_stuck():
+    """Un pion sans déplacement légal termine la simulation par la course, sans lever d'erreur."""
+    board = BitboardQuoridorBoard()
+    board.positions[1] = (0, 0)
+    board.positions[2] = (0, 1)
+    board.walls.add((0, 0, 'V'))
+    board.walls.add((0, 1, 'H'))
+    board.rebuild_caches()
+    assert board.get_legal_pawn_moves(1) == []
+    assert rollout(board, random.Random(0), wall_rate=0.0) in (1, 2)
+    assert board.positions[1] == (0, 0) and len(board.walls) == 2
+
+
+def test_finds_winning_move():
+    """Un pas de la ligne d'arrivée : le coup gagnant est le plus visité."""
+    board = BitboardQuoridorBoard()
+    board.positions[1] = (2, 7)
+    board.positions[2] = (6, 1)
+    board.rebuild_caches()
+    assert MCTSIA(1, iterations=300, seed=0).get_best_move(board) == ("MOVE", (2, 8))
+
+
+def test_tree_is_reused_between_moves():
+    """Après notre coup et la réponse adverse, la recherche repart du sous-arbre existant."""
+    board = BitboardQuoridorBoard()
+    ia = MCTSIA(1, iterations=200, seed=1)
+    board.apply_move(ia.get_best_move(board), 1)
+    board.apply_move(("MOVE", (4, 7)), 2)
+    ia.get_best_move(board)
+    assert ia._root.visits > 200
+
+
+def test_stop_between_searches_is_ignored():
+    """Un arrêt demandé hors recherche est effacé quand la recherche suivante est armée."""
+    ia = MCTSIA(1, iterations=20, seed=0)
+    ia.stop()
+    ia.clear_stop()
+    ia.get_best_move(BitboardQuoridorBoard())
+    assert ia.nodes == 20
+
+
+def test_stop_before_search_is_kept():
+    """Un arrêt demandé après l'armement mais avant la boucle de simulation n'est pas perdu."""
+    ia = MCTSIA(1, iterations=20, seed=0)
+    ia.clear_stop()
+    ia.stop()
+    assert ia.get_best_move(BitboardQuoridorBoard()) is not None
+    assert ia.nodes == 0
+
+
+def test_batched_rollouts_in_processes():
+    """Les simulations peuvent être réparties par lots sur des processus."""
+    board = BitboardQuoridorBoard()
+    ia = MCTSIA(1, iterations=16, workers=2, batch_size=8, seed=2)
+    try:
+        move = ia.get_best_move(board)
+    finally:
+        ia.close()
+    assert board.apply_move(move, 1) is not None
+    assert ia._root.visits == 16
@@ -0,0 +1,156 @@
+import random
+import threading
+import pytest
+from src.engine.bitboard import BitboardQuoridorBoard
+from src.ia.eval_cache import EvaluationCache
+from src.ia.evaluations import evaluate_board
+from src.ia.minimax import QuoridorIA, SearchTimeout
+from src.ia.moves_optimization import get_optimized_moves
+
+
+def _minimax(board, ia, depth, player):
+    """Minimax de référence, sans élagage ni table de transposition."""
+    if depth == 0 or board.winner is not None:
+        return evaluate_board(board, ia.player_id, ia.strategy)
+    scores = []
+    for move in get_optimized_moves(board, player):
+        token = board.apply_move(move, player)
+        if token is None:
+            continue
+        scores.append(_minimax(board, ia, depth - 1, 3 - player))
+        board.undo_move(token)
+    return max(scores) if player == ia.player_id else min(scores)
+
+
+def _random_position(seed, n_moves=8):
+    """Crée une position de milieu de partie reproductible."""
+    rng = random.Random(seed)
+    board = BitboardQuoridorBoard()
+    for _ in range(n_moves):
+        player = board.turn
+        if rng.random() < 0.5 and board.apply_move(
+                ("WALL", (rng.randrange(8), rng.randrange(8), rng.choice('HV')))) is not None:
+            continue
+        board.apply_move(("MOVE", rng.choice(board.get_legal_pawn_moves(player))))
+    return board
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_best_move_matches_plain_minimax(seed):
+    """L'alpha-bêta avec table de transposition choisit un coup de valeur minimax optimale."""
+    board = _random_position(seed)
+    ia = QuoridorIA(board.turn, depth=2, strategy="advanced")
+    best = ia.get_best_move(board)
+
+    values = {}
+    for move in get_optimized_moves(board, ia.player_id):
+        token = board.apply_move(move, ia.player_id)
+        if token is not None:
+            values[move] = _minimax(board, ia, 1, 3 - ia.player_id)
+            board.undo_move(token)
+    assert values[best] == max(values.values())
+
+
+def test_search_leaves_board_unchanged():
+    """La recherche joue et annule les coups sans altérer le plateau."""
+    board = _random_position(5)
+    before = (dict(board.positions), set(board.walls), dict(board.walls_count), board.zobrist)
+    QuoridorIA(board.turn, depth=2, strategy="advanced").get_best_move(board)
+    assert (dict(board.positions), set(board.walls), dict(board.walls_count), board.zobrist) == before
+
+
+@pytest.mark.parametrize("options", [{"pvs": True},
+                                     {"pvs": True, "aspiration_window": 10, "time_limit_ms": 60_000}])
+def test_pvs_and_aspiration_keep_minimax_value(options):
+    """Fenêtres nulles et fenêtres d'aspiration ne changent pas la valeur de la racine."""
+    for seed in (1, 6):
+        board = _random_position(seed)
+        ia = QuoridorIA(board.turn, depth=2, strategy="advanced", **options)
+        best = ia.get_best_move(board)
+        token = board.apply_move(best, ia.player_id)
+        value = _minimax(board, ia, 1, 3 - ia.player_id)
+        board.undo_move(token)
+        assert value == ia.tt.probe(board.zobrist).score == _minimax(board, ia, 2, ia.player_id)
+
+
+def test_iterative_deepening_respects_time_budget():
+    """Avec un budget de temps, la recherche s'arrête et renvoie le coup de la dernière itération terminée."""
+    import time
+    board = _random_position(9)
+    before = board.zobrist
+    ia = QuoridorIA(board.turn, depth=50, strategy="advanced", time_limit_ms=200)
+    start = time.perf_counter()
+    move = ia.get_best_move(board)
+    elapsed = time.perf_counter() - start
+
+    assert move in get_optimized_moves(board, ia.player_id)
+    assert 1 <= ia.completed_depth < 50
+    assert elapsed < 1.0
+    assert board.zobrist == before == board.compute_hash()
+
+
+def test_stop_between_searches_is_ignored():
+    """Un arrêt demandé hors recherche est effacé quand la recherche suivante est armée."""
+    board = _random_position(1)
+    ia = QuoridorIA(board.turn, depth=2, strategy="advanced")
+    ia.stop()
+    ia.clear_stop()
+    ia.get_best_move(board)
+    assert ia.completed_depth == 2
+
+
+def test_parallel_root_search_matches_sequential():
+    """La recherche racine répartie sur plusieurs processus choisit le même coup."""
+    board = _random_position(4, n_moves=10)
+    sequential = QuoridorIA(board.turn, depth=2, strategy="advanced")
+    parallel = QuoridorIA(board.turn, depth=2, strategy="advanced", workers=2)
+    try:
+        assert parallel.get_best_move(board) == sequential.get_best_move(board)
+    finally:
+        parallel.close()
+
+
+def test_parallel_workers_use_caller_settings():
+    """Les processus de calcul cherchent avec les réglages de l'IA appelante."""
+    board = _random_position(3, n_moves=10)
+    settings = dict(depth=3, strategy="advanced", pvs=True, move_ordering=False)
+    sequential = QuoridorIA(board.turn, **settings)
+    parallel = QuoridorIA(board.turn, workers=2, eval_cache=EvaluationCache(1 << 12), **settings)
+    try:
+        assert parallel.get_best_move(board) == sequential.get_best_move(board)
+        assert parallel.tt.probe(board.zobrist).score == sequential.tt.probe(board.zobrist).score
+    finally:
+        parallel.close()
+
+
+def test_parallel_search_after_stop_matches_sequential():
+    """Les tâches d'une recherche arrêtée ne faussent pas les bornes de la suivante."""
+    board = _random_position(4, n_moves=10)
+    parallel = QuoridorIA(board.turn, depth=4, strategy="advanced", workers=2)
+    try:
+        timer = threading.Timer(0.3, parallel.stop)
+        timer.start()
+        parallel.get_best_move(board)
+        timer.join()
+        other = _random_position(2, n_moves=10)
+        parallel.player_id = other.turn
+        parallel.depth = 2
+        expected = QuoridorIA(other.turn, depth=2, strategy="advanced").get_best_move(other)
+        assert parallel.get_best_move(other) == expected
+    finally:
+        parallel.close()
+
+
+def test_parallel_stop_during_first_iteration_keeps_a_move():
+    """Arrêtée pendant la profondeur 1, la recherche parallèle garde le coup du fils aîné."""
+    board = BitboardQuoridorBoard()
+    ia = QuoridorIA(1, depth=3, strategy="advanced", time_limit_ms=5000, workers=2)
+    try:
+        moves = ia._order_moves(board, ia._generate_moves(board, 1), 1, 1, None)
+        ia.stop()
+        with pytest.raises(SearchTimeout):
+            ia._parallel.search(ia, board, moves, 1)
+        assert ia._root_best_move == moves[0]
+        assert ia._iterative_deepening(board) == moves[0]
+    finally:
+        ia.close()
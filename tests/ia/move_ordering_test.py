@@ -0,0 +1,70 @@
+from src.engine.board import QuoridorBoard
+from src.ia.minimax import QuoridorIA
+from src.ia.move_ordering import MoveOrderer, path_cutting_walls
+from src.ia.moves_optimization import get_optimized_moves, BOX_WINDOW
+from tests.ia.minimax_test import _random_position
+
+
+def test_path_cutting_walls():
+    """Un pas vertical est coupé par deux murs 'H', un pas horizontal par deux murs 'V'."""
+    assert path_cutting_walls([(4, 0), (4, 1)]) == {(4, 0, 'H'), (3, 0, 'H')}
+    assert path_cutting_walls([(2, 3), (3, 3)]) == {(2, 3, 'V'), (2, 2, 'V')}
+
+
+def test_order_puts_path_moves_first():
+    """Le déplacement vers l'arrivée passe en tête, puis les murs qui rallongent l'adversaire."""
+    board = QuoridorBoard()
+    moves = get_optimized_moves(board, 1)
+    ordered = MoveOrderer().order(board, moves, 1, ply=0, depth=3)
+    assert sorted(ordered) == sorted(moves)
+    assert ordered[0] == ("MOVE", (4, 1))
+    # Le mur juste devant le pion adverse allonge son chemin
+    first_wall = next(move for move in ordered if move[0] == "WALL")
+    token = board.apply_move(first_wall, 1)
+    assert board.shortest_path_len(2) > 8
+    board.undo_move(token)
+
+
+def test_killers_and_history():
+    """Un coup ayant provoqué une coupure remonte au même niveau de l'arbre."""
+    board = QuoridorBoard()
+    orderer = MoveOrderer()
+    wall = ("WALL", (2, 4, 'V'))
+    orderer.record_cutoff(wall, ply=2, depth=3)
+    assert orderer.history[wall] == 9
+    ordered = orderer.order(board, get_optimized_moves(board, 1, window=BOX_WINDOW), 1, ply=2, depth=1)
+    assert ordered.index(wall) < ordered.index(("WALL", (2, 3, 'V')))
+    orderer.new_search()
+    assert orderer.killers == [] and orderer.history[wall] == 4
+
+
+def test_ordering_reduces_nodes():
+    """Même valeur de recherche, moins de nœuds visités."""
+    plain = ordered = 0
+    for seed in (1, 2, 3):
+        board = _random_position(seed)
+        ia_plain = QuoridorIA(board.turn, depth=3, strategy="advanced", move_ordering=False)
+        ia_ordered = QuoridorIA(board.turn, depth=3, strategy="advanced")
+        ia_plain.get_best_move(board)
+        ia_ordered.get_best_move(board)
+        assert ia_plain.tt.probe(board.zobrist).score == ia_ordered.tt.probe(board.zobrist).score
+        plain += ia_plain.nodes
+        ordered += ia_ordered.nodes
+    assert ordered < plain
+
+
+def test_staged_generation_is_lazy():
+    """Les murs ne sont générés que si la recherche dépasse les déplacements ; même ordre que order()."""
+    board = QuoridorBoard()
+    calls = []
+
+    def walls():
+        calls.append(1)
+        return [data for kind, data in get_optimized_moves(board, 1) if kind == "WALL"]
+
+    orderer = MoveOrderer()
+    stream = orderer.staged(board, 1, 0, 3, None, lambda: board.get_legal_pawn_moves(1), walls)
+    assert next(stream) == ("MOVE", (4, 1))
+    assert calls == []
+    assert list(stream) == orderer.order(board, get_optimized_moves(board, 1), 1, ply=0, depth=3)[1:]
+    assert calls == [1]
@@ -0,0 +1,41 @@
+import pytest
+from src.engine.board import QuoridorBoard
+from src.ia.minimax import QuoridorIA
+from src.ia.moves_optimization import candidate_walls, wall_window, BOX_WINDOW, PATH_WINDOW
+from tests.ia.minimax_test import _random_position
+
+
+def test_path_window_reaches_walls_far_ahead():
+    """Les murs coupant le chemin adverse loin des pions sont candidats, pas ceux d'un coin isolé."""
+    board = QuoridorBoard()
+    board.positions[1] = (0, 7)
+    board.positions[2] = (8, 8)
+    board.rebuild_caches()
+    walls = candidate_walls(board, 1, PATH_WINDOW)
+    assert (7, 1, 'H') in walls and (7, 1, 'H') not in candidate_walls(board, 1, BOX_WINDOW)
+    assert (3, 3, 'H') not in walls
+    assert len(walls) < len(candidate_walls(board, 1, BOX_WINDOW))
+
+
+def test_path_window_width_and_placed_walls():
+    """La fenêtre s'élargit avec width et suit les murs déjà posés."""
+    board = QuoridorBoard()
+    assert len(wall_window(board, PATH_WINDOW, 1)) < len(wall_window(board, PATH_WINDOW, 2))
+    assert board.apply_move(("WALL", (1, 4, 'H')), 1) is not None
+    walls = candidate_walls(board, 1)
+    # Prolongement et murs perpendiculaires aux extrémités, loin des deux chemins
+    assert {(3, 4, 'H'), (0, 3, 'V'), (2, 5, 'V')} <= set(walls)
+
+
+def test_search_reports_candidate_set():
+    """Les statistiques indiquent l'ensemble de murs candidats utilisé."""
+    board = _random_position(2)
+    path = QuoridorIA(board.turn, depth=2, strategy="advanced", stats=True)
+    box = QuoridorIA(board.turn, depth=2, strategy="advanced", stats=True, wall_window=BOX_WINDOW)
+    path.get_best_move(board)
+    box.get_best_move(board)
+    assert list(path.stats.wall_sets) == ["path:1"] and list(box.stats.wall_sets) == ["box:2"]
+    assert path.stats.as_dict()["wall_sets"].startswith("path:1=")
+    assert path.stats.walls_per_generation > 0 and box.stats.walls_per_generation > 0
+    with pytest.raises(ValueError):
+        QuoridorIA(1, depth=2, strategy="advanced", wall_window="path", window_width=0)
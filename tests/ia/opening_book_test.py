@@ -0,0 +1,53 @@
+import pytest
+from src.engine.board import QuoridorBoard
+from src.ia.minimax import QuoridorIA
+from src.ia.opening_book import OpeningBook, build_opening_book, decode_move, encode_move
+
+
+@pytest.mark.parametrize("move", [("MOVE", (0, 0)), ("MOVE", (8, 8)), ("WALL", (7, 7, 'V')), ("WALL", (0, 3, 'H'))])
+def test_move_encoding_roundtrip(move):
+    assert decode_move(encode_move(move)) == move
+
+
+def test_save_and_load(tmp_path):
+    """Le format binaire conserve les entrées (10 octets par position)."""
+    book = build_opening_book(depth=1, plies=3)
+    path = tmp_path / "book.bin"
+    book.save(str(path))
+    loaded = OpeningBook.load(str(path))
+    assert loaded.entries == book.entries
+    assert (loaded.depth, loaded.strategy) == (1, "advanced")
+    assert path.stat().st_size == 12 + 10 * len(book)
+    assert OpeningBook.load(str(tmp_path / "absent.bin")) is None
+
+
+@pytest.mark.parametrize("size", [0, 7, 12 + 5])
+def test_load_rejects_truncated_file(tmp_path, size):
+    """Un fichier vide ou tronqué (en-tête ou entrées) est refusé par ValueError."""
+    path = tmp_path / "book.bin"
+    build_opening_book(depth=1, plies=1).save(str(path))
+    path.write_bytes(path.read_bytes()[:size])
+    with pytest.raises(ValueError):
+        OpeningBook.load(str(path))
+
+
+def test_shipped_book_matches_current_engine():
+    """Le livre fourni est à jour : le moteur actuel rejoue les mêmes coups sur ses premières positions."""
+    shipped = OpeningBook.load()
+    assert shipped is not None
+    rebuilt = build_opening_book(depth=shipped.depth, plies=2, strategy=shipped.strategy)
+    assert rebuilt.entries and all(shipped.entries.get(key) == move for key, move in rebuilt.entries.items())
+
+
+def test_ia_plays_book_move_without_searching():
+    """Une position du livre est jouée directement, sans nœud visité."""
+    board = QuoridorBoard()
+    book = OpeningBook(4, "advanced", {board.zobrist: ("MOVE", (4, 1))})
+    ia = QuoridorIA(1, depth=3, strategy="advanced", opening_book=book)
+    assert ia.get_best_move(board) == ("MOVE", (4, 1))
+    assert ia.nodes == 0
+
+    # Coup illégal (collision de hash) ou stratégie différente : recherche normale
+    book.entries[board.zobrist] = ("MOVE", (0, 8))
+    assert ia.get_best_move(board) != ("MOVE", (0, 8)) and ia.nodes > 0
+    assert QuoridorIA(1, depth=1, strategy="simple", opening_book=book).opening_book is None
@@ -0,0 +1,47 @@
+from src.ia.minimax import QuoridorIA
+from src.ia.stats import STATS_FIELDS
+from src.tournois import play_game
+from tests.ia.minimax_test import _random_position
+
+
+def test_stats_do_not_change_search():
+    """L'instrumentation compte la recherche sans modifier le coup choisi."""
+    board = _random_position(4)
+    expected = QuoridorIA(board.turn, depth=3, strategy="advanced").get_best_move(board)
+    ia = QuoridorIA(board.turn, depth=3, strategy="advanced", stats=True)
+    assert ia.get_best_move(board) == expected
+
+    stats = ia.stats
+    assert stats.nodes == ia.nodes > stats.leaf_evals > 0
+    assert stats.total_cutoffs > 0 and 0 <= stats.first_move_cutoff_rate <= 1
+    assert stats.effective_branching_factor > 1
+    assert stats.bfs_calls > 0
+    assert 0 < stats.movegen_time + stats.eval_time + stats.make_unmake_time <= stats.total_time
+
+
+def test_movegen_time_covers_staged_generation(monkeypatch):
+    """Le tri des murs de la génération par étapes compte dans movegen_time."""
+    import time
+    from src.ia import move_ordering
+    cutting_walls = move_ordering.path_cutting_walls
+    calls = []
+
+    def slow_cutting_walls(path):
+        calls.append(path)
+        time.sleep(0.001)
+        return cutting_walls(path)
+
+    monkeypatch.setattr(move_ordering, "path_cutting_walls", slow_cutting_walls)
+    board = _random_position(4)
+    ia = QuoridorIA(board.turn, depth=3, strategy="advanced", stats=True)
+    ia.get_best_move(board)
+    assert calls and ia.stats.movegen_time >= 0.001 * len(calls)
+
+
+def test_play_game_reports_stats_per_player():
+    """Les statistiques cumulées de chaque IA sont ajoutées au résultat de la partie."""
+    result = play_game(QuoridorIA(1, depth=1, strategy="advanced", stats=True),
+                       QuoridorIA(2, depth=1, strategy="advanced"), opening_moves=2, seed=0)
+    assert all(f"p1_{field}" in result for field in STATS_FIELDS)
+    assert not any(key.startswith("p2_nodes") for key in result)
+    assert result["p1_nodes"] > 0
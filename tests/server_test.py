@@ -0,0 +1,103 @@
+import io
+import pytest
+from src.engine.notation import move_to_text, text_to_move
+from src.server import EngineServer
+
+
+def _run(commands):
+    """Envoie les commandes au moteur et renvoie ses réponses, ligne par ligne."""
+    output = io.StringIO()
+    EngineServer(io.StringIO("\n".join(commands) + "\n"), output).run()
+    return output.getvalue().splitlines()
+
+
+@pytest.mark.parametrize("text, move", [("e2", ("MOVE", (4, 1))), ("a9", ("MOVE", (0, 8))),
+                                        ("e3h", ("WALL", (4, 2, 'H'))), ("h8v", ("WALL", (7, 7, 'V')))])
+def test_notation_roundtrip(text, move):
+    assert text_to_move(text) == move
+    assert move_to_text(move) == text
+
+
+@pytest.mark.parametrize("text", ["j1", "e0", "i3h", "e3x", ""])
+def test_notation_rejects_invalid_moves(text):
+    with pytest.raises(ValueError):
+        text_to_move(text)
+
+
+def test_handshake_and_search():
+    """Le moteur se présente puis répond à go par ses statistiques et un coup légal."""
+    lines = _run(["uci", "isready", "setoption name OwnBook value false",
+                  "position startpos moves e2 e8 e3 e7", "go depth 2", "isready"])
+    assert lines[0].startswith("id name") and "uciok" in lines and "readyok" in lines
+    info = next(line for line in lines if line.startswith("info depth"))
+    assert "depth 2" in info and "nodes" in info and "pv" in info
+    bestmove = next(line for line in lines if line.startswith("bestmove")).split()[1]
+    text_to_move(bestmove)
+
+
+def test_position_reuses_previous_moves():
+    """Une position qui prolonge la précédente ne rejoue que les nouveaux coups ; un coup illégal est signalé."""
+    output = io.StringIO()
+    server = EngineServer(io.StringIO(), output)
+    server.handle("position startpos moves e2 e8")
+    board = server.board
+    server.handle("position startpos moves e2 e8 e3 e4h")
+    assert server.board is board and board.positions[1] == (4, 2) and (4, 3, 'H') in board.walls
+    server.handle("position startpos moves e2 e9")
+    assert "coup illégal : e9" in output.getvalue()
+    assert server.board.positions == {1: (4, 1), 2: (4, 8)}
+
+
+def test_stop_returns_a_move():
+    """stop interrompt une recherche longue : le moteur répond quand même par un coup."""
+    lines = _run(["setoption name OwnBook value false", "position startpos moves e2 e8 e3 e7",
+                  "go depth 8", "stop", "quit"])
+    assert lines[-1].startswith("bestmove ") and lines[-1] != "bestmove none"
+
+
+def test_stop_after_bestmove_is_ignored():
+    """Un stop reçu après bestmove n'écourte pas la recherche suivante."""
+    output = io.StringIO()
+    server = EngineServer(io.StringIO(), output)
+    for line in ["setoption name OwnBook value false", "go depth 2"]:
+        server.handle(line)
+    server._thread.join()
+    for line in ["stop", "position startpos", "go depth 2"]:
+        server.handle(line)
+    server._wait()
+    infos = [line for line in output.getvalue().splitlines() if line.startswith("info depth")]
+    assert len(infos) == 2 and all(line.startswith("info depth 2 ") for line in infos)
+
+
+def test_stop_right_after_go_is_kept(monkeypatch):
+    """Un stop reçu avant que le thread n'entre dans la recherche l'interrompt bien."""
+    import time
+    from src.engine.board import QuoridorBoard
+    rebuild = QuoridorBoard.rebuild_caches
+
+    def slow_rebuild(board):
+        time.sleep(0.05)
+        rebuild(board)
+
+    output = io.StringIO()
+    server = EngineServer(io.StringIO(), output)
+    server.handle("setoption name OwnBook value false")
+    monkeypatch.setattr(QuoridorBoard, "rebuild_caches", slow_rebuild)
+    server.handle("go depth 3")
+    time.sleep(0.01)
+    server.handle("stop")
+    server._wait()
+    lines = output.getvalue().splitlines()
+    assert lines[-1].startswith("bestmove ") and lines[-1] != "bestmove none"
+    assert not any(line.startswith("info depth 3 ") for line in lines)
+
+
+def test_go_clears_a_previous_stop():
+    """Un arrêt resté en attente d'une recherche précédente est effacé par go."""
+    output = io.StringIO()
+    server = EngineServer(io.StringIO(), output)
+    server.handle("setoption name OwnBook value false")
+    server._get_ia(1).stop()
+    server.handle("go depth 2")
+    server._wait()
+    assert any(line.startswith("info depth 2 ") for line in output.getvalue().splitlines())
@@ -0,0 +1,66 @@
+import time
+from src.engine.board import QuoridorBoard
+from src.ia.minimax import QuoridorIA
+from src.ui.ai_worker import AIWorker
+
+
+def _wait(worker, timeout=30.0):
+    end = time.time() + timeout
+    while worker.is_running() and time.time() < end:
+        time.sleep(0.01)
+
+
+def test_worker_searches_on_a_copy():
+    """Le plateau affiché n'est jamais modifié par la réflexion de l'IA."""
+    board = QuoridorBoard()
+    board.turn = 2
+    worker = AIWorker(QuoridorIA(2, depth=2, strategy="advanced"))
+    worker.start(board)
+    assert worker.is_running() or worker.is_done()
+    _wait(worker)
+    move = worker.result()
+    assert move is not None
+    assert board.positions == {1: (4, 0), 2: (4, 8)} and not board.walls
+
+
+def test_force_move_returns_a_legal_move():
+    """Forcer le coup interrompt une recherche longue et donne un coup jouable."""
+    board = QuoridorBoard()
+    worker = AIWorker(QuoridorIA(2, depth=6, strategy="advanced"))
+    worker.start(board)
+    time.sleep(0.2)
+    worker.force_move()
+    _wait(worker, timeout=5.0)
+    assert worker.is_done()
+    move = worker.result()
+    assert move is not None and board.copy().apply_move(move, 2) is not None
+    depth, nodes = worker.progress()
+    assert depth == 6 and nodes > 0
+
+
+def test_cancel_discards_result():
+    """Une recherche annulée ne renvoie aucun coup."""
+    worker = AIWorker(QuoridorIA(2, depth=6, strategy="advanced", time_limit_ms=60_000))
+    worker.start(QuoridorBoard())
+    time.sleep(0.1)
+    worker.cancel()
+    _wait(worker, timeout=5.0)
+    assert worker.result() is None
+
+
+def test_stop_right_after_start_is_kept(monkeypatch):
+    """Un arrêt demandé avant que le thread n'entre dans la recherche n'est pas effacé."""
+    rebuild = QuoridorBoard.rebuild_caches
+
+    def slow_rebuild(board):
+        time.sleep(0.05)
+        rebuild(board)
+
+    monkeypatch.setattr(QuoridorBoard, "rebuild_caches", slow_rebuild)
+    worker = AIWorker(QuoridorIA(2, depth=3, strategy="advanced"))
+    worker.start(QuoridorBoard())
+    time.sleep(0.01)
+    worker.force_move()
+    _wait(worker, timeout=5.0)
+    assert worker.result() is not None
+    assert worker.ia.completed_depth < 3